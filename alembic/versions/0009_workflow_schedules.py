@@ -0,0 +1,62 @@
+"""workflow schedules and scheduler lease
+
+Revision ID: 0009_workflow_schedules
+Revises: 0008_client_web_social_fields
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009_workflow_schedules"
+down_revision = "0008_client_web_social_fields"
+branch_labels = None
+depends_on = None
+
+
+def _idx(table: str, col: str) -> None:
+    op.create_index(op.f(f"ix_{table}_{col}"), table, [col], unique=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workflow_schedules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("workflow_id", sa.Integer(), nullable=False),
+        sa.Column("cron_expr", sa.String(length=120), nullable=False),
+        sa.Column("timezone", sa.String(length=64), nullable=False, server_default="UTC"),
+        sa.Column("catchup_policy", sa.String(length=16), nullable=False, server_default="skip"),
+        sa.Column("jitter_seconds", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("allow_overlap", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("enabled", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("next_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_run_id", sa.Integer(), nullable=True),
+        sa.Column("created_by_user_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflow_templates.id"]),
+        sa.ForeignKeyConstraint(["last_run_id"], ["workflow_runs.id"]),
+        sa.ForeignKeyConstraint(["created_by_user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    for c in ["tenant_id", "workflow_id", "enabled", "next_run_at", "created_by_user_id"]:
+        _idx("workflow_schedules", c)
+
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=60), nullable=False),
+        sa.Column("holder", sa.String(length=120), nullable=False, server_default=""),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_scheduler_leases_name"), "scheduler_leases", ["name"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_leases")
+    op.drop_table("workflow_schedules")
@@ -0,0 +1,113 @@
+"""history retention policies and monthly partitions for events/audit/run logs
+
+Revision ID: 0010_history_retention
+Revises: 0009_workflow_schedules
+Create Date: 2026-10-19
+"""
+
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010_history_retention"
+down_revision = "0009_workflow_schedules"
+branch_labels = None
+depends_on = None
+
+PARTITIONED_TABLES = {
+    "events": {
+        "fks": [("tenant_id", "tenants")],
+        "indexes": ["tenant_id", "type", "entity_type", "entity_id", "severity", "created_at"],
+    },
+    "audit_log": {
+        "fks": [("tenant_id", "tenants"), ("actor_user_id", "users")],
+        "indexes": ["tenant_id", "actor_user_id", "entity_type", "entity_id", "action", "created_at"],
+    },
+    "run_logs": {
+        "fks": [("tenant_id", "tenants"), ("run_id", "workflow_runs")],
+        "indexes": ["tenant_id", "run_id"],
+    },
+}
+MONTHS_AHEAD = 3
+
+
+def _idx(table: str, col: str) -> None:
+    op.create_index(op.f(f"ix_{table}_{col}"), table, [col], unique=False)
+
+
+def _add_month(value: date) -> date:
+    return date(value.year + (value.month // 12), value.month % 12 + 1, 1)
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    spec = PARTITIONED_TABLES[table]
+    bind = op.get_bind()
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} DROP CONSTRAINT {table}_pkey")
+    if partitioned:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+    for col, ref in spec["fks"]:
+        op.execute(f"ALTER TABLE {table} ADD FOREIGN KEY ({col}) REFERENCES {ref} (id)")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    if partitioned:
+        first = bind.execute(sa.text(f"SELECT min(created_at) FROM {old}")).scalar() or datetime.utcnow()
+        month = date(first.year, first.month, 1)
+        today = date.today()
+        horizon = date(today.year, today.month, 1)
+        for _ in range(MONTHS_AHEAD):
+            horizon = _add_month(horizon)
+        while month <= horizon:
+            upper = _add_month(month)
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            month = upper
+        op.execute(f"CREATE TABLE {table}_pdefault PARTITION OF {table} DEFAULT")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    for col in spec["indexes"]:
+        _idx(table, col)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retention_policies",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sa.String(length=40), nullable=False),
+        sa.Column("retain_days", sa.Integer(), nullable=False, server_default="180"),
+        sa.Column("archive", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tenant_id", "table_name", name="uq_retention_tenant_table"),
+    )
+    _idx("retention_policies", "tenant_id")
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table in PARTITIONED_TABLES:
+            _rebuild(table, partitioned=True)
+
+    for table in PARTITIONED_TABLES:
+        op.create_index(f"ix_{table}_tenant_created", table, ["tenant_id", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        op.drop_index(f"ix_{table}_tenant_created", table_name=table)
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table in PARTITIONED_TABLES:
+            _rebuild(table, partitioned=False)
+
+    op.drop_table("retention_policies")
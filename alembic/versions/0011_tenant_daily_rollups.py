@@ -0,0 +1,45 @@
+"""tenant daily report rollups
+
+Revision ID: 0011_tenant_daily_rollups
+Revises: 0010_history_retention
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011_tenant_daily_rollups"
+down_revision = "0010_history_retention"
+branch_labels = None
+depends_on = None
+
+
+def _idx(table: str, col: str) -> None:
+    op.create_index(op.f(f"ix_{table}_{col}"), table, [col], unique=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_daily_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("mrr_total_cents", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("pipeline_14d_cents", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("blocked_items", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wins", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("top_risks_json", sa.String(), nullable=False, server_default="[]"),
+        sa.Column("dirty", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tenant_id", "day", name="uq_rollup_tenant_day"),
+    )
+    _idx("tenant_daily_rollups", "tenant_id")
+    _idx("tenant_daily_rollups", "day")
+    _idx("tenant_daily_rollups", "dirty")
+
+
+def downgrade() -> None:
+    op.drop_table("tenant_daily_rollups")
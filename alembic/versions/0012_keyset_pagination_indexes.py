@@ -0,0 +1,31 @@
+"""composite indexes for keyset pagination
+
+Revision ID: 0012_keyset_pagination_indexes
+Revises: 0011_tenant_daily_rollups
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = "0012_keyset_pagination_indexes"
+down_revision = "0011_tenant_daily_rollups"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_tasks_tenant_created", "tasks", ["tenant_id", "created_at"]),
+    ("ix_deals_tenant_created", "deals", ["tenant_id", "created_at"]),
+    ("ix_notes_tenant_updated", "notes", ["tenant_id", "updated_at"]),
+    ("ix_clients_tenant_created", "clients", ["tenant_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, cols in INDEXES:
+        op.create_index(name, table, cols, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,27 @@
+"""task archive column and per-lane board index
+
+Revision ID: 0013_task_board_archive
+Revises: 0012_keyset_pagination_indexes
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0013_task_board_archive"
+down_revision = "0012_keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("archived_at", sa.DateTime(), nullable=True))
+    op.create_index(op.f("ix_tasks_archived_at"), "tasks", ["archived_at"], unique=False)
+    op.create_index("ix_tasks_tenant_status_created", "tasks", ["tenant_id", "status", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_tenant_status_created", table_name="tasks")
+    op.drop_index(op.f("ix_tasks_archived_at"), table_name="tasks")
+    op.drop_column("tasks", "archived_at")
@@ -0,0 +1,108 @@
+"""normalized marketing keywords and per-tenant keyword dedup index
+
+Revision ID: 0014_keyword_dedup_index
+Revises: 0013_task_board_archive
+Create Date: 2026-10-19
+"""
+
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0014_keyword_dedup_index"
+down_revision = "0013_task_board_archive"
+branch_labels = None
+depends_on = None
+
+BATCH = 1000
+
+# Frozen copy of app.services.keywords.normalize_keyword as of this revision, so later changes
+# to the live normalizer cannot alter what this migration backfills.
+KEYWORD_MAX_LENGTH = 160
+_NON_WORD = re.compile(r"[^\w]+")
+_STEM_EXCEPTIONS = frozenset({"news", "series", "species", "business", "glass", "gas", "bus", "yes", "this", "ads", "sms", "seo"})
+
+
+def _stem(token: str) -> str:
+    if len(token) <= 3 or token in _STEM_EXCEPTIONS or token.isdigit():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith(("sses", "shes", "ches", "xes", "zes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def normalize_keyword(text: str) -> str:
+    folded = unicodedata.normalize("NFKC", text or "").casefold().replace("'", "")
+    tokens = [_stem(t) for t in _NON_WORD.sub(" ", folded).replace("_", " ").split()]
+    return " ".join(tokens)[:KEYWORD_MAX_LENGTH]
+
+
+def _backfill_normalized() -> None:
+    bind = op.get_bind()
+    keywords = sa.table(
+        "marketing_keywords",
+        sa.column("id", sa.Integer),
+        sa.column("campaign_id", sa.Integer),
+        sa.column("keyword", sa.String),
+        sa.column("normalized", sa.String),
+    )
+    seen: set[tuple[int, str]] = set()
+    duplicates: list[int] = []
+    updates: list[dict] = []
+    for row in bind.execute(sa.select(keywords.c.id, keywords.c.campaign_id, keywords.c.keyword).order_by(keywords.c.id)):
+        key = normalize_keyword(row.keyword) or f"#{row.id}"
+        if (row.campaign_id, key) in seen:
+            duplicates.append(row.id)
+            continue
+        seen.add((row.campaign_id, key))
+        updates.append({"row_id": row.id, "key": key})
+    for start in range(0, len(updates), BATCH):
+        bind.execute(
+            keywords.update().where(keywords.c.id == sa.bindparam("row_id")).values(normalized=sa.bindparam("key")),
+            updates[start : start + BATCH],
+        )
+    for start in range(0, len(duplicates), BATCH):
+        bind.execute(keywords.delete().where(keywords.c.id.in_(duplicates[start : start + BATCH])))
+
+
+def upgrade() -> None:
+    op.add_column("marketing_keywords", sa.Column("normalized", sa.String(length=160), nullable=True))
+    _backfill_normalized()
+    with op.batch_alter_table("marketing_keywords") as batch:
+        batch.alter_column("normalized", existing_type=sa.String(length=160), nullable=False)
+        batch.create_unique_constraint("uq_marketing_keyword_campaign_normalized", ["campaign_id", "normalized"])
+    op.create_index(op.f("ix_marketing_keywords_normalized"), "marketing_keywords", ["normalized"], unique=False)
+
+    op.create_table(
+        "tenant_keywords",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("keyword", sa.String(length=160), nullable=False),
+        sa.Column("normalized", sa.String(length=160), nullable=False),
+        sa.Column("source", sa.String(length=24), nullable=False, server_default="expansion"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tenant_id", "normalized", name="uq_tenant_keyword_normalized"),
+    )
+    op.create_index(op.f("ix_tenant_keywords_tenant_id"), "tenant_keywords", ["tenant_id"], unique=False)
+    op.create_index(op.f("ix_tenant_keywords_created_at"), "tenant_keywords", ["created_at"], unique=False)
+    op.execute(
+        "INSERT INTO tenant_keywords (tenant_id, keyword, normalized, source, created_at) "
+        "SELECT tenant_id, MIN(keyword), normalized, 'campaign', MIN(created_at) FROM marketing_keywords GROUP BY tenant_id, normalized"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tenant_keywords")
+    op.drop_index(op.f("ix_marketing_keywords_normalized"), table_name="marketing_keywords")
+    with op.batch_alter_table("marketing_keywords") as batch:
+        batch.drop_constraint("uq_marketing_keyword_campaign_normalized", type_="unique")
+    op.drop_column("marketing_keywords", "normalized")
@@ -0,0 +1,53 @@
+"""MinHash signatures and LSH band table for keyword similarity
+
+Revision ID: 0015_keyword_similarity_index
+Revises: 0014_keyword_dedup_index
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0015_keyword_similarity_index"
+down_revision = "0014_keyword_dedup_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "keyword_signatures",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("keyword_id", sa.Integer(), nullable=False),
+        sa.Column("campaign_id", sa.Integer(), nullable=False),
+        sa.Column("signature", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.ForeignKeyConstraint(["keyword_id"], ["marketing_keywords.id"]),
+        sa.ForeignKeyConstraint(["campaign_id"], ["marketing_campaigns.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("keyword_id"),
+    )
+    op.create_index(op.f("ix_keyword_signatures_tenant_id"), "keyword_signatures", ["tenant_id"], unique=False)
+    op.create_index(op.f("ix_keyword_signatures_campaign_id"), "keyword_signatures", ["campaign_id"], unique=False)
+
+    op.create_table(
+        "keyword_lsh_bands",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("keyword_id", sa.Integer(), nullable=False),
+        sa.Column("band", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.ForeignKeyConstraint(["keyword_id"], ["marketing_keywords.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_keyword_lsh_bands_keyword_id"), "keyword_lsh_bands", ["keyword_id"], unique=False)
+    op.create_index("ix_keyword_lsh_lookup", "keyword_lsh_bands", ["tenant_id", "band", "bucket"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("keyword_lsh_bands")
+    op.drop_table("keyword_signatures")
@@ -0,0 +1,73 @@
+"""denormalized campaign summary columns for the marketing list
+
+Revision ID: 0016_campaign_summary_columns
+Revises: 0015_keyword_similarity_index
+Create Date: 2026-10-19
+"""
+
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0016_campaign_summary_columns"
+down_revision = "0015_keyword_similarity_index"
+branch_labels = None
+depends_on = None
+
+SUMMARY_COLUMNS = (
+    ("daily_budget_cents", sa.Integer(), "0"),
+    ("bid_strategy", sa.String(length=160), ""),
+    ("sub_option", sa.String(length=120), ""),
+    ("template_name", sa.String(length=120), ""),
+    ("keyword_count", sa.Integer(), "0"),
+)
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    campaigns = sa.table(
+        "marketing_campaigns",
+        sa.column("id", sa.Integer),
+        sa.column("plan_json", sa.String),
+        *(sa.column(name, type_) for name, type_, _ in SUMMARY_COLUMNS),
+    )
+    keywords = sa.table("marketing_keywords", sa.column("campaign_id", sa.Integer))
+    counts = dict(bind.execute(sa.select(keywords.c.campaign_id, sa.func.count()).group_by(keywords.c.campaign_id)).all())
+    updates = []
+    for row_id, plan_json in bind.execute(sa.select(campaigns.c.id, campaigns.c.plan_json)):
+        try:
+            plan = json.loads(plan_json or "{}")
+        except json.JSONDecodeError:
+            plan = {}
+        updates.append(
+            {
+                "row_id": row_id,
+                "daily_budget_cents": int(plan.get("daily_budget_cents") or 0),
+                "bid_strategy": str(plan.get("bid_strategy") or "")[:160],
+                "sub_option": str(plan.get("sub_option") or "")[:120],
+                "template_name": str(plan.get("template_name") or "")[:120],
+                "keyword_count": counts.get(row_id, 0),
+            }
+        )
+    if updates:
+        bind.execute(
+            campaigns.update()
+            .where(campaigns.c.id == sa.bindparam("row_id"))
+            .values({name: sa.bindparam(name) for name, _, _ in SUMMARY_COLUMNS}),
+            updates,
+        )
+
+
+def upgrade() -> None:
+    for name, type_, default in SUMMARY_COLUMNS:
+        op.add_column("marketing_campaigns", sa.Column(name, type_, nullable=False, server_default=default))
+    _backfill()
+    op.create_index("ix_marketing_campaigns_tenant_updated", "marketing_campaigns", ["tenant_id", "updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_marketing_campaigns_tenant_updated", table_name="marketing_campaigns")
+    for name, _, _ in reversed(SUMMARY_COLUMNS):
+        op.drop_column("marketing_campaigns", name)
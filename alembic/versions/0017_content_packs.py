@@ -0,0 +1,47 @@
+"""persisted SEO content packs per campaign keyword cluster
+
+Revision ID: 0017_content_packs
+Revises: 0016_campaign_summary_columns
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0017_content_packs"
+down_revision = "0016_campaign_summary_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "content_packs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("client_id", sa.Integer(), nullable=True),
+        sa.Column("campaign_id", sa.Integer(), nullable=False),
+        sa.Column("cluster_index", sa.Integer(), nullable=False),
+        sa.Column("cluster_name", sa.String(length=160), nullable=False),
+        sa.Column("objective", sa.String(length=60), nullable=False),
+        sa.Column("keywords_json", sa.String(), nullable=False),
+        sa.Column("cache_key", sa.String(length=40), nullable=False),
+        sa.Column("pack_json", sa.String(), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.ForeignKeyConstraint(["client_id"], ["clients.id"]),
+        sa.ForeignKeyConstraint(["campaign_id"], ["marketing_campaigns.id"]),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("campaign_id", "cluster_index", name="uq_content_pack_campaign_cluster"),
+    )
+    op.create_index(op.f("ix_content_packs_tenant_id"), "content_packs", ["tenant_id"], unique=False)
+    op.create_index(op.f("ix_content_packs_client_id"), "content_packs", ["client_id"], unique=False)
+    op.create_index(op.f("ix_content_packs_campaign_id"), "content_packs", ["campaign_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("content_packs")
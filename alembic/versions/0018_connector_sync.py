@@ -0,0 +1,52 @@
+"""connector sync cursors and normalized connector records
+
+Revision ID: 0018_connector_sync
+Revises: 0017_content_packs
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0018_connector_sync"
+down_revision = "0017_content_packs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("connector_instances", sa.Column("sync_cursor", sa.String(length=255), nullable=False, server_default=""))
+    op.add_column("connector_instances", sa.Column("last_synced_at", sa.DateTime(), nullable=True))
+    op.add_column("connector_runs", sa.Column("records_synced", sa.Integer(), nullable=False, server_default="0"))
+
+    op.create_table(
+        "connector_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("connector_instance_id", sa.Integer(), nullable=False),
+        sa.Column("record_type", sa.String(length=40), nullable=False),
+        sa.Column("external_id", sa.String(length=255), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("impressions", sa.BigInteger(), nullable=False),
+        sa.Column("clicks", sa.BigInteger(), nullable=False),
+        sa.Column("cost_cents", sa.BigInteger(), nullable=False),
+        sa.Column("conversions", sa.Integer(), nullable=False),
+        sa.Column("extra_json", sa.String(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.ForeignKeyConstraint(["connector_instance_id"], ["connector_instances.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("connector_instance_id", "record_type", "external_id", name="uq_connector_record_external"),
+    )
+    op.create_index(op.f("ix_connector_records_tenant_id"), "connector_records", ["tenant_id"], unique=False)
+    op.create_index(op.f("ix_connector_records_connector_instance_id"), "connector_records", ["connector_instance_id"], unique=False)
+    op.create_index(op.f("ix_connector_records_day"), "connector_records", ["day"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("connector_records")
+    op.drop_column("connector_runs", "records_synced")
+    op.drop_column("connector_instances", "last_synced_at")
+    op.drop_column("connector_instances", "sync_cursor")
@@ -0,0 +1,43 @@
+"""rollup MRR is only recorded while live; backfilled history is cleared
+
+Revision ID: 0019_rollup_mrr_history
+Revises: 0018_connector_sync
+Create Date: 2026-10-19
+"""
+
+from datetime import date, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0019_rollup_mrr_history"
+down_revision = "0018_connector_sync"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of rollups.MRR_LIVE_DAYS at the time of this migration.
+MRR_LIVE_DAYS = 1
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("tenant_daily_rollups") as batch:
+        batch.alter_column("mrr_total_cents", existing_type=sa.Integer(), nullable=True, server_default=None)
+
+    # Rows backfilled from the current ClientFinancial totals carry a made-up MRR for their day.
+    bind = op.get_bind()
+    rollups = sa.table("tenant_daily_rollups", sa.column("id", sa.Integer()), sa.column("day", sa.Date()), sa.column("computed_at", sa.DateTime()), sa.column("mrr_total_cents", sa.Integer()))
+    fabricated = []
+    for row_id, day, computed_at in bind.execute(sa.select(rollups.c.id, rollups.c.day, rollups.c.computed_at)):
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        if computed_at is not None and day < computed_at.date() - timedelta(days=MRR_LIVE_DAYS):
+            fabricated.append(row_id)
+    for start in range(0, len(fabricated), 500):
+        bind.execute(rollups.update().where(rollups.c.id.in_(fabricated[start : start + 500])).values(mrr_total_cents=None))
+
+
+def downgrade() -> None:
+    op.execute("UPDATE tenant_daily_rollups SET mrr_total_cents = 0 WHERE mrr_total_cents IS NULL")
+    with op.batch_alter_table("tenant_daily_rollups") as batch:
+        batch.alter_column("mrr_total_cents", existing_type=sa.Integer(), nullable=False, server_default="0")
@@ -0,0 +1,23 @@
+"""connector run heartbeat for lease-based requeue
+
+Revision ID: 0020_connector_run_heartbeat
+Revises: 0019_rollup_mrr_history
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0020_connector_run_heartbeat"
+down_revision = "0019_rollup_mrr_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("connector_runs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("connector_runs", "heartbeat_at")
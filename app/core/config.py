@@ -7,6 +7,14 @@ class Settings:
     secret_key: str = os.getenv("SECRET_KEY", "dev-secret-change-me")
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./agency_os.db")
     session_cookie: str = "agency_os_session"
+    scheduler_enabled: bool = os.getenv("SCHEDULER_ENABLED", "0") == "1"
+    scheduler_poll_seconds: float = float(os.getenv("SCHEDULER_POLL_SECONDS", "15"))
+    job_workers: int = int(os.getenv("JOB_WORKERS", "0"))
+    job_tenant_concurrency: int = int(os.getenv("JOB_TENANT_CONCURRENCY", "2"))
+    job_tenant_limits: str = os.getenv("JOB_TENANT_LIMITS", "")
+    job_lease_seconds: int = int(os.getenv("JOB_LEASE_SECONDS", "900"))
+    run_rate_per_minute: int = int(os.getenv("RUN_RATE_PER_MINUTE", "30"))
+    run_rate_burst: int = int(os.getenv("RUN_RATE_BURST", "10"))
 
 
 @lru_cache
@@ -1,10 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.routes import auth, brainstorm, connectors, crm, dashboard, jobs, marketing, mobile, reports, workflows
+from app.core.config import get_settings
+from app.routes import api, auth, brainstorm, connectors, crm, dashboard, exports, jobs, marketing, mobile, reports, workflows
+from app.services.connector_http import connector_http
+from app.services.connector_sync import requeue_connector_runs
+from app.services.content_packs import requeue_content_pack_jobs
+from app.services.exports import requeue_export_jobs
+from app.services.keyword_similarity import requeue_keyword_index_jobs
+from app.services.job_dispatcher import dispatcher
+from app.services.scheduler import scheduler
+from app.services.workflow_engine import requeue_pending_jobs
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    if dispatcher.workers:
+        dispatcher.start()
+        requeue_pending_jobs()
+        requeue_export_jobs()
+        requeue_content_pack_jobs()
+        requeue_keyword_index_jobs()
+        requeue_connector_runs()
+    if get_settings().scheduler_enabled:
+        scheduler.start()
+    yield
+    scheduler.stop()
+    dispatcher.stop()
+    connector_http.close()
+
 
-app = FastAPI(title="AI Marketing Agency OS")
+app = FastAPI(title="AI Marketing Agency OS", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,5 +53,7 @@ app.include_router(mobile.router)
 app.include_router(jobs.router)
 app.include_router(reports.router)
 app.include_router(marketing.router)
+app.include_router(exports.router)
+app.include_router(api.router)
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
@@ -12,26 +12,35 @@ from app.models.models import (
     ClientFinancial,
     ConnectorCredential,
     ConnectorInstance,
+    ConnectorRecord,
     ConnectorRun,
     ConnectorType,
     Contact,
+    ContentPack,
     Deal,
     DealStage,
     Event,
     Job,
+    KeywordLshBand,
+    KeywordSignature,
     Membership,
     MarketingCampaign,
     MarketingKeyword,
     Note,
     Project,
     Recommendation,
+    RetentionPolicy,
+    TenantDailyRollup,
+    TenantKeyword,
     RunLog,
     RunStep,
+    SchedulerLease,
     ServiceJob,
     Task,
     Tenant,
     User,
     WorkflowRun,
+    WorkflowSchedule,
     WorkflowStep,
     WorkflowTemplate,
     AuditLog,
@@ -43,6 +52,9 @@ __all__ = [
     "Membership",
     "MarketingCampaign",
     "MarketingKeyword",
+    "TenantKeyword",
+    "KeywordSignature",
+    "KeywordLshBand",
     "Client",
     "Project",
     "Note",
@@ -51,6 +63,7 @@ __all__ = [
     "ServiceJob",
     "CalendarEvent",
     "Contact",
+    "ContentPack",
     "DealStage",
     "Deal",
     "Activity",
@@ -62,6 +75,10 @@ __all__ = [
     "WorkflowTemplate",
     "WorkflowStep",
     "WorkflowRun",
+    "WorkflowSchedule",
+    "SchedulerLease",
+    "RetentionPolicy",
+    "TenantDailyRollup",
     "RunStep",
     "RunLog",
     "Job",
@@ -72,6 +89,7 @@ __all__ = [
     "AIOutput",
     "ConnectorType",
     "ConnectorInstance",
+    "ConnectorRecord",
     "ConnectorCredential",
     "ConnectorRun",
 ]
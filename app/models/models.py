@@ -1,11 +1,18 @@
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, ForeignKey, Index, Integer, LargeBinary, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.db import Base
 
 
+def _normalize_keyword(text: str) -> str:
+    # Imported lazily: app.services.keywords imports the models.
+    from app.services.keywords import normalize_keyword
+
+    return normalize_keyword(text)
+
+
 class Tenant(Base):
     __tablename__ = "tenants"
 
@@ -47,6 +54,7 @@ class Membership(Base):
 
 class Client(Base):
     __tablename__ = "clients"
+    __table_args__ = (Index("ix_clients_tenant_created", "tenant_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -81,6 +89,7 @@ class Project(Base):
 
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (Index("ix_notes_tenant_updated", "tenant_id", "updated_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -97,6 +106,10 @@ class Note(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_tenant_created", "tenant_id", "created_at"),
+        Index("ix_tasks_tenant_status_created", "tenant_id", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -109,6 +122,7 @@ class Task(Base):
     priority: Mapped[str] = mapped_column(String(24), default="medium")
     due_date: Mapped[date | None] = mapped_column(Date, nullable=True, index=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -187,6 +201,7 @@ class DealStage(Base):
 
 class Deal(Base):
     __tablename__ = "deals"
+    __table_args__ = (Index("ix_deals_tenant_created", "tenant_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -289,6 +304,7 @@ class RunStep(Base):
 
 class RunLog(Base):
     __tablename__ = "run_logs"
+    __table_args__ = (Index("ix_run_logs_tenant_created", "tenant_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -393,6 +409,9 @@ class ConnectorInstance(Base):
     mode: Mapped[str] = mapped_column(String(24), default="manual")
     status: Mapped[str] = mapped_column(String(24), default="active")
     config_json: Mapped[str] = mapped_column(String, default="{}")
+    # Opaque resume point owned by the connector: a high-water date between runs, a page token mid-run.
+    sync_cursor: Mapped[str] = mapped_column(String(255), default="")
+    last_synced_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
@@ -415,11 +434,33 @@ class ConnectorRun(Base):
     connector_instance_id: Mapped[int] = mapped_column(ForeignKey("connector_instances.id"), index=True)
     status: Mapped[str] = mapped_column(String(24), default="queued", index=True)
     log: Mapped[str] = mapped_column(String, default="")
+    records_synced: Mapped[int] = mapped_column(Integer, default=0)
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Bumped with every committed page; a running run without a recent heartbeat lost its worker.
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
+class ConnectorRecord(Base):
+    __tablename__ = "connector_records"
+    __table_args__ = (UniqueConstraint("connector_instance_id", "record_type", "external_id", name="uq_connector_record_external"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    connector_instance_id: Mapped[int] = mapped_column(ForeignKey("connector_instances.id"), index=True)
+    record_type: Mapped[str] = mapped_column(String(40))
+    external_id: Mapped[str] = mapped_column(String(255))
+    day: Mapped[date] = mapped_column(Date, index=True)
+    name: Mapped[str] = mapped_column(String(255), default="")
+    impressions: Mapped[int] = mapped_column(BigInteger, default=0)
+    clicks: Mapped[int] = mapped_column(BigInteger, default=0)
+    cost_cents: Mapped[int] = mapped_column(BigInteger, default=0)
+    conversions: Mapped[int] = mapped_column(Integer, default=0)
+    extra_json: Mapped[str] = mapped_column(String, default="{}")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class ClientFinancial(Base):
     __tablename__ = "client_financials"
 
@@ -436,6 +477,7 @@ class ClientFinancial(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (Index("ix_events_tenant_created", "tenant_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -465,6 +507,7 @@ class Approval(Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_log"
+    __table_args__ = (Index("ix_audit_log_tenant_created", "tenant_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -479,6 +522,7 @@ class AuditLog(Base):
 
 class MarketingCampaign(Base):
     __tablename__ = "marketing_campaigns"
+    __table_args__ = (Index("ix_marketing_campaigns_tenant_updated", "tenant_id", "updated_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
@@ -490,16 +534,146 @@ class MarketingCampaign(Base):
     days: Mapped[int] = mapped_column(Integer, default=7)
     existing_keywords_json: Mapped[str] = mapped_column(String, default="[]")
     plan_json: Mapped[str] = mapped_column(String, default="{}")
+    # Summary copied out of plan_json on write so list views never parse plans or scan keywords.
+    daily_budget_cents: Mapped[int] = mapped_column(Integer, default=0)
+    bid_strategy: Mapped[str] = mapped_column(String(160), default="")
+    sub_option: Mapped[str] = mapped_column(String(120), default="")
+    template_name: Mapped[str] = mapped_column(String(120), default="")
+    keyword_count: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class MarketingKeyword(Base):
     __tablename__ = "marketing_keywords"
+    __table_args__ = (UniqueConstraint("campaign_id", "normalized", name="uq_marketing_keyword_campaign_normalized"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
     campaign_id: Mapped[int] = mapped_column(ForeignKey("marketing_campaigns.id"), index=True)
     keyword: Mapped[str] = mapped_column(String(160), index=True)
+    normalized: Mapped[str] = mapped_column(String(160), index=True)
     source: Mapped[str] = mapped_column(String(24), default="user")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    @validates("keyword")
+    def _normalize(self, key: str, value: str) -> str:
+        self.normalized = _normalize_keyword(value)
+        return value
+
+
+class TenantKeyword(Base):
+    __tablename__ = "tenant_keywords"
+    __table_args__ = (UniqueConstraint("tenant_id", "normalized", name="uq_tenant_keyword_normalized"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    keyword: Mapped[str] = mapped_column(String(160))
+    normalized: Mapped[str] = mapped_column(String(160))
+    source: Mapped[str] = mapped_column(String(24), default="expansion")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+    @validates("keyword")
+    def _normalize(self, key: str, value: str) -> str:
+        self.normalized = _normalize_keyword(value)
+        return value
+
+
+class KeywordSignature(Base):
+    __tablename__ = "keyword_signatures"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    keyword_id: Mapped[int] = mapped_column(ForeignKey("marketing_keywords.id"), unique=True)
+    campaign_id: Mapped[int] = mapped_column(ForeignKey("marketing_campaigns.id"), index=True)
+    # MinHash signature as little-endian uint32s.
+    signature: Mapped[bytes] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class KeywordLshBand(Base):
+    __tablename__ = "keyword_lsh_bands"
+    __table_args__ = (Index("ix_keyword_lsh_lookup", "tenant_id", "band", "bucket"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"))
+    keyword_id: Mapped[int] = mapped_column(ForeignKey("marketing_keywords.id"), index=True)
+    band: Mapped[int] = mapped_column(Integer)
+    bucket: Mapped[int] = mapped_column(BigInteger)
+
+
+class ContentPack(Base):
+    __tablename__ = "content_packs"
+    __table_args__ = (UniqueConstraint("campaign_id", "cluster_index", name="uq_content_pack_campaign_cluster"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    client_id: Mapped[int | None] = mapped_column(ForeignKey("clients.id"), nullable=True, index=True)
+    campaign_id: Mapped[int] = mapped_column(ForeignKey("marketing_campaigns.id"), index=True)
+    cluster_index: Mapped[int] = mapped_column(Integer, default=0)
+    cluster_name: Mapped[str] = mapped_column(String(160), default="")
+    objective: Mapped[str] = mapped_column(String(60), default="")
+    keywords_json: Mapped[str] = mapped_column(String, default="[]")
+    # Hash of every input to the pack; an unchanged key means the stored pack is still current.
+    cache_key: Mapped[str] = mapped_column(String(40), default="")
+    pack_json: Mapped[str] = mapped_column(String, default="{}")
+    job_id: Mapped[int | None] = mapped_column(ForeignKey("jobs.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class WorkflowSchedule(Base):
+    __tablename__ = "workflow_schedules"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    workflow_id: Mapped[int] = mapped_column(ForeignKey("workflow_templates.id"), index=True)
+    cron_expr: Mapped[str] = mapped_column(String(120))
+    timezone: Mapped[str] = mapped_column(String(64), default="UTC")
+    catchup_policy: Mapped[str] = mapped_column(String(16), default="skip")
+    jitter_seconds: Mapped[int] = mapped_column(Integer, default=0)
+    allow_overlap: Mapped[bool] = mapped_column(Boolean, default=False)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    last_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_run_id: Mapped[int | None] = mapped_column(ForeignKey("workflow_runs.id"), nullable=True)
+    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(60), unique=True, index=True)
+    holder: Mapped[str] = mapped_column(String(120), default="")
+    expires_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class RetentionPolicy(Base):
+    __tablename__ = "retention_policies"
+    __table_args__ = (UniqueConstraint("tenant_id", "table_name", name="uq_retention_tenant_table"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    table_name: Mapped[str] = mapped_column(String(40))
+    retain_days: Mapped[int] = mapped_column(Integer, default=180)
+    archive: Mapped[bool] = mapped_column(Boolean, default=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class TenantDailyRollup(Base):
+    __tablename__ = "tenant_daily_rollups"
+    __table_args__ = (UniqueConstraint("tenant_id", "day", name="uq_rollup_tenant_day"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), index=True)
+    day: Mapped[date] = mapped_column(Date, index=True)
+    mrr_total_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    pipeline_14d_cents: Mapped[int] = mapped_column(Integer, default=0)
+    blocked_items: Mapped[int] = mapped_column(Integer, default=0)
+    wins: Mapped[int] = mapped_column(Integer, default=0)
+    top_risks_json: Mapped[str] = mapped_column(String, default="[]")
+    dirty: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.models import AuditLog, Client, ConnectorRecord, ContentPack, Deal, Event, Note, Task, TenantKeyword
+from app.services.authz import CurrentContext, require_context
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, CursorError, keyset_page
+
+router = APIRouter(prefix="/api", tags=["api"])
+
+RESERVED_PARAMS = {"tenant_id", "cursor", "limit"}
+
+
+@dataclass(frozen=True)
+class ListResource:
+    model: type
+    sort_key: str
+    filters: tuple[str, ...]
+
+
+RESOURCES = {
+    "audit": ListResource(AuditLog, "created_at", ("entity_type", "entity_id", "action", "actor_user_id")),
+    "events": ListResource(Event, "created_at", ("type", "entity_type", "entity_id", "severity")),
+    "tasks": ListResource(Task, "created_at", ("status", "priority", "client_id", "project_id")),
+    "deals": ListResource(Deal, "created_at", ("status", "client_id", "stage_id")),
+    "clients": ListResource(Client, "created_at", ("status",)),
+    "notes": ListResource(Note, "updated_at", ("project_id",)),
+    "keywords": ListResource(TenantKeyword, "created_at", ("source", "normalized")),
+    "content-packs": ListResource(ContentPack, "updated_at", ("campaign_id", "client_id", "objective")),
+    "connector-records": ListResource(ConnectorRecord, "updated_at", ("connector_instance_id", "record_type", "name")),
+}
+
+
+def _serialize(row) -> dict:
+    out = {}
+    for column in row.__table__.columns:
+        if column.key == "tenant_id":
+            continue
+        value = getattr(row, column.key)
+        out[column.key] = value.isoformat() if isinstance(value, (datetime, date)) else value
+    return out
+
+
+@router.get("/{resource}")
+def list_resource(
+    resource: str,
+    request: Request,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    spec = RESOURCES.get(resource)
+    if spec is None:
+        raise HTTPException(status_code=404, detail="Unknown resource")
+    model = spec.model
+    query = db.query(model).filter(model.tenant_id == ctx.tenant.id)
+    for key, value in request.query_params.items():
+        if key in RESERVED_PARAMS or value == "":
+            continue
+        if key not in spec.filters:
+            raise HTTPException(status_code=400, detail=f"Unsupported filter: {key}")
+        column = model.__table__.c[key]
+        if column.type.python_type is int:
+            if not value.isdigit():
+                raise HTTPException(status_code=400, detail=f"Filter {key} must be an integer")
+            value = int(value)
+        query = query.filter(column == value)
+    try:
+        page = keyset_page(query, getattr(model, spec.sort_key), model.id, cursor, limit)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"items": [_serialize(row) for row in page.items], "next_cursor": page.next_cursor}
@@ -123,8 +123,7 @@ def create_workflow_from_recommendation(
         created_by_user_id=ctx.user.id,
     )
     db.add(workflow)
-    db.commit()
-    db.refresh(workflow)
+    db.flush()
 
     steps = json.loads(rec.workflow_draft_json or "[]")
     for idx, step in enumerate(steps, start=1):
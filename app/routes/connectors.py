@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
@@ -8,6 +6,8 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.models import ConnectorCredential, ConnectorInstance, ConnectorRun, ConnectorType
 from app.services.authz import CurrentContext, require_context, require_role
+from app.services.connector_http import connector_http
+from app.services.connector_sync import enqueue_connector_runs
 from app.services.intelligence import audit_change, emit_event
 
 router = APIRouter(prefix="/connectors", tags=["connectors"])
@@ -21,6 +21,8 @@ DEFAULT_TYPES = [
     ("email", "Email Provider"),
     ("books", "Books / Accounting"),
 ]
+# "fixture" syncs deterministic demo rows (tagged source=fixture) for development and tests.
+CONNECTOR_MODES = {"manual", "api", "fixture"}
 
 
 @router.get("")
@@ -44,6 +46,11 @@ def connector_page(request: Request, ctx: CurrentContext = Depends(require_conte
     )
 
 
+@router.get("/http-metrics")
+def connector_http_metrics(ctx: CurrentContext = Depends(require_context)):
+    return connector_http.metrics()
+
+
 @router.post("")
 def create_connector(
     connector_type_id: int = Form(...),
@@ -60,7 +67,7 @@ def create_connector(
         tenant_id=ctx.tenant.id,
         connector_type_id=ct.id,
         name=name.strip(),
-        mode=mode if mode in {"manual", "api"} else "manual",
+        mode=mode if mode in CONNECTOR_MODES else "manual",
         status="active",
         config_json="{}",
     )
@@ -72,8 +79,8 @@ def create_connector(
         ConnectorCredential(
             tenant_id=ctx.tenant.id,
             connector_instance_id=instance.id,
-            secret_masked="configured-manual" if instance.mode == "manual" else "api-key-missing",
-            is_configured=instance.mode == "manual",
+            secret_masked={"manual": "configured-manual", "fixture": "fixture-data"}.get(instance.mode, "api-key-missing"),
+            is_configured=instance.mode != "api",
         )
     )
     emit_event(
@@ -111,24 +118,21 @@ def run_connector(
     if not instance:
         raise HTTPException(status_code=404, detail="Connector instance not found")
 
-    run = ConnectorRun(
-        tenant_id=ctx.tenant.id,
-        connector_instance_id=instance.id,
-        status="succeeded",
-        log="Manual mode run completed (stub).",
-        started_at=datetime.utcnow(),
-        ended_at=datetime.utcnow(),
-    )
-    db.add(run)
-    emit_event(
-        db,
-        tenant_id=ctx.tenant.id,
-        event_type="connector_run_succeeded",
-        entity_type="connector_run",
-        entity_id=run.id,
-        severity="info",
-        title=f"Connector run completed: {instance.name}",
-        detail={"detail": run.log},
+    enqueue_connector_runs(db, ctx.tenant.id, [instance])
+    return RedirectResponse(url=f"/connectors?tenant_id={ctx.tenant.id}", status_code=303)
+
+
+@router.post("/sync")
+def sync_connectors(
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    instances = (
+        db.query(ConnectorInstance)
+        .filter(ConnectorInstance.tenant_id == ctx.tenant.id, ConnectorInstance.status == "active")
+        .order_by(ConnectorInstance.id.asc())
+        .all()
     )
-    db.commit()
+    # Queued together, the runs are fetched concurrently by a single worker.
+    enqueue_connector_runs(db, ctx.tenant.id, instances)
     return RedirectResponse(url=f"/connectors?tenant_id={ctx.tenant.id}", status_code=303)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Form, HTTPException, Request
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
@@ -7,10 +7,25 @@ from app.core.db import get_db
 from app.models import Activity, Client, Contact, Deal, DealStage, Project
 from app.services.authz import CurrentContext, require_context, require_role
 from app.services.intelligence import audit_change, emit_event
+from app.services.pagination import CursorError, keyset_page
 
 router = APIRouter(prefix="/crm", tags=["crm"])
 templates = Jinja2Templates(directory="app/templates")
 
+DEAL_LANE_SIZE = 25
+
+
+def _deal_lane(ctx: CurrentContext, db: Session, stage_id: int, cursor: str | None):
+    query = db.query(Deal).filter(Deal.tenant_id == ctx.tenant.id, Deal.stage_id == stage_id)
+    try:
+        return keyset_page(query, Deal.created_at, Deal.id, cursor, DEAL_LANE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _project_options(ctx: CurrentContext, db: Session):
+    return db.query(Project.id, Project.name).filter(Project.tenant_id == ctx.tenant.id).order_by(Project.name.asc()).all()
+
 
 @router.get("")
 def crm_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
@@ -21,16 +36,12 @@ def crm_page(request: Request, ctx: CurrentContext = Depends(require_context), d
         db.commit()
         stages = db.query(DealStage).filter(DealStage.tenant_id == ctx.tenant.id).order_by(DealStage.position.asc()).all()
 
-    clients = db.query(Client).filter(Client.tenant_id == ctx.tenant.id).order_by(Client.name.asc()).all()
-    contacts = db.query(Contact).filter(Contact.tenant_id == ctx.tenant.id).order_by(Contact.name.asc()).all()
-    deals = db.query(Deal).filter(Deal.tenant_id == ctx.tenant.id).order_by(Deal.id.desc()).all()
-    projects = db.query(Project).filter(Project.tenant_id == ctx.tenant.id).order_by(Project.name.asc()).all()
+    # Selects only need id and name; deal lanes render one keyset page each and load the rest lazily.
+    clients = db.query(Client.id, Client.name).filter(Client.tenant_id == ctx.tenant.id).order_by(Client.name.asc()).all()
+    contacts = db.query(Contact.id, Contact.name).filter(Contact.tenant_id == ctx.tenant.id).order_by(Contact.name.asc()).all()
+    lanes = {stage.id: _deal_lane(ctx, db, stage.id, None) for stage in stages}
     activities = db.query(Activity).filter(Activity.tenant_id == ctx.tenant.id).order_by(Activity.id.desc()).limit(20).all()
 
-    deals_by_stage = {stage.id: [] for stage in stages}
-    for deal in deals:
-        deals_by_stage.setdefault(deal.stage_id, []).append(deal)
-
     return templates.TemplateResponse(
         request,
         "crm.html",
@@ -39,13 +50,30 @@ def crm_page(request: Request, ctx: CurrentContext = Depends(require_context), d
             "stages": stages,
             "clients": clients,
             "contacts": contacts,
-            "deals_by_stage": deals_by_stage,
-            "projects": projects,
+            "lanes": lanes,
+            "projects": _project_options(ctx, db),
             "activities": activities,
         },
     )
 
 
+@router.get("/deals/lane/{stage_id}")
+def deal_lane_items(request: Request, stage_id: int, cursor: str = Query(...), ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    stages = db.query(DealStage).filter(DealStage.tenant_id == ctx.tenant.id).order_by(DealStage.position.asc()).all()
+    stage = next((s for s in stages if s.id == stage_id), None)
+    if stage is None:
+        raise HTTPException(status_code=404, detail="Unknown stage")
+    page = _deal_lane(ctx, db, stage_id, cursor)
+    response = templates.TemplateResponse(
+        request,
+        "_deal_cards.html",
+        {"ctx": ctx, "deals": page.items, "stage": stage, "stages": stages, "projects": _project_options(ctx, db)},
+    )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
 @router.post("/contacts")
 def create_contact(
     client_id: int = Form(...),
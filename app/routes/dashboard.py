@@ -1,9 +1,12 @@
+import hashlib
 import json
+from dataclasses import asdict
 from datetime import date, datetime, timedelta
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
@@ -28,7 +31,9 @@ from app.models import (
     WorkflowRun,
 )
 from app.services.authz import CurrentContext, require_context, require_role
+from app.services.cache import dashboard_cache
 from app.services.intelligence import HealthScore, audit_change, compute_client_health, emit_event
+from app.services.pagination import CursorError, keyset_page
 from app.services.storage import store_tenant_file
 
 router = APIRouter(tags=["dashboard"])
@@ -59,12 +64,16 @@ def _today_tasks(ctx: CurrentContext, db: Session):
 
 
 def _calendar_rows(ctx: CurrentContext, db: Session):
-    tasks = db.query(Task).filter(Task.tenant_id == ctx.tenant.id).all()
-    service_jobs = db.query(ServiceJob).filter(ServiceJob.tenant_id == ctx.tenant.id).all()
-    calendar_events = db.query(CalendarEvent).filter(CalendarEvent.tenant_id == ctx.tenant.id).all()
-    approvals = db.query(Approval).filter(Approval.tenant_id == ctx.tenant.id, Approval.status == "pending").all()
     today = date.today()
     horizon = today + timedelta(days=21)
+    tasks = db.query(Task).filter(Task.tenant_id == ctx.tenant.id, Task.due_date >= today, Task.due_date <= horizon).all()
+    service_jobs = db.query(ServiceJob).filter(ServiceJob.tenant_id == ctx.tenant.id, ServiceJob.scheduled_for >= today, ServiceJob.scheduled_for <= horizon).all()
+    calendar_events = db.query(CalendarEvent).filter(CalendarEvent.tenant_id == ctx.tenant.id, CalendarEvent.event_date >= today, CalendarEvent.event_date <= horizon).all()
+    approvals = (
+        db.query(Approval)
+        .filter(Approval.tenant_id == ctx.tenant.id, Approval.status == "pending", Approval.created_at >= datetime.combine(today, datetime.min.time()))
+        .all()
+    )
     rows: list[tuple[date, str, str]] = []
     for t in tasks:
         if t.due_date and today <= t.due_date <= horizon:
@@ -83,7 +92,13 @@ def _calendar_rows(ctx: CurrentContext, db: Session):
     return rows
 
 
-def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", client_id: int | None = None) -> dict:
+DASHBOARD_FRAGMENTS = ("decisions", "tiles", "feed", "metrics", "today")
+
+
+def _dashboard_scope(request: Request, ctx: CurrentContext, db: Session) -> dict:
+    mode = request.query_params.get("mode", "admin")
+    raw_client_id = request.query_params.get("client_id")
+    client_id = int(raw_client_id) if raw_client_id and raw_client_id.isdigit() else None
     if mode not in {"admin", "client"}:
         mode = "admin"
     base = _base_context(ctx, db)
@@ -94,12 +109,100 @@ def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", cl
         selected_client = db.query(Client).filter(Client.id == client_id, Client.tenant_id == ctx.tenant.id).first()
         if not selected_client:
             mode = "admin"
+    fragment_query = f"tenant_id={ctx.tenant.id}&mode={mode}" + (f"&client_id={selected_client.id}" if selected_client else "")
+    return {**base, "current_mode": mode, "selected_client": selected_client, "fragment_query": fragment_query}
+
+
+def _client_today_tasks(ctx: CurrentContext, db: Session, client: Client, today_tasks: list[Task]) -> list[Task]:
+    project_ids = {p.id for p in db.query(Project.id).filter(Project.tenant_id == ctx.tenant.id, Project.client_id == client.id)}
+    return [t for t in today_tasks if t.client_id == client.id or (t.project_id and t.project_id in project_ids)]
+
+
+def _client_health(ctx: CurrentContext, db: Session, scope: dict) -> dict[int, HealthScore]:
+    """Health for every tenant client, computed once per cache version and shared by the decisions and tiles fragments."""
+    rows = dashboard_cache.get_or_compute(ctx.tenant.id, ("client_health",), lambda: [asdict(compute_client_health(db, ctx.tenant.id, c.id)) for c in scope["clients"]])
+    return {row["client_id"]: HealthScore(**row) for row in rows}
 
+
+def _decision_panels(ctx: CurrentContext, db: Session, scope: dict) -> dict:
+    selected_client = scope["selected_client"]
     today_tasks = _today_tasks(ctx, db)
+    health = _client_health(ctx, db, scope)
+    if selected_client:
+        client_health = health.get(selected_client.id) or compute_client_health(db, ctx.tenant.id, selected_client.id)
+        client_tasks = _client_today_tasks(ctx, db, selected_client, today_tasks)
+        client_approvals = db.query(Approval).filter(Approval.tenant_id == ctx.tenant.id, Approval.client_id == selected_client.id, Approval.status == "pending").count()
+        client_blocked = db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == selected_client.id, WorkflowRun.status == "blocked").count()
+        client_failed = db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == selected_client.id, WorkflowRun.status == "failed").count()
+        client_pipeline = sum(x.value_cents for x in db.query(Deal).filter(Deal.tenant_id == ctx.tenant.id, Deal.client_id == selected_client.id, Deal.status == "open").all())
+        client_fin = db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id, ClientFinancial.client_id == selected_client.id).first()
+        decisions = [
+            {
+                "title": "Client approvals waiting",
+                "value": client_approvals,
+                "status": "BLOCKED" if client_approvals else "PASS",
+                "detail": "Pending approvals for this client need decision.",
+                "cta": f"/clients?tenant_id={ctx.tenant.id}&quick_client_id={selected_client.id}",
+                "cta_label": "Open client",
+            },
+            {
+                "title": "Client overdue tasks",
+                "value": len(client_tasks),
+                "status": "DUE" if client_tasks else "PASS",
+                "detail": "Overdue tasks for this client.",
+                "cta": f"/tasks?tenant_id={ctx.tenant.id}",
+                "cta_label": "Open tasks",
+            },
+        ]
+        threats = [
+            {
+                "title": "Blocked runs",
+                "value": client_blocked,
+                "status": "BLOCKED" if client_blocked else "PASS",
+                "detail": "Blocked runs tied to this client.",
+            },
+            {
+                "title": "Failed runs",
+                "value": client_failed,
+                "status": "FAIL" if client_failed else "PASS",
+                "detail": "Recent failed runs tied to this client.",
+            },
+            {
+                "title": "Risk score",
+                "value": client_health.score,
+                "status": "RISK" if client_health.score >= 40 else "PASS",
+                "detail": ", ".join(client_health.drivers) if client_health.drivers else "No critical drivers.",
+            },
+        ]
+        opportunities = [
+            {
+                "title": "Pipeline value",
+                "value": f"${client_pipeline / 100:.2f}",
+                "status": "PASS" if client_pipeline else "RISK",
+                "detail": "Open pipeline for this client.",
+                "cta": f"/crm?tenant_id={ctx.tenant.id}",
+                "cta_label": "Open CRM",
+            },
+            {
+                "title": "MRR",
+                "value": f"${(client_fin.mrr_cents / 100):.2f}" if client_fin else "—",
+                "status": "PASS" if client_fin and client_fin.mrr_cents else "RISK",
+                "detail": "Client recurring monthly revenue.",
+                "cta": f"/clients?tenant_id={ctx.tenant.id}",
+                "cta_label": "Update financials",
+            },
+        ]
+        pulse_metrics = [
+            {"label": "Approvals", "value": client_approvals, "trend": "client", "direction": "down" if client_approvals else "flat"},
+            {"label": "Due", "value": len(client_tasks), "trend": "client", "direction": "down" if client_tasks else "flat"},
+            {"label": "Blocked", "value": client_blocked, "trend": "client", "direction": "down" if client_blocked else "flat"},
+            {"label": "Risk", "value": client_health.score, "trend": "score", "direction": "down" if client_health.score >= 40 else "flat"},
+        ]
+        return {"decisions": decisions, "threats": threats, "opportunities": opportunities, "pulse_metrics": pulse_metrics}
+
     approvals_pending = db.query(Approval).filter(Approval.tenant_id == ctx.tenant.id, Approval.status == "pending").count()
     if approvals_pending == 0:
         approvals_pending = db.query(ApprovalRequest).filter(ApprovalRequest.tenant_id == ctx.tenant.id, ApprovalRequest.status == "pending").count()
-    pending_approvals = db.query(Approval).filter(Approval.tenant_id == ctx.tenant.id, Approval.status == "pending").order_by(Approval.id.desc()).limit(8).all()
     recent_jobs = db.query(Job).filter(Job.tenant_id == ctx.tenant.id).order_by(Job.id.desc()).limit(6).all()
     recent_runs = db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id).order_by(WorkflowRun.id.desc()).limit(8).all()
     blocked_runs = [r for r in recent_runs if r.status == "blocked"]
@@ -141,7 +244,7 @@ def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", cl
         },
     ]
 
-    contact_gap = [c for c in base["clients"] if not (c.contact_email or c.contact_phone)]
+    contact_gap = [c for c in scope["clients"] if not (c.contact_email or c.contact_phone)]
     threats = [
         {
             "title": "Failed workflows",
@@ -192,21 +295,7 @@ def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", cl
 
     blocked_count = len(blocked_runs)
     active_count = len([j for j in recent_jobs if j.status in {"running", "queued"}])
-
-    financials = db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id).all()
-    mrr_total = sum(x.mrr_cents for x in financials)
-    renewals_soon = sum(1 for x in financials if x.renewal_date and x.renewal_date <= date.today() + timedelta(days=30))
-    pipeline_14d = sum(x.value_cents for x in db.query(Deal).filter(Deal.tenant_id == ctx.tenant.id, Deal.close_date.is_not(None), Deal.close_date <= date.today() + timedelta(days=14)).all())
-    runs_last_24h = (
-        db.query(WorkflowRun)
-        .filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.created_at >= datetime.utcnow() - timedelta(hours=24))
-        .count()
-    )
-
-    health_by_client: dict[int, HealthScore] = {}
-    for client in base["clients"]:
-        health_by_client[client.id] = compute_client_health(db, ctx.tenant.id, client.id)
-    at_risk_clients = len([x for x in health_by_client.values() if x.score >= 70])
+    at_risk_clients = len([c for c in scope["clients"] if c.id in health and health[c.id].score >= 70])
     pulse_metrics = [
         {"label": "Approvals", "value": approvals_pending, "trend": "pending", "direction": "down" if approvals_pending else "flat"},
         {"label": "Due", "value": len(today_tasks), "trend": "today", "direction": "down" if today_tasks else "flat"},
@@ -215,63 +304,30 @@ def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", cl
         {"label": "Risk", "value": at_risk_clients, "trend": "watch", "direction": "down" if at_risk_clients else "flat"},
         {"label": "AI Cost", "value": "$0.00", "trend": "month", "direction": "flat"},
     ]
+    return {"decisions": decisions, "threats": threats, "opportunities": opportunities, "pulse_metrics": pulse_metrics}
 
-    intelligence_items = []
-    event_rows = db.query(Event).filter(Event.tenant_id == ctx.tenant.id).order_by(Event.created_at.desc()).limit(40).all()
-    for ev in event_rows:
-        kind = "info"
-        if "failed" in ev.type:
-            kind = "fail"
-        elif "blocked" in ev.type:
-            kind = "blocked"
-        elif "approval" in ev.type:
-            kind = "approval"
-        elif "deal" in ev.type or "renewal" in ev.type or "financial" in ev.type:
-            kind = "revenue"
-        detail = ""
-        try:
-            detail_json = json.loads(ev.detail_json or "{}")
-            detail = detail_json.get("detail", "")
-        except Exception:
-            detail = ""
-        intelligence_items.append(
-            {
-                "kind": kind,
-                "title": ev.title,
-                "meta": ev.entity_type,
-                "timestamp": ev.created_at.strftime("%Y-%m-%d %H:%M"),
-                "detail": detail or "Open entity to inspect details.",
-                "level": "risk" if ev.severity in {"high", "critical"} else "neutral",
-            }
-        )
-
-    if not intelligence_items:
-        intelligence_items = [
-            {
-                "kind": "empty",
-                "title": "No critical alerts right now",
-                "meta": "System is quiet",
-                "timestamp": "recent",
-                "detail": "Connect validations or run workflows to populate live intelligence.",
-                "level": "good",
-            }
-        ]
 
+def _client_tiles(ctx: CurrentContext, db: Session, scope: dict) -> dict:
+    selected_client = scope["selected_client"]
+    clients = [selected_client] if selected_client else scope["clients"]
+    today_tasks = _today_tasks(ctx, db)
+    project_clients = dict(db.query(Project.id, Project.client_id).filter(Project.tenant_id == ctx.tenant.id).all())
     due_by_client: dict[int, int] = {}
     for task in today_tasks:
-        if task.project_id:
-            project = db.query(Project).filter(Project.id == task.project_id, Project.tenant_id == ctx.tenant.id).first()
-            if project:
-                due_by_client[project.client_id] = due_by_client.get(project.client_id, 0) + 1
+        if task.project_id and task.project_id in project_clients:
+            owner_id = project_clients[task.project_id]
+            due_by_client[owner_id] = due_by_client.get(owner_id, 0) + 1
 
+    financials = {f.client_id: f for f in db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id).all()}
+    health_by_client = _client_health(ctx, db, scope)
     client_tiles = []
-    for client in base["clients"]:
+    for client in clients:
         approvals_for_client = db.query(Approval).filter(Approval.tenant_id == ctx.tenant.id, Approval.client_id == client.id, Approval.status == "pending").count()
         blocked_for_client = db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == client.id, WorkflowRun.status == "blocked").count()
         due_for_client = due_by_client.get(client.id, 0)
         score = blocked_for_client * 5 + approvals_for_client * 3 + due_for_client * 2
-        fin = next((f for f in financials if f.client_id == client.id), None)
-        health = health_by_client.get(client.id)
+        fin = financials.get(client.id)
+        health = health_by_client.get(client.id) or compute_client_health(db, ctx.tenant.id, client.id)
         client_tiles.append(
             {
                 "id": client.id,
@@ -282,9 +338,9 @@ def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", cl
                 "contact_phone": client.contact_phone,
                 "revenue": f"${fin.mrr_cents / 100:,.0f}" if fin and fin.mrr_cents else "—",
                 "roas": "—",
-                "risk": f"{health.risk_level} ({health.score})" if health else "—",
-                "risk_score": health.score if health else 0,
-                "risk_drivers": health.drivers if health else [],
+                "risk": f"{health.risk_level} ({health.score})",
+                "risk_score": health.score,
+                "risk_drivers": health.drivers,
                 "workflows": db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == client.id).count(),
                 "approvals": approvals_for_client,
                 "due": due_for_client,
@@ -297,146 +353,154 @@ def _dashboard_payload(ctx: CurrentContext, db: Session, mode: str = "admin", cl
             }
         )
     client_tiles.sort(key=lambda x: (-x["score"], x["name"].lower()))
+    return {"client_tiles": client_tiles}
 
-    macro_metrics = {
-        "mrr_total": mrr_total,
-        "pipeline_14d": pipeline_14d,
-        "renewals_soon": renewals_soon,
-        "automation_load": runs_last_24h,
-    }
 
-    if mode == "client" and selected_client:
-        client_health = health_by_client.get(selected_client.id) or compute_client_health(db, ctx.tenant.id, selected_client.id)
-        client_tasks = []
-        for task in today_tasks:
-            if task.client_id == selected_client.id:
-                client_tasks.append(task)
-                continue
-            if task.project_id:
-                p = db.query(Project).filter(Project.id == task.project_id, Project.tenant_id == ctx.tenant.id).first()
-                if p and p.client_id == selected_client.id:
-                    client_tasks.append(task)
-        client_approvals = db.query(Approval).filter(Approval.tenant_id == ctx.tenant.id, Approval.client_id == selected_client.id, Approval.status == "pending").count()
-        client_blocked = db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == selected_client.id, WorkflowRun.status == "blocked").count()
-        client_failed = db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == selected_client.id, WorkflowRun.status == "failed").count()
-        client_pipeline = sum(x.value_cents for x in db.query(Deal).filter(Deal.tenant_id == ctx.tenant.id, Deal.client_id == selected_client.id, Deal.status == "open").all())
-        client_fin = db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id, ClientFinancial.client_id == selected_client.id).first()
-        decisions = [
-            {
-                "title": "Client approvals waiting",
-                "value": client_approvals,
-                "status": "BLOCKED" if client_approvals else "PASS",
-                "detail": "Pending approvals for this client need decision.",
-                "cta": f"/clients?tenant_id={ctx.tenant.id}&quick_client_id={selected_client.id}",
-                "cta_label": "Open client",
-            },
-            {
-                "title": "Client overdue tasks",
-                "value": len(client_tasks),
-                "status": "DUE" if client_tasks else "PASS",
-                "detail": "Overdue tasks for this client.",
-                "cta": f"/tasks?tenant_id={ctx.tenant.id}",
-                "cta_label": "Open tasks",
-            },
-        ]
-        threats = [
-            {
-                "title": "Blocked runs",
-                "value": client_blocked,
-                "status": "BLOCKED" if client_blocked else "PASS",
-                "detail": "Blocked runs tied to this client.",
-            },
-            {
-                "title": "Failed runs",
-                "value": client_failed,
-                "status": "FAIL" if client_failed else "PASS",
-                "detail": "Recent failed runs tied to this client.",
-            },
+def _feed_kind(event_type: str) -> str:
+    if "failed" in event_type:
+        return "fail"
+    if "blocked" in event_type:
+        return "blocked"
+    if "approval" in event_type:
+        return "approval"
+    if "deal" in event_type or "renewal" in event_type or "financial" in event_type:
+        return "revenue"
+    return "info"
+
+
+def _intelligence_feed(ctx: CurrentContext, db: Session, scope: dict) -> dict:
+    selected_client = scope["selected_client"]
+    intelligence_items = []
+    if selected_client:
+        event_rows = db.query(Event).filter(Event.tenant_id == ctx.tenant.id, Event.entity_type == "client", Event.entity_id == selected_client.id).order_by(Event.created_at.desc()).limit(20).all()
+        intelligence_items = [
             {
-                "title": "Risk score",
-                "value": client_health.score,
-                "status": "RISK" if client_health.score >= 40 else "PASS",
-                "detail": ", ".join(client_health.drivers) if client_health.drivers else "No critical drivers.",
-            },
+                "kind": "revenue" if "deal" in ev.type or "financial" in ev.type else ("approval" if "approval" in ev.type else "info"),
+                "title": ev.title,
+                "meta": ev.entity_type,
+                "timestamp": ev.created_at.strftime("%Y-%m-%d %H:%M"),
+                "detail": "Client-specific event",
+                "level": "neutral",
+            }
+            for ev in event_rows
         ]
-        opportunities = [
-            {
-                "title": "Pipeline value",
-                "value": f"${client_pipeline / 100:.2f}",
-                "status": "PASS" if client_pipeline else "RISK",
-                "detail": "Open pipeline for this client.",
-                "cta": f"/crm?tenant_id={ctx.tenant.id}",
-                "cta_label": "Open CRM",
-            },
+    if not intelligence_items:
+        for ev in db.query(Event).filter(Event.tenant_id == ctx.tenant.id).order_by(Event.created_at.desc()).limit(40).all():
+            try:
+                detail = json.loads(ev.detail_json or "{}").get("detail", "")
+            except Exception:
+                detail = ""
+            intelligence_items.append(
+                {
+                    "kind": _feed_kind(ev.type),
+                    "title": ev.title,
+                    "meta": ev.entity_type,
+                    "timestamp": ev.created_at.strftime("%Y-%m-%d %H:%M"),
+                    "detail": detail or "Open entity to inspect details.",
+                    "level": "risk" if ev.severity in {"high", "critical"} else "neutral",
+                }
+            )
+    if not intelligence_items:
+        intelligence_items = [
             {
-                "title": "MRR",
-                "value": f"${(client_fin.mrr_cents / 100):.2f}" if client_fin else "—",
-                "status": "PASS" if client_fin and client_fin.mrr_cents else "RISK",
-                "detail": "Client recurring monthly revenue.",
-                "cta": f"/clients?tenant_id={ctx.tenant.id}",
-                "cta_label": "Update financials",
-            },
-        ]
-        pulse_metrics = [
-            {"label": "Approvals", "value": client_approvals, "trend": "client", "direction": "down" if client_approvals else "flat"},
-            {"label": "Due", "value": len(client_tasks), "trend": "client", "direction": "down" if client_tasks else "flat"},
-            {"label": "Blocked", "value": client_blocked, "trend": "client", "direction": "down" if client_blocked else "flat"},
-            {"label": "Risk", "value": client_health.score, "trend": "score", "direction": "down" if client_health.score >= 40 else "flat"},
+                "kind": "empty",
+                "title": "No critical alerts right now",
+                "meta": "System is quiet",
+                "timestamp": "recent",
+                "detail": "Connect validations or run workflows to populate live intelligence.",
+                "level": "good",
+            }
         ]
+    return {"intelligence_items": intelligence_items}
+
+
+def _macro_metrics(ctx: CurrentContext, db: Session, scope: dict) -> dict:
+    selected_client = scope["selected_client"]
+    renewal_horizon = date.today() + timedelta(days=30)
+    if selected_client:
+        client_fin = db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id, ClientFinancial.client_id == selected_client.id).first()
+        client_pipeline = db.query(func.coalesce(func.sum(Deal.value_cents), 0)).filter(Deal.tenant_id == ctx.tenant.id, Deal.client_id == selected_client.id, Deal.status == "open").scalar()
         macro_metrics = {
             "mrr_total": client_fin.mrr_cents if client_fin else 0,
             "pipeline_14d": client_pipeline,
-            "renewals_soon": 1 if client_fin and client_fin.renewal_date and client_fin.renewal_date <= date.today() + timedelta(days=30) else 0,
+            "renewals_soon": 1 if client_fin and client_fin.renewal_date and client_fin.renewal_date <= renewal_horizon else 0,
             "automation_load": db.query(WorkflowRun).filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.client_id == selected_client.id).count(),
         }
-        client_tiles = [x for x in client_tiles if x["id"] == selected_client.id]
-        event_rows = db.query(Event).filter(Event.tenant_id == ctx.tenant.id, Event.entity_type == "client", Event.entity_id == selected_client.id).order_by(Event.created_at.desc()).limit(20).all()
-        if event_rows:
-            intelligence_items = [
-                {
-                    "kind": "revenue" if "deal" in ev.type or "financial" in ev.type else ("approval" if "approval" in ev.type else "info"),
-                    "title": ev.title,
-                    "meta": ev.entity_type,
-                    "timestamp": ev.created_at.strftime("%Y-%m-%d %H:%M"),
-                    "detail": "Client-specific event",
-                    "level": "neutral",
-                }
-                for ev in event_rows
-            ]
+        return {"macro_metrics": macro_metrics}
 
+    mrr_total, renewals_soon = (
+        db.query(
+            func.coalesce(func.sum(ClientFinancial.mrr_cents), 0),
+            func.count(ClientFinancial.id).filter(ClientFinancial.renewal_date.is_not(None), ClientFinancial.renewal_date <= renewal_horizon),
+        )
+        .filter(ClientFinancial.tenant_id == ctx.tenant.id)
+        .one()
+    )
+    pipeline_14d = (
+        db.query(func.coalesce(func.sum(Deal.value_cents), 0))
+        .filter(Deal.tenant_id == ctx.tenant.id, Deal.close_date.is_not(None), Deal.close_date <= date.today() + timedelta(days=14))
+        .scalar()
+    )
+    runs_last_24h = (
+        db.query(WorkflowRun)
+        .filter(WorkflowRun.tenant_id == ctx.tenant.id, WorkflowRun.created_at >= datetime.utcnow() - timedelta(hours=24))
+        .count()
+    )
+    return {"macro_metrics": {"mrr_total": mrr_total, "pipeline_14d": pipeline_14d, "renewals_soon": renewals_soon, "automation_load": runs_last_24h}}
+
+
+def _today_panel(ctx: CurrentContext, db: Session, scope: dict) -> dict:
+    today_tasks = _today_tasks(ctx, db)
+    if scope["selected_client"]:
+        today_tasks = _client_today_tasks(ctx, db, scope["selected_client"], today_tasks)
     return {
-        **base,
-        "today_tasks": today_tasks,
+        "today_tasks": [{"title": t.title, "due_date": t.due_date} for t in today_tasks[:8]],
         "calendar_rows": _calendar_rows(ctx, db)[:8],
-        "approvals_pending": approvals_pending,
-        "recent_jobs": recent_jobs,
-        "recent_runs": recent_runs,
-        "pulse_metrics": pulse_metrics,
-        "intelligence_items": intelligence_items,
-        "decisions": decisions,
-        "threats": threats,
-        "opportunities": opportunities,
-        "client_tiles": client_tiles,
-        "macro_metrics": macro_metrics,
-        "current_mode": mode,
-        "selected_client": selected_client,
     }
 
 
+FRAGMENT_BUILDERS = {
+    "decisions": _decision_panels,
+    "tiles": _client_tiles,
+    "feed": _intelligence_feed,
+    "metrics": _macro_metrics,
+    "today": _today_panel,
+}
+
+
+def _fragment_data(name: str, ctx: CurrentContext, db: Session, scope: dict) -> dict:
+    # Payloads depend only on tenant data and scope, so every user of the tenant shares one entry.
+    client_id = scope["selected_client"].id if scope["selected_client"] else None
+    return dashboard_cache.get_or_compute(ctx.tenant.id, (name, scope["current_mode"], client_id), lambda: FRAGMENT_BUILDERS[name](ctx, db, scope))
+
+
+def _dashboard_shell(request: Request, ctx: CurrentContext, db: Session):
+    scope = _dashboard_scope(request, ctx, db)
+    # Only the cheap schedule panel renders inline; the rest stream in from /dashboard/fragments/*.
+    return templates.TemplateResponse(request, "dashboard.html", {**scope, **_fragment_data("today", ctx, db, scope)})
+
+
 @router.get("/")
 def home(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
-    mode = request.query_params.get("mode", "admin")
-    client_id = request.query_params.get("client_id")
-    parsed_client_id = int(client_id) if client_id and client_id.isdigit() else None
-    return templates.TemplateResponse(request, "dashboard.html", _dashboard_payload(ctx, db, mode=mode, client_id=parsed_client_id))
+    return _dashboard_shell(request, ctx, db)
 
 
 @router.get("/dashboard")
 def dashboard_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
-    mode = request.query_params.get("mode", "admin")
-    client_id = request.query_params.get("client_id")
-    parsed_client_id = int(client_id) if client_id and client_id.isdigit() else None
-    return templates.TemplateResponse(request, "dashboard.html", _dashboard_payload(ctx, db, mode=mode, client_id=parsed_client_id))
+    return _dashboard_shell(request, ctx, db)
+
+
+@router.get("/dashboard/fragments/{name}")
+def dashboard_fragment(name: str, request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    if name not in FRAGMENT_BUILDERS:
+        raise HTTPException(status_code=404, detail="Unknown dashboard fragment")
+    scope = _dashboard_scope(request, ctx, db)
+    body = templates.get_template(f"_dashboard_{name}.html").render({**scope, **_fragment_data(name, ctx, db, scope)})
+    etag = f'W/"{hashlib.sha1(body.encode("utf-8")).hexdigest()[:20]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Cookie"}
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
 
 
 @router.get("/search")
@@ -528,27 +592,65 @@ def operations_hub(request: Request, ctx: CurrentContext = Depends(require_conte
     return templates.TemplateResponse(request, "operations.html", {**base, "today_tasks": _today_tasks(ctx, db)})
 
 
-@router.get("/clients")
-def clients_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
-    base = _base_context(ctx, db)
-    contacts = db.query(Contact).filter(Contact.tenant_id == ctx.tenant.id).order_by(Contact.created_at.desc()).all()
-    contacts_by_client: dict[int, list[Contact]] = {}
-    for contact in contacts:
-        contacts_by_client.setdefault(contact.client_id, []).append(contact)
-    financials = db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id).all()
-    fin_by_client = {f.client_id: f for f in financials}
+CLIENT_PAGE_SIZE = 25
+
+
+def _deal_stages(ctx: CurrentContext, db: Session) -> list[DealStage]:
     stages = db.query(DealStage).filter(DealStage.tenant_id == ctx.tenant.id).order_by(DealStage.position.asc()).all()
     if not stages:
         for i, name in enumerate(["Lead", "Qualified", "Proposal", "Won"], start=1):
             db.add(DealStage(tenant_id=ctx.tenant.id, name=name, position=i, is_won=name == "Won"))
         db.commit()
         stages = db.query(DealStage).filter(DealStage.tenant_id == ctx.tenant.id).order_by(DealStage.position.asc()).all()
-    health_by_client = {c.id: compute_client_health(db, ctx.tenant.id, c.id) for c in base["clients"]}
-    return templates.TemplateResponse(
-        request,
-        "clients.html",
-        {**base, "contacts_by_client": contacts_by_client, "fin_by_client": fin_by_client, "deal_stages": stages, "health_by_client": health_by_client},
-    )
+    return stages
+
+
+def _client_rows(ctx: CurrentContext, db: Session, cursor: str | None) -> tuple[dict, str | None]:
+    """One keyset page of clients plus the contacts, financials and health their rows render."""
+    try:
+        page = keyset_page(db.query(Client).filter(Client.tenant_id == ctx.tenant.id), Client.created_at, Client.id, cursor, CLIENT_PAGE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    client_ids = [c.id for c in page.items]
+    contacts_by_client: dict[int, list[Contact]] = {}
+    fin_by_client: dict[int, ClientFinancial] = {}
+    if client_ids:
+        contacts = (
+            db.query(Contact)
+            .filter(Contact.tenant_id == ctx.tenant.id, Contact.client_id.in_(client_ids))
+            .order_by(Contact.created_at.desc())
+            .all()
+        )
+        for contact in contacts:
+            contacts_by_client.setdefault(contact.client_id, []).append(contact)
+        financials = db.query(ClientFinancial).filter(ClientFinancial.tenant_id == ctx.tenant.id, ClientFinancial.client_id.in_(client_ids)).all()
+        fin_by_client = {f.client_id: f for f in financials}
+    health_by_client = {c.id: compute_client_health(db, ctx.tenant.id, c.id) for c in page.items}
+    rows = {
+        "ctx": ctx,
+        "clients": page.items,
+        "contacts_by_client": contacts_by_client,
+        "fin_by_client": fin_by_client,
+        "health_by_client": health_by_client,
+        "deal_stages": _deal_stages(ctx, db),
+    }
+    return rows, page.next_cursor
+
+
+@router.get("/clients")
+def clients_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    base = _base_context(ctx, db)
+    rows, next_cursor = _client_rows(ctx, db, None)
+    return templates.TemplateResponse(request, "clients.html", {**base, **rows, "next_cursor": next_cursor})
+
+
+@router.get("/clients/rows")
+def client_rows(request: Request, cursor: str = Query(...), ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    rows, next_cursor = _client_rows(ctx, db, cursor)
+    response = templates.TemplateResponse(request, "_client_rows.html", rows)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
 @router.get("/projects")
@@ -557,28 +659,121 @@ def projects_page(request: Request, ctx: CurrentContext = Depends(require_contex
     return templates.TemplateResponse(request, "projects.html", base)
 
 
+TASK_STATUSES = ("todo", "in_progress", "done")
+TASK_LANE_SIZE = 25
+TASK_ARCHIVE_AFTER_DAYS = 14
+
+
+def _task_counts(ctx: CurrentContext, db: Session) -> dict:
+    counts = {status: 0 for status in TASK_STATUSES}
+    counts["archived"] = 0
+    rows = (
+        db.query(Task.status, Task.archived_at.is_not(None), func.count(Task.id))
+        .filter(Task.tenant_id == ctx.tenant.id)
+        .group_by(Task.status, Task.archived_at.is_not(None))
+        .all()
+    )
+    for status, archived, total in rows:
+        key = "archived" if archived else status
+        counts[key] = counts.get(key, 0) + total
+    return counts
+
+
+def _task_lane(ctx: CurrentContext, db: Session, status: str | None, cursor: str | None, archived: bool = False):
+    query = db.query(Task).filter(Task.tenant_id == ctx.tenant.id)
+    if archived:
+        query = query.filter(Task.archived_at.is_not(None))
+    else:
+        query = query.filter(Task.status == status, Task.archived_at.is_(None))
+    try:
+        return keyset_page(query, Task.created_at, Task.id, cursor, TASK_LANE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @router.get("/tasks")
 def tasks_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
     base = _base_context(ctx, db)
-    tasks = db.query(Task).filter(Task.tenant_id == ctx.tenant.id).order_by(Task.created_at.desc()).all()
+    lanes = {status: _task_lane(ctx, db, status, None) for status in TASK_STATUSES}
     return templates.TemplateResponse(
         request,
         "tasks.html",
-        {**base, "tasks_todo": [t for t in tasks if t.status == "todo"], "tasks_in_progress": [t for t in tasks if t.status == "in_progress"], "tasks_done": [t for t in tasks if t.status == "done"], "today_tasks": _today_tasks(ctx, db)},
+        {**base, "lanes": lanes, "task_counts": _task_counts(ctx, db), "archive_after_days": TASK_ARCHIVE_AFTER_DAYS, "today_tasks": _today_tasks(ctx, db)},
     )
 
 
-@router.get("/notes")
-def notes_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
-    base = _base_context(ctx, db)
-    notes = db.query(Note).filter(Note.tenant_id == ctx.tenant.id).order_by(Note.updated_at.desc()).all()
-    note_ids = [n.id for n in notes]
+@router.get("/tasks/lane/{status}")
+def task_lane_items(request: Request, status: str, cursor: str | None = Query(default=None), ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    if status != "archived" and status not in TASK_STATUSES:
+        raise HTTPException(status_code=404, detail="Unknown lane")
+    page = _task_lane(ctx, db, status, cursor, archived=status == "archived")
+    response = templates.TemplateResponse(request, "_task_cards.html", {"tasks": page.items, "draggable": status != "archived"})
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+@router.post("/tasks/archive")
+def archive_done_tasks(
+    older_than_days: int = Form(default=TASK_ARCHIVE_AFTER_DAYS),
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    if older_than_days < 0:
+        raise HTTPException(status_code=400, detail="older_than_days must be zero or more")
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=older_than_days)
+    archived = (
+        db.query(Task)
+        .filter(Task.tenant_id == ctx.tenant.id, Task.status == "done", Task.archived_at.is_(None), Task.completed_at.is_not(None), Task.completed_at <= cutoff)
+        .update({Task.archived_at: now}, synchronize_session=False)
+    )
+    if archived:
+        emit_event(
+            db,
+            tenant_id=ctx.tenant.id,
+            event_type="tasks_archived",
+            entity_type="tenant",
+            entity_id=ctx.tenant.id,
+            severity="info",
+            title=f"Archived {archived} done task(s)",
+            detail={"older_than_days": older_than_days},
+        )
+    db.commit()
+    return RedirectResponse(url=f"/tasks?tenant_id={ctx.tenant.id}", status_code=303)
+
+
+NOTES_PAGE_SIZE = 20
+
+
+def _notes_page(ctx: CurrentContext, db: Session, cursor: str | None) -> tuple[list[Note], dict, str | None]:
+    try:
+        page = keyset_page(db.query(Note).filter(Note.tenant_id == ctx.tenant.id), Note.updated_at, Note.id, cursor, NOTES_PAGE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    note_ids = [n.id for n in page.items]
     attachments = {}
     if note_ids:
         rows = db.query(Attachment).filter(Attachment.tenant_id == ctx.tenant.id, Attachment.note_id.in_(note_ids)).all()
         for item in rows:
             attachments.setdefault(item.note_id, []).append(item)
-    return templates.TemplateResponse(request, "notes.html", {**base, "notes": notes, "attachments": attachments})
+    return page.items, attachments, page.next_cursor
+
+
+@router.get("/notes")
+def notes_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    base = _base_context(ctx, db)
+    notes, attachments, next_cursor = _notes_page(ctx, db, None)
+    return templates.TemplateResponse(request, "notes.html", {**base, "notes": notes, "attachments": attachments, "next_cursor": next_cursor})
+
+
+@router.get("/notes/items")
+def notes_items(request: Request, cursor: str = Query(...), ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    notes, attachments, next_cursor = _notes_page(ctx, db, cursor)
+    response = templates.TemplateResponse(request, "_note_items.html", {"ctx": ctx, "notes": notes, "attachments": attachments})
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
 @router.get("/scheduler")
@@ -861,7 +1056,7 @@ def create_task(
 
 
 @router.post("/tasks/{task_id}/status")
-def update_task_status(task_id: int, status: str = Form(...), ctx: CurrentContext = Depends(require_role("admin")), db: Session = Depends(get_db)):
+def update_task_status(request: Request, task_id: int, status: str = Form(...), ctx: CurrentContext = Depends(require_role("admin")), db: Session = Depends(get_db)):
     task = db.query(Task).filter(Task.id == task_id, Task.tenant_id == ctx.tenant.id).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -869,6 +1064,7 @@ def update_task_status(task_id: int, status: str = Form(...), ctx: CurrentContex
         raise HTTPException(status_code=400, detail="Invalid status")
     task.status = status
     task.completed_at = datetime.utcnow() if status == "done" else None
+    task.archived_at = None
     emit_event(
         db,
         tenant_id=ctx.tenant.id,
@@ -880,6 +1076,9 @@ def update_task_status(task_id: int, status: str = Form(...), ctx: CurrentContex
         detail={"detail": f"Priority {task.priority}"},
     )
     db.commit()
+    if "application/json" in request.headers.get("accept", ""):
+        # Board moves happen in place; the client only needs the new lane counts.
+        return JSONResponse({"id": task.id, "status": task.status, "counts": _task_counts(ctx, db)})
     return RedirectResponse(url=f"/tasks?tenant_id={ctx.tenant.id}", status_code=303)
 
 
@@ -0,0 +1,104 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+import app.core.db as core_db
+from app.core.db import get_db
+from app.models import Job
+from app.services.authz import CurrentContext, require_context
+from app.services.exports import DATASETS, JOB_KIND, ExportError, build_query, enqueue_export, export_params, export_path, stream_export
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+RESERVED_PARAMS = {"tenant_id", "fmt", "columns", "created_from", "created_to"}
+
+
+def _filters(request: Request) -> dict:
+    return {k: v for k, v in request.query_params.items() if k not in RESERVED_PARAMS}
+
+
+@router.get("/{dataset}")
+def stream_dataset(
+    dataset: str,
+    request: Request,
+    fmt: str = Query(default="csv"),
+    columns: str | None = Query(default=None),
+    created_from: date | None = Query(default=None),
+    created_to: date | None = Query(default=None),
+    ctx: CurrentContext = Depends(require_context),
+):
+    if dataset not in DATASETS:
+        raise HTTPException(status_code=404, detail="Unknown export dataset")
+    try:
+        params = export_params(dataset, fmt, columns, _filters(request), created_from, created_to)
+        selected, stmt = build_query(ctx.tenant.id, dataset, columns, params["filters"], created_from, created_to)
+    except ExportError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    def body():
+        # The request session is gone once streaming starts, so the export owns its own.
+        db = core_db.SessionLocal()
+        try:
+            yield from stream_export(db, fmt, selected, stmt)
+        finally:
+            db.close()
+
+    filename = f"{dataset}-{date.today().isoformat()}.{fmt}"
+    return StreamingResponse(body(), media_type=MEDIA_TYPES[fmt], headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+
+@router.post("/{dataset}/jobs")
+def create_export_job(
+    dataset: str,
+    request: Request,
+    fmt: str = Query(default="csv"),
+    columns: str | None = Query(default=None),
+    created_from: date | None = Query(default=None),
+    created_to: date | None = Query(default=None),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    if dataset not in DATASETS:
+        raise HTTPException(status_code=404, detail="Unknown export dataset")
+    try:
+        job = enqueue_export(db, ctx.tenant.id, export_params(dataset, fmt, columns, _filters(request), created_from, created_to))
+    except ExportError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return JSONResponse({"job_id": job.id, "status": job.status}, status_code=202)
+
+
+def _export_job(db: Session, tenant_id: int, job_id: int) -> Job:
+    job = db.query(Job).filter(Job.id == job_id, Job.tenant_id == tenant_id, Job.kind == JOB_KIND).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@router.get("/jobs/{job_id}")
+def export_job_status(
+    job_id: int,
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    job = _export_job(db, ctx.tenant.id, job_id)
+    return {"job_id": job.id, "status": job.status, "progress": job.progress, "error": job.error_message}
+
+
+@router.get("/jobs/{job_id}/download")
+def download_export(
+    job_id: int,
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    job = _export_job(db, ctx.tenant.id, job_id)
+    path = export_path(job)
+    if job.status != "succeeded" or not path.exists():
+        raise HTTPException(status_code=409, detail="Export not ready")
+    fmt = path.suffix.lstrip(".")
+    return FileResponse(path=str(path), media_type=MEDIA_TYPES.get(fmt, "application/octet-stream"), filename=path.name)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.models import Job, RunLog, WorkflowRun
 from app.services.authz import CurrentContext, require_context
+from app.services.job_dispatcher import dispatcher
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -76,3 +77,9 @@ def jobs_stream(
             time.sleep(0.5)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+@router.get("/metrics")
+def jobs_metrics(ctx: CurrentContext = Depends(require_context)):
+    # Process-wide totals span every tenant, so members only see their own queue.
+    return {"tenant": dispatcher.tenant_metrics(ctx.tenant.id)}
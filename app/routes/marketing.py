@@ -1,13 +1,17 @@
 import json
+from itertools import product
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Request
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel, Field
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
-from app.models import Client, MarketingCampaign, MarketingKeyword, Membership
+from app.models import Client, ContentPack, Job, MarketingCampaign, MarketingKeyword, Membership
 from app.services.authz import CurrentContext, require_context, require_role
+from app.services.content_packs import JOB_KIND as CONTENT_PACK_JOB_KIND, enqueue_content_packs
 from app.services.intelligence import audit_change, emit_event
 from app.services.marketing import (
     OBJECTIVES,
@@ -15,16 +19,70 @@ from app.services.marketing import (
     PLATFORM_CONFIG,
     PLATFORM_OBJECTIVES,
     campaign_plan,
+    content_pack,
     keyword_suggestions,
     normalize_website_url,
     parse_handles,
     parse_keywords,
-    seo_content_pack,
+    plan_for,
+    plan_summary,
+    thaw,
+)
+from app.services.keyword_similarity import DEFAULT_CLUSTER_THRESHOLD, cluster_keywords, enqueue_keyword_index, near_duplicates, similar_keywords
+from app.services.keywords import (
+    DEFAULT_EXPANSION_LIMIT,
+    MAX_EXPANSION_LIMIT,
+    MAX_NGRAM,
+    batched,
+    dedupe_keywords,
+    expand_keywords,
+    normalize_keyword,
+    store_keywords,
+)
+from app.services.marketing_catalog import CATALOG, CatalogError
+from app.services.pagination import CursorError, Page, keyset_page
+from app.services.pacing import (
+    DEFAULT_SCENARIOS,
+    MAX_SCENARIOS,
+    PACING_SHAPES,
+    optimize_allocation,
+    pacing_curve,
+    portfolio_allocation,
+    simulate_outcomes,
 )
 
 router = APIRouter(tags=["marketing"])
 templates = Jinja2Templates(directory="app/templates")
 
+MAX_BULK_CAMPAIGNS = 500
+MAX_CAMPAIGN_KEYWORDS = 30
+CAMPAIGN_PAGE_SIZE = 25
+KEYWORD_PAGE_SIZE = 20
+
+
+class BulkCampaignRequest(BaseModel):
+    client_ids: list[int] = Field(min_length=1)
+    platforms: list[str] = Field(min_length=1)
+    objectives: list[str] = Field(min_length=1)
+    budget: float = Field(ge=0)
+    days: int = Field(default=7, ge=1)
+    sub_option: str = ""
+    template_name: str = ""
+    existing_keywords: list[str] = Field(default_factory=list)
+    name_prefix: str = ""
+
+
+class KeywordExpansionRequest(BaseModel):
+    seeds: list[str] = Field(min_length=1)
+    modifiers: list[str] = Field(default_factory=list)
+    negatives: list[str] = Field(default_factory=list)
+    max_ngram: int = Field(default=3, ge=2, le=MAX_NGRAM)
+    limit: int = Field(default=DEFAULT_EXPANSION_LIMIT, ge=1, le=MAX_EXPANSION_LIMIT)
+
+
+def _expansion(payload: KeywordExpansionRequest):
+    return expand_keywords(payload.seeds, payload.modifiers, payload.negatives, max_ngram=payload.max_ngram, limit=payload.limit)
+
 
 def _base_context(ctx: CurrentContext, db: Session) -> dict:
     memberships = db.query(Membership).filter(Membership.user_id == ctx.user.id).all()
@@ -32,55 +90,63 @@ def _base_context(ctx: CurrentContext, db: Session) -> dict:
     return {"ctx": ctx, "memberships": memberships, "clients": clients}
 
 
-def _campaign_rows(ctx: CurrentContext, db: Session) -> list[dict]:
-    rows = db.query(MarketingCampaign).filter(MarketingCampaign.tenant_id == ctx.tenant.id).order_by(MarketingCampaign.updated_at.desc()).all()
-    clients = {c.id: c for c in db.query(Client).filter(Client.tenant_id == ctx.tenant.id).all()}
-    keywords = db.query(MarketingKeyword).filter(MarketingKeyword.tenant_id == ctx.tenant.id).all()
-    keywords_by_campaign: dict[int, list[str]] = {}
-    for item in keywords:
-        keywords_by_campaign.setdefault(item.campaign_id, []).append(item.keyword)
+def _campaign_page(ctx: CurrentContext, db: Session, cursor: str | None = None) -> Page:
+    query = db.query(MarketingCampaign).filter(MarketingCampaign.tenant_id == ctx.tenant.id)
+    try:
+        page = keyset_page(query, MarketingCampaign.updated_at, MarketingCampaign.id, cursor, CAMPAIGN_PAGE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    client_ids = {row.client_id for row in page.items if row.client_id}
+    names = dict(db.query(Client.id, Client.name).filter(Client.id.in_(client_ids)).all()) if client_ids else {}
+    campaign_ids = [row.id for row in page.items]
+    pack_counts = (
+        dict(db.query(ContentPack.campaign_id, func.count(ContentPack.id)).filter(ContentPack.campaign_id.in_(campaign_ids)).group_by(ContentPack.campaign_id).all())
+        if campaign_ids
+        else {}
+    )
+    for row in page.items:
+        row.client_name = names.get(row.client_id, "Unassigned")
+        row.content_pack_count = pack_counts.get(row.id, 0)
+    return page
+
+
+def _campaign_list_context(ctx: CurrentContext, db: Session) -> dict:
+    page = _campaign_page(ctx, db)
+    budgets = (
+        db.query(MarketingCampaign.platform, func.sum(MarketingCampaign.budget_cents), func.count(MarketingCampaign.id))
+        .filter(MarketingCampaign.tenant_id == ctx.tenant.id)
+        .group_by(MarketingCampaign.platform)
+        .all()
+    )
+    return {
+        "campaigns": page.items,
+        "campaigns_next_cursor": page.next_cursor,
+        "campaign_total": sum(count for _, _, count in budgets),
+        "allocation": portfolio_allocation([(platform, total) for platform, total, _ in budgets], seed=ctx.tenant.id),
+    }
 
-    output: list[dict] = []
-    for row in rows:
-        plan = {}
-        try:
-            plan = json.loads(row.plan_json or "{}")
-        except json.JSONDecodeError:
-            plan = {}
-        output.append(
-            {
-                "id": row.id,
-                "name": row.name,
-                "platform": row.platform,
-                "objective": row.objective,
-                "client_name": clients[row.client_id].name if row.client_id in clients else "Unassigned",
-                "budget_cents": row.budget_cents,
-                "days": row.days,
-                "daily_budget_cents": int(plan.get("daily_budget_cents", 0)),
-                "bid_strategy": plan.get("bid_strategy", "—"),
-                "sub_option": plan.get("sub_option", "—"),
-                "template_name": plan.get("template_name", "—"),
-                "keywords": keywords_by_campaign.get(row.id, []),
-                "updated_at": row.updated_at,
-            }
-        )
-    return output
+
+def _validate_selection(platform: str, objective: str, sub_option: str, template_name: str) -> None:
+    try:
+        CATALOG.select(platform, objective, sub_option or None, template_name or None)
+    except CatalogError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.get("/marketing")
 def marketing_page(request: Request, ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
     base = _base_context(ctx, db)
-    campaigns = _campaign_rows(ctx, db)
     return templates.TemplateResponse(
         request,
         "marketing.html",
         {
             **base,
+            **_campaign_list_context(ctx, db),
             "platforms": PAID_PLATFORMS,
             "objectives": OBJECTIVES,
             "platform_objectives": PLATFORM_OBJECTIVES,
             "platform_config": PLATFORM_CONFIG,
-            "campaigns": campaigns,
+            "pacing_shapes": PACING_SHAPES,
             "preview_plan": None,
             "preview_existing_keywords": [],
             "preview_added_keywords": [],
@@ -108,23 +174,16 @@ def preview_campaign_plan(
     existing_keywords: str = Form(""),
     website_url: str = Form(""),
     social_handles: str = Form(""),
+    pacing: str = Form("even"),
     ctx: CurrentContext = Depends(require_context),
     db: Session = Depends(get_db),
 ):
     client = db.query(Client).filter(Client.id == client_id, Client.tenant_id == ctx.tenant.id).first()
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
-    if platform not in PAID_PLATFORMS:
-        raise HTTPException(status_code=400, detail="Unsupported ad platform")
-    allowed_objectives = PLATFORM_OBJECTIVES.get(platform, OBJECTIVES)
-    if objective not in allowed_objectives:
-        raise HTTPException(status_code=400, detail="Objective not supported by this platform")
-    allowed_sub_options = PLATFORM_CONFIG.get(platform, {}).get("sub_options", {}).get(objective, [])
-    if sub_option and sub_option not in allowed_sub_options:
-        raise HTTPException(status_code=400, detail="Sub-option not supported by this platform objective")
-    allowed_templates = PLATFORM_CONFIG.get(platform, {}).get("templates", [])
-    if template_name and template_name not in allowed_templates:
-        raise HTTPException(status_code=400, detail="Template not supported by this platform")
+    _validate_selection(platform, objective, sub_option, template_name)
+    if pacing not in PACING_SHAPES:
+        raise HTTPException(status_code=400, detail="Unsupported pacing shape")
 
     parsed_existing = parse_keywords(existing_keywords)
     parsed_handles = parse_handles(social_handles)
@@ -132,6 +191,7 @@ def preview_campaign_plan(
     if not parsed_handles and client.social_handles:
         parsed_handles = parse_handles(client.social_handles)
     budget_cents = int(max(0.0, budget) * 100)
+    daily_spend = pacing_curve(budget_cents, max(1, days), pacing)
     plan = campaign_plan(
         platform,
         objective,
@@ -142,22 +202,25 @@ def preview_campaign_plan(
         sub_option=sub_option or None,
         template_name=template_name or None,
     )
-    plan["seo_content"] = seo_content_pack(client.name, website, parsed_handles, objective, plan["keywords_suggested"])
+    plan = {**plan, "seo_content": content_pack(client.name, website, parsed_handles, objective, list(plan["keywords_suggested"]))}
     added_keywords = [k for k in plan["keywords_suggested"] if k.lower() not in {e.lower() for e in parsed_existing}]
 
     base = _base_context(ctx, db)
-    campaigns = _campaign_rows(ctx, db)
     return templates.TemplateResponse(
         request,
         "marketing.html",
         {
             **base,
+            **_campaign_list_context(ctx, db),
             "platforms": PAID_PLATFORMS,
             "objectives": OBJECTIVES,
             "platform_objectives": PLATFORM_OBJECTIVES,
             "platform_config": PLATFORM_CONFIG,
-            "campaigns": campaigns,
+            "pacing_shapes": PACING_SHAPES,
             "preview_plan": plan,
+            "preview_pacing": pacing,
+            "preview_daily_spend": [int(c) for c in daily_spend],
+            "preview_outcomes": simulate_outcomes(platform, budget_cents, seed=client.id),
             "preview_existing_keywords": parsed_existing,
             "preview_added_keywords": added_keywords,
             "preview_client_id": client.id,
@@ -173,6 +236,19 @@ def preview_campaign_plan(
     )
 
 
+@router.get("/marketing/allocation")
+def allocation_recommendation(
+    budget: float = Query(..., ge=0),
+    platforms: list[str] = Query(...),
+    scenarios: int = Query(default=DEFAULT_SCENARIOS, ge=1, le=MAX_SCENARIOS),
+    ctx: CurrentContext = Depends(require_context),
+):
+    unknown = [p for p in platforms if p not in CATALOG.platforms]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported platform: {unknown[0]}")
+    return optimize_allocation(int(budget * 100), platforms, scenarios=scenarios, seed=ctx.tenant.id)
+
+
 @router.post("/marketing/campaigns")
 def create_campaign(
     name: str = Form(...),
@@ -192,17 +268,7 @@ def create_campaign(
     client = db.query(Client).filter(Client.id == client_id, Client.tenant_id == ctx.tenant.id).first()
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
-    if platform not in PAID_PLATFORMS:
-        raise HTTPException(status_code=400, detail="Unsupported ad platform")
-    allowed_objectives = PLATFORM_OBJECTIVES.get(platform, OBJECTIVES)
-    if objective not in allowed_objectives:
-        raise HTTPException(status_code=400, detail="Objective not supported by this platform")
-    allowed_sub_options = PLATFORM_CONFIG.get(platform, {}).get("sub_options", {}).get(objective, [])
-    if sub_option and sub_option not in allowed_sub_options:
-        raise HTTPException(status_code=400, detail="Sub-option not supported by this platform objective")
-    allowed_templates = PLATFORM_CONFIG.get(platform, {}).get("templates", [])
-    if template_name and template_name not in allowed_templates:
-        raise HTTPException(status_code=400, detail="Template not supported by this platform")
+    _validate_selection(platform, objective, sub_option, template_name)
 
     parsed_existing = parse_keywords(existing_keywords)
     parsed_handles = parse_handles(social_handles)
@@ -220,7 +286,8 @@ def create_campaign(
         sub_option=sub_option or None,
         template_name=template_name or None,
     )
-    plan["seo_content"] = seo_content_pack(client.name, website, parsed_handles, objective, plan["keywords_suggested"])
+    plan = {**plan, "seo_content": content_pack(client.name, website, parsed_handles, objective, list(plan["keywords_suggested"]))}
+    keywords_to_store = dedupe_keywords(parsed_existing + keyword_suggestions(client.name, objective, parsed_existing))[:MAX_CAMPAIGN_KEYWORDS]
 
     campaign = MarketingCampaign(
         tenant_id=ctx.tenant.id,
@@ -231,15 +298,17 @@ def create_campaign(
         budget_cents=budget_cents,
         days=max(1, days),
         existing_keywords_json=json.dumps(parsed_existing),
-        plan_json=json.dumps(plan),
+        plan_json=json.dumps(thaw(plan)),
+        keyword_count=len(keywords_to_store),
+        **plan_summary(plan),
     )
     db.add(campaign)
     db.flush()
 
-    keywords_to_store = list(dict.fromkeys(parsed_existing + keyword_suggestions(client.name, objective, parsed_existing)))
-    for keyword in keywords_to_store[:30]:
+    for keyword in keywords_to_store:
         source = "user" if keyword in parsed_existing else "suggested"
         db.add(MarketingKeyword(tenant_id=ctx.tenant.id, campaign_id=campaign.id, keyword=keyword, source=source))
+    store_keywords(db, ctx.tenant.id, keywords_to_store, source="campaign")
 
     emit_event(
         db,
@@ -271,4 +340,273 @@ def create_campaign(
         },
     )
     db.commit()
+    if keywords_to_store:
+        enqueue_keyword_index(db, ctx.tenant.id)
     return RedirectResponse(url=f"/marketing?tenant_id={ctx.tenant.id}&toast=campaign-created", status_code=303)
+
+
+@router.post("/marketing/campaigns/bulk", status_code=201)
+def create_campaigns_bulk(
+    payload: BulkCampaignRequest,
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    client_ids = list(dict.fromkeys(payload.client_ids))
+    platforms = list(dict.fromkeys(payload.platforms))
+    objectives = list(dict.fromkeys(payload.objectives))
+    if len(client_ids) * len(platforms) * len(objectives) > MAX_BULK_CAMPAIGNS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_CAMPAIGNS} campaigns per request")
+    clients = {c.id: c for c in db.query(Client).filter(Client.tenant_id == ctx.tenant.id, Client.id.in_(client_ids)).all()}
+    missing = [cid for cid in client_ids if cid not in clients]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Clients not found: {', '.join(str(cid) for cid in missing)}")
+
+    # Validate each platform/objective pair once; unsupported pairs are skipped rather than failing the matrix.
+    pairs, skipped = [], []
+    for platform, objective in product(platforms, objectives):
+        try:
+            CATALOG.select(platform, objective, payload.sub_option or None, payload.template_name or None)
+        except CatalogError as exc:
+            skipped.append({"platform": platform, "objective": objective, "reason": str(exc)})
+            continue
+        pairs.append((platform, objective))
+    if not pairs:
+        raise HTTPException(status_code=400, detail=skipped[0]["reason"] if skipped else "Nothing to create")
+
+    parsed_existing = dedupe_keywords(payload.existing_keywords)
+    existing_json = json.dumps(parsed_existing)
+    budget_cents = int(payload.budget * 100)
+    prefix = payload.name_prefix.strip()
+    campaign_rows, keyword_sets = [], []
+    for client_id, (platform, objective) in product(client_ids, pairs):
+        client = clients[client_id]
+        plan = plan_for(
+            platform,
+            objective,
+            budget_cents,
+            payload.days,
+            client.name,
+            parsed_existing,
+            sub_option=payload.sub_option or None,
+            template_name=payload.template_name or None,
+        ).data
+        seo_pack = content_pack(
+            client.name,
+            normalize_website_url(client.website_url),
+            parse_handles(client.social_handles),
+            objective,
+            list(plan["keywords_suggested"]),
+        )
+        keywords = dedupe_keywords(parsed_existing + list(plan["keywords_suggested"]))[:MAX_CAMPAIGN_KEYWORDS]
+        name = " · ".join(part for part in (prefix, client.name, platform, objective) if part)
+        campaign_rows.append(
+            {
+                "tenant_id": ctx.tenant.id,
+                "client_id": client_id,
+                "name": name[:160],
+                "platform": platform,
+                "objective": objective,
+                "budget_cents": budget_cents,
+                "days": payload.days,
+                "existing_keywords_json": existing_json,
+                "plan_json": json.dumps({**thaw(plan), "seo_content": thaw(seo_pack)}),
+                "keyword_count": len(keywords),
+                **plan_summary(plan),
+            }
+        )
+        keyword_sets.append(keywords)
+
+    # One multi-row INSERT per table instead of a flush per campaign and per keyword.
+    campaign_ids = db.scalars(
+        insert(MarketingCampaign).returning(MarketingCampaign.id, sort_by_parameter_order=True),
+        campaign_rows,
+    ).all()
+    existing_set = set(parsed_existing)
+    keyword_rows = [
+        {
+            "tenant_id": ctx.tenant.id,
+            "campaign_id": campaign_id,
+            "keyword": keyword,
+            "normalized": normalize_keyword(keyword),
+            "source": "user" if keyword in existing_set else "suggested",
+        }
+        for campaign_id, keywords in zip(campaign_ids, keyword_sets)
+        for keyword in keywords
+    ]
+    if keyword_rows:
+        db.execute(insert(MarketingKeyword), keyword_rows)
+        store_keywords(db, ctx.tenant.id, ((row["keyword"], row["normalized"]) for row in keyword_rows), source="campaign")
+
+    summary = {
+        "clients": len(client_ids),
+        "platforms": sorted({platform for platform, _ in pairs}),
+        "objectives": sorted({objective for _, objective in pairs}),
+        "budget_cents": budget_cents,
+        "days": payload.days,
+    }
+    emit_event(
+        db,
+        tenant_id=ctx.tenant.id,
+        event_type="marketing_campaigns_bulk_created",
+        entity_type="tenant",
+        entity_id=ctx.tenant.id,
+        severity="info",
+        title=f"{len(campaign_ids)} marketing campaigns planned",
+        detail={"detail": f"{len(client_ids)} clients · {len(pairs)} platform objectives"},
+    )
+    audit_change(
+        db,
+        tenant_id=ctx.tenant.id,
+        actor_user_id=ctx.user.id,
+        entity_type="tenant",
+        entity_id=ctx.tenant.id,
+        action="bulk_create_marketing_campaigns",
+        before={},
+        after={**summary, "campaign_ids": list(campaign_ids)},
+    )
+    db.commit()
+    if keyword_rows:
+        enqueue_keyword_index(db, ctx.tenant.id)
+    return {"created": len(campaign_ids), "campaign_ids": list(campaign_ids), "keywords": len(keyword_rows), "skipped": skipped, **summary}
+
+
+@router.post("/marketing/keywords/expand")
+def expand_keyword_seeds(payload: KeywordExpansionRequest, ctx: CurrentContext = Depends(require_context)):
+    def body():
+        for batch in batched(_expansion(payload)):
+            yield "".join(json.dumps({"keyword": keyword, "normalized": key}) + "\n" for keyword, key in batch).encode("utf-8")
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+@router.post("/marketing/keywords/index")
+def index_keyword_seeds(
+    payload: KeywordExpansionRequest,
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    expanded = 0
+
+    def counted():
+        nonlocal expanded
+        for item in _expansion(payload):
+            expanded += 1
+            yield item
+
+    inserted = store_keywords(db, ctx.tenant.id, counted(), source="expansion")
+    db.commit()
+    return {"expanded": expanded, "inserted": inserted, "existing": expanded - inserted}
+
+
+@router.get("/marketing/campaigns/{campaign_id}/ad-groups")
+def campaign_ad_groups(
+    campaign_id: int,
+    threshold: float = Query(default=DEFAULT_CLUSTER_THRESHOLD, gt=0, le=1),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    campaign = db.query(MarketingCampaign).filter(MarketingCampaign.id == campaign_id, MarketingCampaign.tenant_id == ctx.tenant.id).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    keywords = db.query(MarketingKeyword.keyword).filter(MarketingKeyword.campaign_id == campaign.id).order_by(MarketingKeyword.id.asc()).all()
+    return {"campaign_id": campaign.id, "ad_groups": cluster_keywords([k for (k,) in keywords], threshold)}
+
+
+@router.get("/marketing/keywords/similar")
+def similar_keyword_search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(default=20, ge=1, le=200),
+    min_similarity: float = Query(default=0.3, ge=0, le=1),
+    exclude_campaign_id: int | None = Query(default=None),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    results = similar_keywords(db, ctx.tenant.id, q, limit=limit, min_similarity=min_similarity, exclude_campaign_id=exclude_campaign_id)
+    return {"query": q, "results": results}
+
+
+@router.get("/marketing/keywords/duplicates")
+def duplicate_keywords(
+    min_similarity: float = Query(default=0.8, ge=0, le=1),
+    limit: int = Query(default=100, ge=1, le=500),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    return {"pairs": near_duplicates(db, ctx.tenant.id, min_similarity=min_similarity, limit=limit)}
+
+
+@router.get("/marketing/campaigns/rows")
+def campaign_rows_page(request: Request, cursor: str | None = Query(default=None), ctx: CurrentContext = Depends(require_context), db: Session = Depends(get_db)):
+    page = _campaign_page(ctx, db, cursor)
+    response = templates.TemplateResponse(request, "_campaign_rows.html", {"ctx": ctx, "campaigns": page.items})
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+@router.get("/marketing/campaigns/{campaign_id}/keywords")
+def campaign_keywords_page(
+    request: Request,
+    campaign_id: int,
+    cursor: str | None = Query(default=None),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    campaign = db.query(MarketingCampaign.id).filter(MarketingCampaign.id == campaign_id, MarketingCampaign.tenant_id == ctx.tenant.id).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    query = db.query(MarketingKeyword).filter(MarketingKeyword.campaign_id == campaign_id)
+    try:
+        page = keyset_page(query, MarketingKeyword.created_at, MarketingKeyword.id, cursor, KEYWORD_PAGE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    response = templates.TemplateResponse(request, "_campaign_keywords.html", {"keywords": page.items})
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+@router.get("/marketing/campaigns/{campaign_id}/content-packs")
+def campaign_content_packs(
+    request: Request,
+    campaign_id: int,
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    packs = (
+        db.query(ContentPack)
+        .filter(ContentPack.campaign_id == campaign_id, ContentPack.tenant_id == ctx.tenant.id)
+        .order_by(ContentPack.cluster_index.asc())
+        .all()
+    )
+    for row in packs:
+        row.pack = json.loads(row.pack_json or "{}")
+        row.keywords = json.loads(row.keywords_json or "[]")
+    return templates.TemplateResponse(request, "_content_packs.html", {"packs": packs})
+
+
+@router.post("/marketing/content-packs/jobs")
+def create_content_pack_job(
+    request: Request,
+    client_id: int | None = Query(default=None),
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    if client_id is not None and not db.query(Client.id).filter(Client.id == client_id, Client.tenant_id == ctx.tenant.id).first():
+        raise HTTPException(status_code=404, detail="Client not found")
+    job = enqueue_content_packs(db, ctx.tenant.id, client_id)
+    if "application/json" in request.headers.get("accept", ""):
+        return JSONResponse({"job_id": job.id, "status": job.status}, status_code=202)
+    return RedirectResponse(url=f"/marketing?tenant_id={ctx.tenant.id}&toast=content-packs-queued", status_code=303)
+
+
+@router.get("/marketing/content-packs/jobs/{job_id}")
+def content_pack_job_status(
+    job_id: int,
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    job = db.query(Job).filter(Job.id == job_id, Job.tenant_id == ctx.tenant.id, Job.kind == CONTENT_PACK_JOB_KIND).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Content pack job not found")
+    return {"job_id": job.id, "status": job.status, "progress": job.progress, "error": job.error_message}
@@ -1,17 +1,37 @@
 from datetime import date
+from email.utils import formatdate, parsedate_to_datetime
 
-from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
+from fastapi.responses import FileResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
-from app.services.authz import CurrentContext, require_context
+from app.services.authz import CurrentContext, require_context, require_role
 from app.models import AuditLog
-from app.services.intelligence import weekly_snapshot, write_weekly_artifacts
+from app.services.intelligence import audit_change, snapshot_digest, weekly_snapshot, write_weekly_artifacts
+from app.services.pagination import CursorError, keyset_page
+from app.services.retention import effective_policies, set_policy
+from app.services.rollups import PERIODS, timeseries
+from app.services.singleflight import SingleFlight
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 templates = Jinja2Templates(directory="app/templates")
+report_builds = SingleFlight()
+AUDIT_PAGE_SIZE = 50
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= int(parsedate_to_datetime(if_modified_since).timestamp())
+        except (TypeError, ValueError):
+            return False
+    return False
 
 
 @router.get("/weekly")
@@ -19,16 +39,28 @@ def weekly_report(
     request: Request,
     export: str | None = Query(default=None),
     fmt: str = Query(default="html"),
+    period: str = Query(default="week"),
     ctx: CurrentContext = Depends(require_context),
     db: Session = Depends(get_db),
 ):
-    snapshot = weekly_snapshot(db, ctx.tenant.id, date.today())
-    html_path, csv_path = write_weekly_artifacts(ctx.tenant.id, snapshot)
+    if period not in PERIODS:
+        raise HTTPException(status_code=400, detail="Unknown report period")
+    report_date = date.today()
+
+    def _build():
+        snapshot = weekly_snapshot(db, ctx.tenant.id, report_date, period)
+        return snapshot, snapshot_digest(snapshot), write_weekly_artifacts(ctx.tenant.id, snapshot)
+
+    snapshot, digest, (html_path, csv_path) = report_builds.do((ctx.tenant.id, period, report_date), _build)
 
     if export == "1":
-        if fmt == "csv":
-            return FileResponse(path=str(csv_path), media_type="text/csv", filename=csv_path.name)
-        return FileResponse(path=str(html_path), media_type="text/html", filename=html_path.name)
+        path, media_type = (csv_path, "text/csv") if fmt == "csv" else (html_path, "text/html")
+        etag = f'"{digest[:16]}"'
+        mtime = path.stat().st_mtime
+        headers = {"ETag": etag, "Last-Modified": formatdate(mtime, usegmt=True), "Cache-Control": "private, no-cache"}
+        if _not_modified(request, etag, mtime):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(path=str(path), media_type=media_type, filename=path.name, headers=headers)
 
     return templates.TemplateResponse(
         request,
@@ -42,11 +74,78 @@ def weekly_report(
     )
 
 
+@router.get("/timeseries")
+def report_timeseries(
+    grain: str = Query(default="week"),
+    periods: int = Query(default=52, ge=1, le=104),
+    window: int = Query(default=4, ge=1, le=52),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    if grain not in PERIODS:
+        raise HTTPException(status_code=400, detail="Unknown grain")
+    return timeseries(db, ctx.tenant.id, grain=grain, periods=periods, window=window)
+
+
 @router.get("/audit")
 def audit_page(
     request: Request,
     ctx: CurrentContext = Depends(require_context),
     db: Session = Depends(get_db),
 ):
-    rows = db.query(AuditLog).filter(AuditLog.tenant_id == ctx.tenant.id).order_by(AuditLog.id.desc()).limit(200).all()
-    return templates.TemplateResponse(request, "audit.html", {"ctx": ctx, "rows": rows})
+    page = keyset_page(db.query(AuditLog).filter(AuditLog.tenant_id == ctx.tenant.id), AuditLog.created_at, AuditLog.id, None, AUDIT_PAGE_SIZE)
+    policies = effective_policies(db, ctx.tenant.id)
+    return templates.TemplateResponse(request, "audit.html", {"ctx": ctx, "rows": page.items, "next_cursor": page.next_cursor, "policies": policies})
+
+
+@router.get("/audit/rows")
+def audit_rows(
+    request: Request,
+    cursor: str = Query(...),
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        page = keyset_page(db.query(AuditLog).filter(AuditLog.tenant_id == ctx.tenant.id), AuditLog.created_at, AuditLog.id, cursor, AUDIT_PAGE_SIZE)
+    except CursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    response = templates.TemplateResponse(request, "_audit_rows.html", {"rows": page.items})
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+@router.get("/retention")
+def retention_policies(
+    ctx: CurrentContext = Depends(require_context),
+    db: Session = Depends(get_db),
+):
+    return {"tenant_id": ctx.tenant.id, "policies": list(effective_policies(db, ctx.tenant.id).values())}
+
+
+@router.post("/retention")
+def update_retention_policy(
+    table_name: str = Form(...),
+    retain_days: int = Form(...),
+    archive: str = Form("1"),
+    ctx: CurrentContext = Depends(require_role("owner")),
+    db: Session = Depends(get_db),
+):
+    before = effective_policies(db, ctx.tenant.id).get(table_name)
+    try:
+        row = set_policy(db, ctx.tenant.id, table_name, retain_days, archive == "1")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    db.flush()
+    audit_change(
+        db,
+        tenant_id=ctx.tenant.id,
+        actor_user_id=ctx.user.id,
+        entity_type="retention_policy",
+        entity_id=row.id,
+        action="update",
+        before={"retain_days": before["retain_days"], "archive": before["archive"]},
+        after={"table_name": table_name, "retain_days": row.retain_days, "archive": row.archive},
+    )
+    db.commit()
+    return RedirectResponse(url=f"/reports/audit?tenant_id={ctx.tenant.id}", status_code=303)
@@ -1,4 +1,5 @@
 import json
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
@@ -6,10 +7,13 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
-from app.models import ApprovalRequest, Job, RunLog, WorkflowRun, WorkflowStep, WorkflowTemplate
+from app.models import ApprovalRequest, Job, RunLog, WorkflowRun, WorkflowSchedule, WorkflowStep, WorkflowTemplate
 from app.services.authz import CurrentContext, require_context, require_role
 from app.services.intelligence import audit_change, emit_event
+from app.services.job_dispatcher import dispatcher, run_rate_limiter
+from app.services.scheduler import CATCHUP_POLICIES, CronError, compute_next_run, scheduler
 from app.services.workflow_engine import approve_run, enqueue_workflow_run
+from app.services.workflow_templates import bump_template_version
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 templates = Jinja2Templates(directory="app/templates")
@@ -27,7 +31,9 @@ def workflow_page(request: Request, ctx: CurrentContext = Depends(require_contex
     runs = []
     logs = []
     approvals = []
+    schedules = []
     if selected:
+        schedules = db.query(WorkflowSchedule).filter(WorkflowSchedule.workflow_id == selected.id, WorkflowSchedule.tenant_id == ctx.tenant.id).order_by(WorkflowSchedule.id.asc()).all()
         steps = db.query(WorkflowStep).filter(WorkflowStep.workflow_id == selected.id, WorkflowStep.tenant_id == ctx.tenant.id).order_by(WorkflowStep.step_order.asc()).all()
         runs = db.query(WorkflowRun).filter(WorkflowRun.workflow_id == selected.id, WorkflowRun.tenant_id == ctx.tenant.id).order_by(WorkflowRun.id.desc()).limit(20).all()
         if runs:
@@ -48,6 +54,7 @@ def workflow_page(request: Request, ctx: CurrentContext = Depends(require_contex
             "logs": logs,
             "jobs": jobs,
             "approvals": approvals,
+            "schedules": schedules,
         },
     )
 
@@ -125,6 +132,7 @@ def create_step(
         gating_policy=gating_policy if gating_policy in {"approve", "auto", "pause"} else "approve",
     )
     db.add(step)
+    bump_template_version(workflow)
     db.flush()
     audit_change(
         db,
@@ -134,7 +142,7 @@ def create_step(
         entity_id=step.id,
         action="create",
         before={},
-        after={"workflow_id": workflow_id, "name": step.name, "action_type": step.action_type, "gating_policy": step.gating_policy},
+        after={"workflow_id": workflow_id, "name": step.name, "action_type": step.action_type, "gating_policy": step.gating_policy, "version": workflow.version},
     )
     db.commit()
     return RedirectResponse(url=f"/workflows?tenant_id={ctx.tenant.id}&workflow_id={workflow_id}", status_code=303)
@@ -149,6 +157,9 @@ def run_workflow(
     workflow = db.query(WorkflowTemplate).filter(WorkflowTemplate.id == workflow_id, WorkflowTemplate.tenant_id == ctx.tenant.id).first()
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
+    if not run_rate_limiter.allow(ctx.tenant.id):
+        dispatcher.record_rejection(ctx.tenant.id)
+        raise HTTPException(status_code=429, detail="Run rate limit exceeded, try again shortly")
 
     run = WorkflowRun(tenant_id=ctx.tenant.id, workflow_id=workflow.id, status="queued", triggered_by_user_id=ctx.user.id)
     db.add(run)
@@ -177,3 +188,79 @@ def approve_workflow_run(
 ):
     approve_run(run_id=run_id, tenant_id=ctx.tenant.id, user_id=ctx.user.id)
     return RedirectResponse(url=f"/workflows?tenant_id={ctx.tenant.id}", status_code=303)
+
+
+@router.post("/{workflow_id}/schedules")
+def create_schedule(
+    workflow_id: int,
+    cron_expr: str = Form(...),
+    timezone: str = Form("UTC"),
+    catchup_policy: str = Form("skip"),
+    jitter_seconds: int = Form(0),
+    allow_overlap: bool = Form(False),
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    workflow = db.query(WorkflowTemplate).filter(WorkflowTemplate.id == workflow_id, WorkflowTemplate.tenant_id == ctx.tenant.id).first()
+    if not workflow:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    try:
+        next_run_at = compute_next_run(cron_expr, timezone)
+    except CronError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    schedule = WorkflowSchedule(
+        tenant_id=ctx.tenant.id,
+        workflow_id=workflow.id,
+        cron_expr=cron_expr.strip(),
+        timezone=timezone.strip() or "UTC",
+        catchup_policy=catchup_policy if catchup_policy in CATCHUP_POLICIES else "skip",
+        jitter_seconds=max(0, min(3600, jitter_seconds)),
+        allow_overlap=allow_overlap,
+        enabled=True,
+        next_run_at=next_run_at,
+        created_by_user_id=ctx.user.id,
+    )
+    db.add(schedule)
+    db.flush()
+    audit_change(
+        db,
+        tenant_id=ctx.tenant.id,
+        actor_user_id=ctx.user.id,
+        entity_type="workflow_schedule",
+        entity_id=schedule.id,
+        action="create",
+        before={},
+        after={"workflow_id": workflow.id, "cron_expr": schedule.cron_expr, "timezone": schedule.timezone, "catchup_policy": schedule.catchup_policy},
+    )
+    db.commit()
+    scheduler.notify_changed(schedule)
+    return RedirectResponse(url=f"/workflows?tenant_id={ctx.tenant.id}&workflow_id={workflow_id}", status_code=303)
+
+
+@router.post("/schedules/{schedule_id}/toggle")
+def toggle_schedule(
+    schedule_id: int,
+    ctx: CurrentContext = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    schedule = db.query(WorkflowSchedule).filter(WorkflowSchedule.id == schedule_id, WorkflowSchedule.tenant_id == ctx.tenant.id).first()
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    before_enabled = schedule.enabled
+    schedule.enabled = not schedule.enabled
+    if schedule.enabled:
+        schedule.next_run_at = compute_next_run(schedule.cron_expr, schedule.timezone, datetime.utcnow())
+    audit_change(
+        db,
+        tenant_id=ctx.tenant.id,
+        actor_user_id=ctx.user.id,
+        entity_type="workflow_schedule",
+        entity_id=schedule.id,
+        action="enabled" if schedule.enabled else "disabled",
+        before={"enabled": before_enabled},
+        after={"enabled": schedule.enabled},
+    )
+    db.commit()
+    scheduler.notify_changed(schedule)
+    return RedirectResponse(url=f"/workflows?tenant_id={ctx.tenant.id}&workflow_id={schedule.workflow_id}", status_code=303)
@@ -0,0 +1,163 @@
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import jsonutil
+from app.models import Job, Tenant
+from app.services.intelligence import format_cents, weekly_snapshot, write_weekly_artifacts
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+except ImportError:  # pragma: no cover - optional dependency
+    canvas = None
+
+logger = logging.getLogger(__name__)
+
+JOB_KIND = "report_batch"
+_worker_sessionmaker: sessionmaker | None = None
+
+
+def _init_worker(database_url: str) -> None:
+    # Each worker process owns exactly one connection; nothing is shared with the parent's pool.
+    global _worker_sessionmaker
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, pool_size=1, max_overflow=0, pool_pre_ping=True, connect_args=connect_args)
+    _worker_sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def write_pdf_artifact(html_path: Path, snapshot: dict) -> Path | None:
+    if canvas is None:
+        return None
+    pdf_path = html_path.with_suffix(".pdf")
+    if pdf_path.exists():
+        return pdf_path
+    tmp_path = pdf_path.with_name(f".{pdf_path.name}.{uuid.uuid4().hex}.tmp")
+    doc = canvas.Canvas(str(tmp_path), pagesize=letter)
+    lines = [
+        f"Command Snapshot {snapshot.get('period_start', '')} - {snapshot['report_date']}",
+        f"MRR Total: {format_cents(snapshot['mrr_total_cents'])}",
+        f"Pipeline <14d: ${snapshot['pipeline_14d_cents'] / 100:.2f}",
+        f"Blocked approvals: {snapshot['blocked_items']}",
+        f"Workflow wins: {snapshot['wins']}",
+        "Top Risks:",
+        *[f"  - {risk}" for risk in snapshot["top_risks"]],
+    ]
+    y = 740
+    for line in lines:
+        doc.drawString(72, y, line)
+        y -= 18
+    doc.save()
+    os.replace(tmp_path, pdf_path)
+    return pdf_path
+
+
+def build_tenant_report(db: Session, tenant_id: int, report_date: date, period: str, pdf: bool) -> dict:
+    started = time.perf_counter()
+    snapshot = weekly_snapshot(db, tenant_id, report_date, period)
+    html_path, csv_path = write_weekly_artifacts(tenant_id, snapshot)
+    artifacts = {"html": str(html_path), "csv": str(csv_path)}
+    if pdf:
+        pdf_path = write_pdf_artifact(html_path, snapshot)
+        artifacts["pdf"] = str(pdf_path) if pdf_path else "unavailable: reportlab not installed"
+    return {"artifacts": artifacts, "seconds": round(time.perf_counter() - started, 4)}
+
+
+def _run_in_worker(tenant_id: int, report_date: str, period: str, pdf: bool) -> dict:
+    db = _worker_sessionmaker()
+    try:
+        return build_tenant_report(db, tenant_id, date.fromisoformat(report_date), period, pdf)
+    finally:
+        db.close()
+
+
+def _finish_job(db: Session, job: Job, result: dict | None, error: str = "") -> None:
+    payload = jsonutil.loads(job.payload_json or "{}")
+    if result is not None:
+        payload.update(result)
+    job.payload_json = jsonutil.dumps(payload)
+    job.status = "failed" if error else "succeeded"
+    job.error_message = error[:2000]
+    job.progress = 100
+
+
+def generate_all_reports(
+    db: Session,
+    *,
+    database_url: str,
+    workers: int = 4,
+    report_date: date | None = None,
+    period: str = "week",
+    pdf: bool = False,
+    tenant_ids: list[int] | None = None,
+) -> dict:
+    """Fan report builds out over a process pool, one ``jobs`` row per tenant for timing and failures.
+
+    ``workers=0`` builds inline on ``db`` (used by tests and single-tenant runs).
+    """
+    report_date = report_date or date.today()
+    batch_id = uuid.uuid4().hex[:12]
+    query = db.query(Tenant.id).order_by(Tenant.id.asc())
+    if tenant_ids:
+        query = query.filter(Tenant.id.in_(tenant_ids))
+    jobs = {}
+    for (tenant_id,) in query.all():
+        job = Job(
+            tenant_id=tenant_id,
+            kind=JOB_KIND,
+            status="queued",
+            payload_json=jsonutil.dumps({"batch_id": batch_id, "report_date": report_date.isoformat(), "period": period}),
+        )
+        db.add(job)
+        jobs[tenant_id] = job
+    db.commit()
+
+    started = time.perf_counter()
+    failed = 0
+    if workers <= 0:
+        for tenant_id, job in jobs.items():
+            try:
+                _finish_job(db, job, build_tenant_report(db, tenant_id, report_date, period, pdf))
+            except Exception as exc:
+                db.rollback()
+                logger.exception("Report build failed for tenant %s", tenant_id)
+                _finish_job(db, job, None, str(exc) or exc.__class__.__name__)
+                failed += 1
+            db.commit()
+    else:
+        pending_ids = list(jobs)
+        in_flight = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(database_url,)) as pool:
+            while pending_ids or in_flight:
+                # Bounded fan-out: never more than two builds queued per worker.
+                while pending_ids and len(in_flight) < workers * 2:
+                    tenant_id = pending_ids.pop(0)
+                    future = pool.submit(_run_in_worker, tenant_id, report_date.isoformat(), period, pdf)
+                    in_flight[future] = tenant_id
+                    jobs[tenant_id].status = "running"
+                db.commit()
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tenant_id = in_flight.pop(future)
+                    try:
+                        _finish_job(db, jobs[tenant_id], future.result())
+                    except Exception as exc:
+                        logger.error("Report build failed for tenant %s: %s", tenant_id, exc)
+                        _finish_job(db, jobs[tenant_id], None, str(exc) or exc.__class__.__name__)
+                        failed += 1
+                db.commit()
+
+    return {
+        "batch_id": batch_id,
+        "tenants": len(jobs),
+        "failed": failed,
+        "seconds": round(time.perf_counter() - started, 4),
+        "job_ids": {tenant_id: job.id for tenant_id, job in jobs.items()},
+    }
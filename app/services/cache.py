@@ -0,0 +1,154 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.core import jsonutil
+from app.services import changes
+from app.services.singleflight import SingleFlight
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+# Derived tables whose writes never change what a cached view shows.
+IGNORED_TABLES = {"tenant_daily_rollups", "content_packs"}
+
+
+class LRUCache:
+    """In-process backend: bounded LRU of serialized values plus non-evicting version counters."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl if ttl else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache:
+    """Shared backend for multi-process deployments; eviction is left to Redis' maxmemory policy."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> str | None:
+        raw = self.client.get(key)
+        return raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        self.client.set(key, value, ex=ttl or None)
+
+    def counter(self, key: str) -> int:
+        return int(self.client.get(key) or 0)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(key))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter("cache:*"):
+            self.client.delete(key)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter("cache:*"))
+
+
+def default_backend():
+    url = os.getenv("CACHE_REDIS_URL", "")
+    if url and redis is not None:
+        return RedisCache(redis.Redis.from_url(url))
+    return LRUCache()
+
+
+class TenantCache:
+    """Read-through cache whose keys embed a per-tenant version; bumping the version invalidates the tenant."""
+
+    def __init__(self, namespace: str, backend=None, ttl: int = CACHE_TTL_SECONDS):
+        self.namespace = namespace
+        self.backend = backend if backend is not None else default_backend()
+        self.ttl = ttl
+        self.flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    def _version_key(self, tenant_id: int) -> str:
+        return f"cache:{self.namespace}:version:{tenant_id}"
+
+    def version(self, tenant_id: int) -> int:
+        return self.backend.counter(self._version_key(tenant_id))
+
+    def bump(self, tenant_id: int) -> int:
+        return self.backend.incr(self._version_key(tenant_id))
+
+    def get_or_compute(self, tenant_id: int, key: tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        full_key = f"cache:{self.namespace}:{tenant_id}:{self.version(tenant_id)}:" + ":".join(str(part) for part in key)
+        raw = self.backend.get(full_key)
+        if raw is not None:
+            self.hits += 1
+            return jsonutil.loads(raw)
+        self.misses += 1
+
+        def fill() -> str:
+            serialized = jsonutil.dumps(compute())
+            self.backend.set(full_key, serialized, self.ttl)
+            return serialized
+
+        # Concurrent misses on the same key wait for one computation instead of stampeding the database.
+        return jsonutil.loads(self.flight.do(full_key, fill))
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        return {"backend": type(self.backend).__name__, "entries": len(self.backend), "hits": self.hits, "misses": self.misses}
+
+
+dashboard_cache = TenantCache("dashboard")
+
+
+@changes.on_commit
+def _bump_changed_tenants(batch: list[changes.Change]) -> None:
+    for tenant_id in {c.tenant_id for c in batch if c.table not in IGNORED_TABLES}:
+        dashboard_cache.bump(tenant_id)
@@ -0,0 +1,95 @@
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.services.event_buffer import BUFFER_KEY
+
+CHANGES_KEY = "pending_changes"
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    tenant_id: int
+    table: str
+    row_id: int | None
+    op: str
+    # Column values already loaded at flush time (or the buffered row); never triggers extra SQL.
+    values: Mapping[str, Any] = field(default_factory=dict, compare=False)
+
+
+PrepareHandler = Callable[[Session, list[Change]], None]
+CommitHandler = Callable[[list[Change]], None]
+
+_prepare_handlers: list[PrepareHandler] = []
+_commit_handlers: list[CommitHandler] = []
+
+
+def on_prepare(fn: PrepareHandler) -> PrepareHandler:
+    """Run ``fn(session, changes)`` inside the committing transaction, e.g. to mark derived rows dirty."""
+    _prepare_handlers.append(fn)
+    return fn
+
+
+def on_commit(fn: CommitHandler) -> CommitHandler:
+    """Run ``fn(changes)`` once the transaction is durable, e.g. to invalidate caches."""
+    _commit_handlers.append(fn)
+    return fn
+
+
+def unsubscribe(fn: Callable) -> None:
+    for handlers in (_prepare_handlers, _commit_handlers):
+        if fn in handlers:
+            handlers.remove(fn)
+
+
+def _record(session: Session, change: Change) -> None:
+    session.info.setdefault(CHANGES_KEY, []).append(change)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_rows(session: Session, flush_context) -> None:
+    for op, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            tenant_id = getattr(obj, "tenant_id", None)
+            table = getattr(obj, "__tablename__", None)
+            if tenant_id is None or table is None:
+                continue
+            if op == "update" and not session.is_modified(obj, include_collections=False):
+                continue
+            state = inspect(obj)
+            values = {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+            _record(session, Change(tenant_id, table, getattr(obj, "id", None), op, values))
+
+
+@event.listens_for(Session, "before_commit", insert=True)
+def _prepare_changes(session: Session) -> None:
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    # emit_event/audit_change rows are still buffered here; the event buffer inserts them right after.
+    for table, rows in session.info.get(BUFFER_KEY, {}).items():
+        for values in rows:
+            if values.get("tenant_id") is not None:
+                _record(session, Change(values["tenant_id"], table.name, None, "insert", values))
+    pending = session.info.get(CHANGES_KEY)
+    if pending:
+        for handler in _prepare_handlers:
+            handler(session, pending)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session: Session) -> None:
+    pending = session.info.pop(CHANGES_KEY, None)
+    if not pending:
+        return
+    for handler in _commit_handlers:
+        handler(pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_changes(session: Session, transaction) -> None:
+    # Commit has already published; anything left belongs to a rolled back or closed transaction.
+    if transaction.parent is None:
+        session.info.pop(CHANGES_KEY, None)
@@ -0,0 +1,269 @@
+import asyncio
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Coroutine
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("CONNECTOR_HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("CONNECTOR_HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("CONNECTOR_HTTP_KEEPALIVE_SECONDS", "30"))
+HTTP_TIMEOUT_SECONDS = float(os.getenv("CONNECTOR_HTTP_TIMEOUT_SECONDS", "30"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("CONNECTOR_HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+HTTP_RETRIES = int(os.getenv("CONNECTOR_HTTP_RETRIES", "3"))
+# Upper bound on one bridged request from another loop, retries and backoff included.
+HTTP_CALL_TIMEOUT_SECONDS = float(os.getenv("CONNECTOR_HTTP_CALL_TIMEOUT_SECONDS", "120"))
+RETRY_BASE_SECONDS = 0.25
+RETRY_CAP_SECONDS = 10.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+GET_CACHE_MAX_ENTRIES = int(os.getenv("CONNECTOR_HTTP_CACHE_ENTRIES", "512"))
+# Request headers that change what an upstream returns, so they are part of the GET cache key.
+CACHE_VARY_HEADERS = ("authorization", "accept", "developer-token", "x-goog-user-project")
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+
+def _origin(url: str) -> str:
+    parsed = httpx.URL(url)
+    return f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    raw = response.headers.get("retry-after", "")
+    try:
+        return min(RETRY_CAP_SECONDS, max(0.0, float(raw)))
+    except ValueError:
+        return None
+
+
+def _cache_ttl(response: httpx.Response, explicit: float | None) -> float:
+    directives = [d.strip() for d in response.headers.get("cache-control", "").lower().split(",")]
+    if "no-store" in directives:
+        return 0.0
+    if explicit is not None:
+        return max(0.0, explicit)
+    for directive in directives:
+        if directive.startswith("max-age="):
+            try:
+                return max(0.0, float(directive[8:]))
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+class ConnectorHttpPool:
+    """Process-wide ``httpx.AsyncClient`` per upstream origin, all driven by one background event loop.
+
+    Async clients are bound to the loop that opened their connections, so every request runs on the
+    pool's loop: ``run`` blocks a plain thread on it, ``call`` awaits it from another event loop. Keep-alive
+    connections and TLS sessions then survive across connector runs. HTTP/2 is negotiated only when the
+    optional ``h2`` package is installed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive: int = HTTP_MAX_KEEPALIVE,
+        timeout: float = HTTP_TIMEOUT_SECONDS,
+        retries: int = HTTP_RETRIES,
+        http2: bool = True,
+        cache_entries: int = GET_CACHE_MAX_ENTRIES,
+    ):
+        self.max_connections = max(1, max_connections)
+        self.max_keepalive = max(0, min(max_keepalive, self.max_connections))
+        self.timeout = httpx.Timeout(timeout, connect=min(timeout, HTTP_CONNECT_TIMEOUT_SECONDS))
+        self.retries = max(0, retries)
+        self.http2 = http2 and h2 is not None
+        self.cache_entries = cache_entries
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._stats: dict[str, HostStats] = {}
+        self._cache: OrderedDict[str, tuple[float, int, list[tuple[str, str]], bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="connector-http", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        """Run ``coro`` on the pool loop and block the calling thread until it finishes."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("ConnectorHttpPool.run called from the pool loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result(timeout)
+
+    async def call(self, coro: Coroutine[Any, Any, Any], timeout: float | None = HTTP_CALL_TIMEOUT_SECONDS) -> Any:
+        """Await ``coro`` on the pool loop from another event loop; it is cancelled after ``timeout`` seconds.
+
+        Only the request itself runs on the pool thread, so callers keep their own (possibly blocking)
+        work on their own loop.
+        """
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await asyncio.wait_for(coro, timeout)
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        finally:
+            future.cancel()
+
+    def _client(self, origin: str) -> httpx.AsyncClient:
+        client = self._clients.get(origin)
+        if client is None:
+            limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_keepalive, keepalive_expiry=HTTP_KEEPALIVE_SECONDS)
+            client = self._clients[origin] = httpx.AsyncClient(base_url=origin, http2=self.http2, limits=limits, timeout=self.timeout)
+        return client
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2**attempt))
+
+    def _cache_key(self, url: str, params: Any, headers: dict | None) -> str:
+        full = httpx.URL(url).copy_merge_params(params or {})
+        vary = sorted((k.lower(), v) for k, v in (headers or {}).items() if k.lower() in CACHE_VARY_HEADERS)
+        return hashlib.sha1(repr((str(full), vary)).encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str, url: str) -> httpx.Response | None:
+        with self._lock:
+            item = self._cache.get(key)
+            if item is None:
+                return None
+            expires_at, status, headers, content = item
+            if expires_at <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        return httpx.Response(status, headers=headers, content=content, request=httpx.Request("GET", url))
+
+    def _cache_put(self, key: str, response: httpx.Response, ttl: float) -> None:
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, response.status_code, list(response.headers.multi_items()), response.content)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: dict | None = None,
+        json: Any = None,
+        cache_ttl: float | None = None,
+    ) -> httpx.Response:
+        """Send through the origin's pooled client.
+
+        Idempotent methods retry transport errors and 429/5xx with full-jitter backoff (``Retry-After``
+        wins when present); other methods only retry failed connects, which never reached the server.
+        Successful GETs are cached for ``cache_ttl`` seconds, or the response's ``max-age`` when omitted.
+        """
+        if asyncio.get_running_loop() is not self._loop:
+            raise RuntimeError("Connector HTTP requests must run on the pool loop; use ConnectorHttpPool.run")
+        method = method.upper()
+        origin = _origin(url)
+        stats = self._stats.setdefault(origin, HostStats())
+        cache_key = self._cache_key(url, params, headers) if method == "GET" else None
+        if cache_key is not None and (cached := self._cache_get(cache_key, url)) is not None:
+            stats.cache_hits += 1
+            return cached
+
+        client = self._client(origin)
+        idempotent = method in IDEMPOTENT_METHODS
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            stats.requests += 1
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            try:
+                response = await client.request(method, url, params=params, headers=headers, json=json)
+            except httpx.TransportError as exc:
+                if last or not (idempotent or isinstance(exc, httpx.ConnectError)):
+                    stats.errors += 1
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if last or not idempotent or response.status_code not in RETRY_STATUSES:
+                    if response.is_error:
+                        stats.errors += 1
+                    elif cache_key is not None and (ttl := _cache_ttl(response, cache_ttl)) > 0:
+                        self._cache_put(cache_key, response, ttl)
+                    return response
+                retry_after = _retry_after(response)
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+            finally:
+                stats.in_flight -= 1
+            stats.retries += 1
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            cache_entries = len(self._cache)
+        hosts = {
+            origin: {
+                **asdict(stats),
+                "utilization": round(stats.in_flight / self.max_connections, 3),
+                "peak_utilization": round(stats.peak_in_flight / self.max_connections, 3),
+            }
+            for origin, stats in self._stats.items()
+        }
+        return {
+            "http2": self.http2,
+            "max_connections_per_host": self.max_connections,
+            "max_keepalive_per_host": self.max_keepalive,
+            "clients": len(self._clients),
+            "hosts": hosts,
+            "cache": {"entries": cache_entries, "max_entries": self.cache_entries, "hits": sum(s.cache_hits for s in self._stats.values())},
+        }
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        clients, self._clients = list(self._clients.values()), {}
+
+        async def shutdown() -> None:
+            await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+connector_http = ConnectorHttpPool()
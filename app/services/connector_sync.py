@@ -0,0 +1,417 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+import app.core.db as core_db
+from app.core import jsonutil
+from app.models import ConnectorInstance, ConnectorRecord, ConnectorRun, ConnectorType
+from app.services.connector_http import connector_http
+from app.services.intelligence import emit_event
+from app.services.job_dispatcher import dispatcher
+from app.services.keywords import batched
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_FETCHES = 4
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 30.0
+UPSERT_BATCH = 500
+# A running run whose heartbeat is older than this lost its worker and may be requeued.
+RUN_LEASE_SECONDS = int(os.getenv("CONNECTOR_RUN_LEASE_SECONDS", "600"))
+UPSERT_COLUMNS = ("tenant_id", "day", "name", "impressions", "clicks", "cost_cents", "conversions", "extra_json", "updated_at")
+
+
+class RetryableError(Exception):
+    """Transient upstream failure (rate limited, 5xx, timeout); ``retry_after`` overrides the backoff delay."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    record_type: str
+    external_id: str
+    day: date
+    name: str = ""
+    impressions: int = 0
+    clicks: int = 0
+    cost_cents: int = 0
+    conversions: int = 0
+    extra: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class FetchPage:
+    records: list[Record]
+    # Stored on the instance after the page is written; the next fetch resumes from it.
+    cursor: str
+    has_more: bool
+
+
+class AsyncRateLimiter:
+    """Token bucket shared by every sync of one connector in this process.
+
+    Callers reserve a token up front and sleep off any deficit, so no lock is held across awaits
+    and the limiter works from any event loop or worker thread.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Connector:
+    key = ""
+    rate_per_second = 5.0
+    burst = 5
+
+    def __init__(self):
+        self.limiter = AsyncRateLimiter(self.rate_per_second, self.burst)
+
+    async def fetch(self, cursor: str, config: Mapping[str, Any]) -> FetchPage:
+        raise NotImplementedError
+
+
+class HttpConnector(Connector):
+    """Base for connectors calling a real upstream; requests share the process-wide pooled clients.
+
+    Syncs run on the worker's own loop and only the HTTP round trip is handed to the pool loop.
+    """
+
+    base_url = ""
+
+    async def get_json(self, path: str, *, params: Any = None, headers: dict | None = None, cache_ttl: float | None = None) -> Any:
+        response = await connector_http.call(connector_http.get(f"{self.base_url}{path}", params=params, headers=headers, cache_ttl=cache_ttl))
+        if response.status_code == 429:
+            # The pool already retried; hand the quota window to the sync-level backoff.
+            raise RetryableError(f"{self.key} rate limited")
+        response.raise_for_status()
+        return response.json()
+
+
+async def with_backoff(call: Callable[[], Awaitable[Any]], retries: int = MAX_RETRIES) -> Any:
+    """Retry ``call`` on RetryableError with capped exponential backoff and full jitter."""
+    for attempt in range(retries + 1):
+        try:
+            return await call()
+        except RetryableError as exc:
+            if attempt == retries:
+                raise
+            delay = exc.retry_after if exc.retry_after is not None else random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+            await asyncio.sleep(delay)
+
+
+@dataclass(frozen=True)
+class FixtureSpec:
+    record_type: str
+    entities: tuple[str, ...]
+    impressions: tuple[int, int]
+    ctr: float
+    cpc_cents: int
+    cvr: float
+
+
+FIXTURE_DAYS = 28
+FIXTURE_PAGE_SIZE = 40
+
+
+class FakeConnector(Connector):
+    """Offline connector serving deterministic daily fixture rows for the last ``FIXTURE_DAYS`` days.
+
+    Only instances in ``fixture`` mode sync from it, and every row it yields carries ``source: fixture``.
+
+    Cursors are ``YYYY-MM-DD`` (everything up to that day is synced) or ``YYYY-MM-DD:offset`` mid-run.
+    ``transient_failures`` makes the first N fetches raise RetryableError to exercise backoff.
+    """
+
+    rate_per_second = 20.0
+    burst = 10
+
+    def __init__(self, key: str, spec: FixtureSpec, transient_failures: int = 0, today: date | None = None):
+        self.key = key
+        self.spec = spec
+        self.transient_failures = transient_failures
+        self.today = today
+        self.calls = 0
+        super().__init__()
+
+    def _record(self, day: date, entity: str) -> Record:
+        spec = self.spec
+        rng = random.Random(f"{self.key}:{entity}:{day.isoformat()}")
+        impressions = rng.randint(*spec.impressions)
+        clicks = int(impressions * spec.ctr * rng.uniform(0.6, 1.4))
+        conversions = int(clicks * spec.cvr * rng.uniform(0.5, 1.5))
+        extra = {"source": "fixture"}
+        if spec.record_type == "page_day":
+            extra["engaged_sessions"] = int(clicks * rng.uniform(0.4, 0.8))
+        elif spec.record_type == "query_day":
+            extra["position"] = round(rng.uniform(1.0, 30.0), 1)
+        return Record(
+            record_type=spec.record_type,
+            external_id=f"{entity}:{day.isoformat()}",
+            day=day,
+            name=entity,
+            impressions=impressions,
+            clicks=clicks,
+            cost_cents=clicks * spec.cpc_cents,
+            conversions=conversions,
+            extra=extra,
+        )
+
+    async def fetch(self, cursor: str, config: Mapping[str, Any]) -> FetchPage:
+        self.calls += 1
+        if self.calls <= self.transient_failures:
+            raise RetryableError("fixture rate limit", retry_after=0)
+        last_day = (self.today or date.today()) - timedelta(days=1)
+        since_raw, _, offset_raw = (cursor or "").partition(":")
+        since = date.fromisoformat(since_raw) if since_raw else last_day - timedelta(days=FIXTURE_DAYS)
+        offset = int(offset_raw or 0)
+        keys = [(since + timedelta(days=d), entity) for d in range(1, (last_day - since).days + 1) for entity in self.spec.entities]
+        chunk = keys[offset : offset + FIXTURE_PAGE_SIZE]
+        await asyncio.sleep(0)
+        if offset + FIXTURE_PAGE_SIZE < len(keys):
+            return FetchPage([self._record(*k) for k in chunk], f"{since.isoformat()}:{offset + FIXTURE_PAGE_SIZE}", True)
+        return FetchPage([self._record(*k) for k in chunk], max(since, last_day).isoformat(), False)
+
+
+FIXTURES = {
+    "google_ads": FixtureSpec("campaign_day", ("Brand Search", "Generic Search", "Performance Max"), (800, 6000), 0.05, 320, 0.045),
+    "meta_ads": FixtureSpec("campaign_day", ("Prospecting", "Retargeting", "Lookalike"), (5000, 40000), 0.012, 110, 0.022),
+    # GA4 reports sessions rather than impressions; ctr 1.0 makes clicks the session count.
+    "ga4": FixtureSpec("page_day", ("/", "/services", "/pricing", "/contact", "/blog"), (200, 2500), 1.0, 0, 0.03),
+    "search_console": FixtureSpec("query_day", ("agency near me", "seo services", "ppc management", "local marketing agency"), (100, 3000), 0.04, 0, 0.0),
+}
+
+# Real upstream connectors by type key, added with ``register``; "api" instances of other types keep the manual path.
+CONNECTORS: dict[str, Connector] = {}
+FIXTURE_CONNECTORS: dict[str, Connector] = {key: FakeConnector(key, spec) for key, spec in FIXTURES.items()}
+
+
+def register(connector: Connector) -> Connector:
+    CONNECTORS[connector.key] = connector
+    return connector
+
+
+def connector_for(mode: str, key: str) -> Connector | None:
+    if mode == "api":
+        return CONNECTORS.get(key)
+    if mode == "fixture":
+        return FIXTURE_CONNECTORS.get(key)
+    return None
+
+
+def _upsert(db: Session, rows: list[dict]) -> None:
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    for batch in batched(rows, UPSERT_BATCH):
+        stmt = dialect.insert(ConnectorRecord.__table__).values(batch)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["connector_instance_id", "record_type", "external_id"],
+                set_={column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+            )
+        )
+
+
+def write_page(db: Session, instance: ConnectorInstance, page: FetchPage) -> int:
+    """Upsert one page and advance the instance cursor in the same transaction."""
+    now = datetime.utcnow()
+    rows = {
+        (r.record_type, r.external_id): {
+            "tenant_id": instance.tenant_id,
+            "connector_instance_id": instance.id,
+            "record_type": r.record_type,
+            "external_id": r.external_id[:255],
+            "day": r.day,
+            "name": r.name[:255],
+            "impressions": int(r.impressions),
+            "clicks": int(r.clicks),
+            "cost_cents": int(r.cost_cents),
+            "conversions": int(r.conversions),
+            "extra_json": jsonutil.dumps(dict(r.extra)),
+            "updated_at": now,
+        }
+        for r in page.records
+    }
+    if rows:
+        _upsert(db, list(rows.values()))
+    instance.sync_cursor = page.cursor[:255]
+    db.commit()
+    return len(rows)
+
+
+async def sync_instance(db: Session, instance: ConnectorInstance, connector: Connector, run: ConnectorRun | None = None) -> tuple[int, int]:
+    """Page through the connector from the stored cursor; returns ``(records, pages)``.
+
+    Pages are committed as they arrive, so a failed run resumes where it stopped; each commit
+    also renews ``run``'s heartbeat.
+    """
+    config = jsonutil.loads(instance.config_json or "{}")
+    records = pages = 0
+    while True:
+        cursor = instance.sync_cursor or ""
+
+        async def fetch() -> FetchPage:
+            await connector.limiter.acquire()
+            return await connector.fetch(cursor, config)
+
+        page = await with_backoff(fetch)
+        if run is not None:
+            run.heartbeat_at = datetime.utcnow()
+        # No await between the write and the commit, so other syncs on this loop never see half a page.
+        records += write_page(db, instance, page)
+        pages += 1
+        if not page.has_more:
+            instance.last_synced_at = datetime.utcnow()
+            db.commit()
+            return records, pages
+
+
+def _finish(db: Session, run: ConnectorRun, instance: ConnectorInstance, status: str, log: str, records: int = 0) -> None:
+    run.status = status
+    run.log = log[:2000]
+    run.records_synced = records
+    run.ended_at = datetime.utcnow()
+    emit_event(
+        db,
+        tenant_id=run.tenant_id,
+        event_type=f"connector_run_{status}",
+        entity_type="connector_run",
+        entity_id=run.id,
+        severity="info" if status == "succeeded" else "high",
+        title=f"Connector run {'completed' if status == 'succeeded' else 'failed'}: {instance.name}",
+        detail={"detail": run.log},
+    )
+    db.commit()
+
+
+async def _run_all(db: Session, claimed: list[tuple[ConnectorRun, ConnectorInstance, str]]) -> None:
+    gate = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def one(run: ConnectorRun, instance: ConnectorInstance, key: str) -> None:
+        connector = connector_for(instance.mode, key)
+        if connector is None:
+            reason = "Manual mode" if instance.mode == "manual" else f"No {instance.mode} connector for {key}"
+            _finish(db, run, instance, "succeeded", f"{reason}; manual run recorded.")
+            return
+        async with gate:
+            try:
+                records, pages = await sync_instance(db, instance, connector, run)
+            except Exception as exc:
+                logger.warning("Connector run %s failed: %s", run.id, exc)
+                db.rollback()
+                _finish(db, run, instance, "failed", f"Sync failed at cursor {instance.sync_cursor or '(start)'}: {exc}")
+                return
+        _finish(db, run, instance, "succeeded", f"Synced {records} records in {pages} pages; cursor {instance.sync_cursor}.", records)
+
+    await asyncio.gather(*(one(*item) for item in claimed))
+
+
+def _claim(db: Session, tenant_id: int) -> list[tuple[ConnectorRun, ConnectorInstance, str]]:
+    queued = db.execute(
+        select(ConnectorRun.id, ConnectorRun.connector_instance_id).where(ConnectorRun.tenant_id == tenant_id, ConnectorRun.status == "queued").order_by(ConnectorRun.id)
+    ).all()
+    other = aliased(ConnectorRun)
+    busy = select(other.id).where(other.connector_instance_id == ConnectorRun.connector_instance_id, other.status == "running").exists()
+    claimed = []
+    for run_id, instance_id in queued:
+        now = datetime.utcnow()
+        # Lock the instance so the busy check and the claim are atomic across processes.
+        db.execute(select(ConnectorInstance.id).where(ConnectorInstance.id == instance_id).with_for_update())
+        # Guarded update so two workers never sync the same run, nor two runs of one instance on the same cursor.
+        result = db.execute(update(ConnectorRun).where(ConnectorRun.id == run_id, ConnectorRun.status == "queued", ~busy).values(status="running", started_at=now, heartbeat_at=now))
+        if result.rowcount == 1:
+            claimed.append(run_id)
+        else:
+            db.execute(
+                update(ConnectorRun)
+                .where(ConnectorRun.id == run_id, ConnectorRun.status == "queued")
+                .values(status="skipped", log="Another run of this connector was already in progress.", ended_at=now)
+            )
+        db.commit()
+    if not claimed:
+        return []
+    rows = db.execute(
+        select(ConnectorRun, ConnectorInstance, ConnectorType.key)
+        .join(ConnectorInstance, ConnectorInstance.id == ConnectorRun.connector_instance_id)
+        .join(ConnectorType, ConnectorType.id == ConnectorInstance.connector_type_id)
+        .where(ConnectorRun.id.in_(claimed))
+        .order_by(ConnectorRun.id)
+    ).all()
+    return [tuple(row) for row in rows]
+
+
+def run_connector_syncs(run_id: int) -> None:
+    """Dispatcher handler: sync every queued run of the tenant concurrently.
+
+    Runs queued together coalesce into the first handler; later handlers find nothing left to claim.
+    """
+    db = core_db.SessionLocal()
+    try:
+        tenant_id = db.scalar(select(ConnectorRun.tenant_id).where(ConnectorRun.id == run_id))
+        if tenant_id is None:
+            return
+        claimed = _claim(db, tenant_id)
+        if claimed:
+            # The worker's own loop: DB commits block here, never on the shared HTTP pool thread.
+            asyncio.run(_run_all(db, claimed))
+    finally:
+        db.close()
+
+
+def enqueue_connector_runs(db: Session, tenant_id: int, instances: list[ConnectorInstance]) -> list[ConnectorRun]:
+    runs = [ConnectorRun(tenant_id=tenant_id, connector_instance_id=instance.id, status="queued", log="Queued.") for instance in instances]
+    db.add_all(runs)
+    db.commit()
+    for run in runs:
+        dispatcher.submit(tenant_id, run.id, run_connector_syncs)
+    return runs
+
+
+def requeue_connector_runs() -> int:
+    db = core_db.SessionLocal()
+    try:
+        # A run whose worker died resumes from the cursor its last committed page stored; runs
+        # with a fresh heartbeat belong to a live worker in another process and are left alone.
+        stale = datetime.utcnow() - timedelta(seconds=RUN_LEASE_SECONDS)
+        db.execute(
+            update(ConnectorRun)
+            .where(ConnectorRun.status == "running", func.coalesce(ConnectorRun.heartbeat_at, ConnectorRun.started_at, ConnectorRun.created_at) < stale)
+            .values(status="queued")
+        )
+        db.commit()
+        pending = db.execute(select(ConnectorRun.id, ConnectorRun.tenant_id).where(ConnectorRun.status == "queued").order_by(ConnectorRun.id)).all()
+    finally:
+        db.close()
+    for run_id, tenant_id in pending:
+        dispatcher.submit(tenant_id, run_id, run_connector_syncs)
+    return len(pending)
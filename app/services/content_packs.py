@@ -0,0 +1,134 @@
+import hashlib
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import app.core.db as core_db
+from app.core import jsonutil
+from app.models import Client, ContentPack, Job, MarketingCampaign, MarketingKeyword
+from app.services.intelligence import emit_event
+from app.services.job_dispatcher import claim_job, dispatcher, requeue_jobs
+from app.services.keyword_similarity import cluster_keywords
+from app.services.keywords import batched
+from app.services.marketing import content_pack, normalize_website_url, parse_handles, thaw
+
+JOB_KIND = "content_packs"
+CAMPAIGN_BATCH = 50
+# seo_content_pack only reads the first five keywords, so clusters sharing them share a cache entry.
+PACK_KEYWORDS = 5
+
+
+def pack_cache_key(client_name: str, website_url: str, social_handles: list[str], objective: str, cluster_name: str, keywords: list[str]) -> str:
+    raw = jsonutil.dumps([client_name, website_url, social_handles, objective, cluster_name, keywords])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def campaign_clusters(keywords: list[str], objective: str) -> list[tuple[str, list[str]]]:
+    """``(name, keywords)`` per ad group; a campaign without keywords still gets one pack."""
+    groups = cluster_keywords(keywords) if keywords else []
+    return [(g["name"], g["keywords"]) for g in groups] or [(objective, [])]
+
+
+def enqueue_content_packs(db: Session, tenant_id: int, client_id: int | None = None) -> Job:
+    job = Job(tenant_id=tenant_id, kind=JOB_KIND, status="queued", progress=0, payload_json=jsonutil.dumps({"client_id": client_id}))
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    dispatcher.submit(tenant_id, job.id, run_content_pack_job)
+    return job
+
+
+def generate_content_packs(db: Session, job: Job, client_id: int | None = None) -> dict:
+    """Write one pack per campaign keyword cluster, skipping clusters whose inputs are unchanged.
+
+    Commits after every batch of campaigns so progress is visible and a failure keeps finished work.
+    """
+    clients = {
+        row.id: (row.name, normalize_website_url(row.website_url), parse_handles(row.social_handles))
+        for row in db.execute(select(Client.id, Client.name, Client.website_url, Client.social_handles).where(Client.tenant_id == job.tenant_id))
+    }
+    stmt = select(MarketingCampaign.id, MarketingCampaign.client_id, MarketingCampaign.name, MarketingCampaign.objective).where(
+        MarketingCampaign.tenant_id == job.tenant_id
+    )
+    if client_id is not None:
+        stmt = stmt.where(MarketingCampaign.client_id == client_id)
+    campaigns = db.execute(stmt.order_by(MarketingCampaign.id)).all()
+
+    stats = {"campaigns": len(campaigns), "written": 0, "unchanged": 0, "removed": 0}
+    done = 0
+    for batch in batched(campaigns, CAMPAIGN_BATCH):
+        ids = [c.id for c in batch]
+        keywords: dict[int, list[str]] = defaultdict(list)
+        for campaign_id, keyword in db.execute(
+            select(MarketingKeyword.campaign_id, MarketingKeyword.keyword).where(MarketingKeyword.campaign_id.in_(ids)).order_by(MarketingKeyword.id)
+        ):
+            keywords[campaign_id].append(keyword)
+        existing = {(row.campaign_id, row.cluster_index): row for row in db.scalars(select(ContentPack).where(ContentPack.campaign_id.in_(ids)))}
+
+        for campaign in batch:
+            client_name, website, handles = clients.get(campaign.client_id) or (campaign.name, "", [])
+            for index, (cluster_name, cluster) in enumerate(campaign_clusters(keywords[campaign.id], campaign.objective)):
+                key = pack_cache_key(client_name, website, handles, campaign.objective, cluster_name, cluster)
+                row = existing.pop((campaign.id, index), None)
+                if row is not None and row.cache_key == key:
+                    stats["unchanged"] += 1
+                    continue
+                if row is None:
+                    row = ContentPack(tenant_id=job.tenant_id, campaign_id=campaign.id, cluster_index=index)
+                    db.add(row)
+                pack = content_pack(client_name, website, handles, campaign.objective, cluster[:PACK_KEYWORDS])
+                row.client_id = campaign.client_id
+                row.cluster_name = cluster_name[:160]
+                row.objective = campaign.objective
+                row.keywords_json = jsonutil.dumps(cluster)
+                row.cache_key = key
+                row.pack_json = jsonutil.dumps(thaw(pack))
+                row.job_id = job.id
+                stats["written"] += 1
+        # Clusters that disappeared since the last run.
+        for row in existing.values():
+            db.delete(row)
+            stats["removed"] += 1
+
+        done += len(batch)
+        job.progress = min(99, done * 100 // len(campaigns))
+        # Renews the job lease even when the rounded progress did not move.
+        job.updated_at = datetime.utcnow()
+        db.commit()
+    return stats
+
+
+def run_content_pack_job(job_id: int) -> None:
+    db = core_db.SessionLocal()
+    try:
+        job = claim_job(db, job_id, JOB_KIND)
+        if not job:
+            return
+        params = jsonutil.loads(job.payload_json or "{}")
+        try:
+            stats = generate_content_packs(db, job, params.get("client_id"))
+            job.status = "succeeded"
+            job.progress = 100
+            emit_event(
+                db,
+                tenant_id=job.tenant_id,
+                event_type="content_packs_generated",
+                entity_type="tenant",
+                entity_id=job.tenant_id,
+                severity="info",
+                title=f"{stats['written']} content packs refreshed",
+                detail={"detail": f"{stats['campaigns']} campaigns · {stats['unchanged']} unchanged · {stats['removed']} removed"},
+            )
+        except Exception as exc:
+            db.rollback()
+            job.status = "failed"
+            job.error_message = str(exc)[:2000]
+        db.commit()
+    finally:
+        db.close()
+
+
+def requeue_content_pack_jobs() -> int:
+    return requeue_jobs(JOB_KIND, run_content_pack_job)
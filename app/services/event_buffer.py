@@ -0,0 +1,46 @@
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+BUFFER_KEY = "pending_history_rows"
+INSERT_CHUNK = 500
+
+
+def buffer_row(db: Session, table, values: dict) -> dict:
+    """Queue a history row on the session; it is bulk-inserted in the same transaction at commit.
+
+    Returns ``values`` as a handle. It has no primary key, and queries on the same session do not
+    see the row until commit or an explicit ``flush_buffered(db)``.
+    """
+    if not db.in_transaction():
+        db.begin()
+    db.info.setdefault(BUFFER_KEY, {}).setdefault(table, []).append(values)
+    return values
+
+
+def flush_buffered(db: Session) -> int:
+    """Insert buffered rows now, e.g. before reading them back inside the same transaction."""
+    pending = db.info.pop(BUFFER_KEY, None)
+    if not pending:
+        return 0
+    conn = db.connection()
+    written = 0
+    for table, rows in pending.items():
+        for start in range(0, len(rows), INSERT_CHUNK):
+            chunk = rows[start : start + INSERT_CHUNK]
+            conn.execute(insert(table).values(chunk))
+            written += len(chunk)
+    return written
+
+
+@event.listens_for(Session, "before_commit")
+def _write_buffer_before_commit(session: Session) -> None:
+    if session.info.get(BUFFER_KEY):
+        session.flush()
+        flush_buffered(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_buffer_on_end(session: Session, transaction) -> None:
+    # Commit has already drained the buffer; anything left belongs to a rolled back or closed transaction.
+    if transaction.parent is None:
+        session.info.pop(BUFFER_KEY, None)
@@ -0,0 +1,291 @@
+import csv
+import io
+import os
+import re
+import time
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import app.core.db as core_db
+from app.core import jsonutil
+from app.models import Activity, AuditLog, Deal, Event, Job, Task
+from app.services.job_dispatcher import claim_job, dispatcher, heartbeat_job, requeue_jobs
+
+EXPORT_FORMATS = ("csv", "xlsx")
+YIELD_PER = 1000
+JOB_KIND = "export"
+# Long exports renew their job lease this often so startup requeues leave them alone.
+HEARTBEAT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    model: type
+    columns: tuple[str, ...]
+    filters: tuple[str, ...]
+
+
+DATASETS = {
+    "tasks": ExportDataset(Task, ("id", "client_id", "project_id", "title", "status", "priority", "due_date", "completed_at", "created_at"), ("status", "priority", "client_id", "project_id")),
+    "deals": ExportDataset(Deal, ("id", "client_id", "stage_id", "title", "value_cents", "close_date", "probability_pct", "status", "created_at"), ("status", "client_id", "stage_id")),
+    "activities": ExportDataset(Activity, ("id", "client_id", "deal_id", "activity_type", "summary", "due_date", "status", "created_at"), ("status", "activity_type", "client_id", "deal_id")),
+    "events": ExportDataset(Event, ("id", "type", "entity_type", "entity_id", "severity", "title", "created_at"), ("type", "entity_type", "severity")),
+    "audit_log": ExportDataset(AuditLog, ("id", "actor_user_id", "entity_type", "entity_id", "action", "before_json", "after_json", "created_at"), ("entity_type", "action", "actor_user_id")),
+}
+
+
+class ExportError(ValueError):
+    pass
+
+
+def export_root() -> Path:
+    path = Path(os.getenv("EXPORT_ROOT", "data/exports"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def resolve_columns(dataset: ExportDataset, requested: str | None) -> list[str]:
+    if not requested:
+        return list(dataset.columns)
+    table_columns = set(dataset.model.__table__.c.keys()) - {"tenant_id"}
+    columns = [c.strip() for c in requested.split(",") if c.strip()]
+    unknown = [c for c in columns if c not in table_columns]
+    if unknown or not columns:
+        raise ExportError(f"Unknown columns: {', '.join(unknown) or '(none)'}")
+    return columns
+
+
+def build_query(tenant_id: int, dataset_name: str, columns: str | None = None, filters: dict | None = None, created_from: date | None = None, created_to: date | None = None):
+    dataset = DATASETS.get(dataset_name)
+    if dataset is None:
+        raise ExportError(f"Unknown dataset: {dataset_name}")
+    table = dataset.model.__table__
+    selected = resolve_columns(dataset, columns)
+    stmt = select(*[table.c[name] for name in selected]).where(table.c.tenant_id == tenant_id)
+    for key, value in (filters or {}).items():
+        if value in (None, ""):
+            continue
+        if key not in dataset.filters:
+            raise ExportError(f"Unsupported filter: {key}")
+        column = table.c[key]
+        if column.type.python_type is int:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ExportError(f"Filter {key} must be an integer")
+        stmt = stmt.where(column == value)
+    if created_from:
+        stmt = stmt.where(table.c.created_at >= datetime.combine(created_from, datetime.min.time()))
+    if created_to:
+        stmt = stmt.where(table.c.created_at < datetime.combine(created_to, datetime.max.time()))
+    return selected, stmt.order_by(table.c.id.asc())
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_rows(db: Session, stmt) -> Iterator[tuple]:
+    # yield_per streams from a server-side cursor where the driver supports it.
+    for partition in db.execute(stmt.execution_options(yield_per=YIELD_PER)).partitions():
+        yield from partition
+
+
+def stream_csv(db: Session, columns: list[str], stmt) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    count = 0
+    for row in iter_rows(db, stmt):
+        writer.writerow([_cell(v) for v in row])
+        count += 1
+        if count % YIELD_PER == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink; zipfile falls back to data descriptors when it cannot seek."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._written += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._written
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_XLSX_STATIC = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    ),
+}
+
+
+def _xlsx_row(values) -> str:
+    cells = []
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_INVALID_XML.sub("", _cell(value)))}</t></is></c>')
+    return f"<row>{''.join(cells)}</row>"
+
+
+def stream_xlsx(db: Session, columns: list[str], stmt) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, body in _XLSX_STATIC.items():
+            archive.writestr(name, body)
+        yield sink.drain()
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(columns).encode("utf-8"))
+            count = 0
+            for row in iter_rows(db, stmt):
+                sheet.write(_xlsx_row(row).encode("utf-8"))
+                count += 1
+                if count % YIELD_PER == 0:
+                    yield sink.drain()
+            sheet.write(b"</sheetData></worksheet>")
+    yield sink.drain()
+
+
+def stream_export(db: Session, fmt: str, columns: list[str], stmt) -> Iterator[bytes]:
+    if fmt == "xlsx":
+        return stream_xlsx(db, columns, stmt)
+    return stream_csv(db, columns, stmt)
+
+
+def export_params(dataset: str, fmt: str, columns: str | None, filters: dict, created_from: date | None, created_to: date | None) -> dict:
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f"Unknown format: {fmt}")
+    return {
+        "dataset": dataset,
+        "fmt": fmt,
+        "columns": columns,
+        "filters": {k: v for k, v in filters.items() if v not in (None, "")},
+        "created_from": created_from.isoformat() if created_from else None,
+        "created_to": created_to.isoformat() if created_to else None,
+    }
+
+
+def _query_from_params(tenant_id: int, params: dict):
+    return build_query(
+        tenant_id,
+        params["dataset"],
+        params.get("columns"),
+        params.get("filters"),
+        date.fromisoformat(params["created_from"]) if params.get("created_from") else None,
+        date.fromisoformat(params["created_to"]) if params.get("created_to") else None,
+    )
+
+
+def enqueue_export(db: Session, tenant_id: int, params: dict) -> Job:
+    _query_from_params(tenant_id, params)
+    job = Job(tenant_id=tenant_id, kind=JOB_KIND, status="queued", progress=0, payload_json=jsonutil.dumps(params))
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    dispatcher.submit(tenant_id, job.id, run_export_job)
+    return job
+
+
+def export_path(job: Job) -> Path:
+    params = jsonutil.loads(job.payload_json or "{}")
+    return export_root() / f"tenant_{job.tenant_id}" / f"{params.get('dataset', 'export')}-{job.id}.{params.get('fmt', 'csv')}"
+
+
+def run_export_job(job_id: int) -> None:
+    db = core_db.SessionLocal()
+    try:
+        job = claim_job(db, job_id, JOB_KIND)
+        if not job:
+            return
+        params = jsonutil.loads(job.payload_json)
+        path = export_path(job)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            columns, stmt = _query_from_params(job.tenant_id, params)
+            # Stream on a separate session so job status updates can commit independently.
+            reader = core_db.SessionLocal()
+            try:
+                beat = time.monotonic()
+                with tmp_path.open("wb") as f:
+                    for chunk in stream_export(reader, params["fmt"], columns, stmt):
+                        f.write(chunk)
+                        if time.monotonic() - beat >= HEARTBEAT_SECONDS:
+                            heartbeat_job(db, job.id)
+                            beat = time.monotonic()
+            finally:
+                reader.close()
+            os.replace(tmp_path, path)
+            job.status = "succeeded"
+            job.progress = 100
+        except Exception as exc:
+            tmp_path.unlink(missing_ok=True)
+            job.status = "failed"
+            job.error_message = str(exc)[:2000]
+        db.commit()
+    finally:
+        db.close()
+
+
+def requeue_export_jobs() -> int:
+    return requeue_jobs(JOB_KIND, run_export_job)
@@ -1,11 +1,16 @@
 import csv
-import json
+import hashlib
+import os
+import re
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
+from app.core import jsonutil
 from app.models import (
     Activity,
     Approval,
@@ -19,6 +24,12 @@ from app.models import (
     Task,
     WorkflowRun,
 )
+from app.services.event_buffer import buffer_row
+from app.services.rollups import period_bounds, period_snapshot
+
+# Superseded report artifacts stay on disk this long so in-flight downloads can finish.
+REPORT_ARTIFACT_GRACE_SECONDS = int(os.getenv("REPORT_ARTIFACT_GRACE_SECONDS", "86400"))
+_ARTIFACT_NAME = re.compile(r"^(?P<stamp>.+)-(?P<digest>[0-9a-f]{16})\.(?:html|csv)$")
 
 
 def emit_event(
@@ -31,19 +42,26 @@ def emit_event(
     severity: str,
     title: str,
     detail: dict | None = None,
-) -> Event:
-    row = Event(
-        tenant_id=tenant_id,
-        type=event_type,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        severity=severity,
-        title=title,
-        detail_json=json.dumps(detail or {}),
-        created_at=datetime.utcnow(),
+) -> dict:
+    """Buffer an event row for the current transaction and return its column values.
+
+    Unlike the ORM ``Event`` this used to return, the handle has no ``id`` and the row is not
+    queryable on ``db`` until commit; call ``flush_buffered(db)`` first to read it back earlier.
+    """
+    return buffer_row(
+        db,
+        Event.__table__,
+        {
+            "tenant_id": tenant_id,
+            "type": event_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "severity": severity,
+            "title": title,
+            "detail_json": jsonutil.dumps(detail or {}),
+            "created_at": datetime.utcnow(),
+        },
     )
-    db.add(row)
-    return row
 
 
 def audit_change(
@@ -56,19 +74,22 @@ def audit_change(
     action: str,
     before: dict | None = None,
     after: dict | None = None,
-) -> AuditLog:
-    row = AuditLog(
-        tenant_id=tenant_id,
-        actor_user_id=actor_user_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        before_json=json.dumps(before or {}),
-        after_json=json.dumps(after or {}),
-        created_at=datetime.utcnow(),
+) -> dict:
+    """Buffer an audit row like ``emit_event``: returns its column values, no ``id``, invisible until commit."""
+    return buffer_row(
+        db,
+        AuditLog.__table__,
+        {
+            "tenant_id": tenant_id,
+            "actor_user_id": actor_user_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": action,
+            "before_json": jsonutil.dumps(before or {}),
+            "after_json": jsonutil.dumps(after or {}),
+            "created_at": datetime.utcnow(),
+        },
     )
-    db.add(row)
-    return row
 
 
 @dataclass
@@ -165,40 +186,46 @@ def compute_client_health(db: Session, tenant_id: int, client_id: int) -> Health
     return HealthScore(client_id=client_id, score=final_score, risk_level=risk_level, drivers=drivers[:4], opportunities=opp_drivers[:3])
 
 
-def weekly_snapshot(db: Session, tenant_id: int, report_date: date) -> dict:
-    week_start = report_date - timedelta(days=7)
-    mrr_total = sum(x.mrr_cents for x in db.query(ClientFinancial).filter(ClientFinancial.tenant_id == tenant_id).all())
-    pipeline_14d = (
-        db.query(Deal)
-        .filter(Deal.tenant_id == tenant_id, Deal.close_date.is_not(None), Deal.close_date <= report_date + timedelta(days=14))
-        .all()
-    )
-    pipeline_value = sum(x.value_cents for x in pipeline_14d)
-    blocked_items = db.query(Approval).filter(Approval.tenant_id == tenant_id, Approval.status == "pending").count()
-    wins = (
-        db.query(WorkflowRun)
-        .filter(WorkflowRun.tenant_id == tenant_id, WorkflowRun.status == "succeeded", WorkflowRun.created_at >= datetime.combine(week_start, datetime.min.time()))
-        .count()
-    )
-    recent_events = db.query(Event).filter(Event.tenant_id == tenant_id).order_by(Event.created_at.desc()).limit(20).all()
-    top_risks = [x.title for x in recent_events if x.severity in {"high", "critical"}][:5]
+def weekly_snapshot(db: Session, tenant_id: int, report_date: date, period: str = "week") -> dict:
+    start, end = period_bounds(period, report_date)
+    snapshot = period_snapshot(db, tenant_id, start, end)
+    snapshot["period"] = period
+    return snapshot
 
-    return {
-        "report_date": report_date.isoformat(),
-        "mrr_total_cents": mrr_total,
-        "pipeline_14d_cents": pipeline_value,
-        "blocked_items": blocked_items,
-        "wins": wins,
-        "top_risks": top_risks,
-    }
+
+def snapshot_digest(snapshot: dict) -> str:
+    return hashlib.sha256(jsonutil.dumps(snapshot).encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, write) -> None:
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def format_cents(cents: int | None) -> str:
+    """Dollar amount for report artifacts; ``n/a`` for a gauge that was never recorded."""
+    return "n/a" if cents is None else f"${cents / 100:.2f}"
+
+
+def report_root() -> Path:
+    return Path(os.getenv("REPORT_ROOT", "data/reports"))
 
 
 def write_weekly_artifacts(tenant_id: int, snapshot: dict) -> tuple[Path, Path]:
-    out_dir = Path("data") / "reports" / f"tenant_{tenant_id}"
+    out_dir = report_root() / f"tenant_{tenant_id}"
     out_dir.mkdir(parents=True, exist_ok=True)
-    stamp = snapshot["report_date"]
-    html_path = out_dir / f"{stamp}.html"
-    csv_path = out_dir / f"{stamp}.csv"
+    period = snapshot.get("period", "week")
+    stamp = snapshot["report_date"] if period == "week" else f"{period}_{snapshot['report_date']}"
+    digest = snapshot_digest(snapshot)[:16]
+    html_path = out_dir / f"{stamp}-{digest}.html"
+    csv_path = out_dir / f"{stamp}-{digest}.csv"
+    if html_path.exists() and csv_path.exists():
+        return html_path, csv_path
 
     html = f"""
 <!DOCTYPE html>
@@ -206,7 +233,7 @@ def write_weekly_artifacts(tenant_id: int, snapshot: dict) -> tuple[Path, Path]:
 <body>
   <h1>Weekly Command Snapshot ({stamp})</h1>
   <ul>
-    <li>MRR Total: ${snapshot['mrr_total_cents']/100:.2f}</li>
+    <li>MRR Total: {format_cents(snapshot['mrr_total_cents'])}</li>
     <li>Pipeline &lt;14d: ${snapshot['pipeline_14d_cents']/100:.2f}</li>
     <li>Blocked approvals: {snapshot['blocked_items']}</li>
     <li>Workflow wins: {snapshot['wins']}</li>
@@ -215,15 +242,45 @@ def write_weekly_artifacts(tenant_id: int, snapshot: dict) -> tuple[Path, Path]:
   <ul>{"".join(f"<li>{x}</li>" for x in snapshot["top_risks"])}</ul>
 </body></html>
 """.strip()
-    html_path.write_text(html, encoding="utf-8")
+    _atomic_write(html_path, lambda f: f.write(html))
 
-    with csv_path.open("w", encoding="utf-8", newline="") as f:
+    def _write_csv(f) -> None:
         writer = csv.writer(f)
         writer.writerow(["metric", "value"])
         writer.writerow(["report_date", snapshot["report_date"]])
-        writer.writerow(["mrr_total_cents", snapshot["mrr_total_cents"]])
+        writer.writerow(["mrr_total_cents", "n/a" if snapshot["mrr_total_cents"] is None else snapshot["mrr_total_cents"]])
         writer.writerow(["pipeline_14d_cents", snapshot["pipeline_14d_cents"]])
         writer.writerow(["blocked_items", snapshot["blocked_items"]])
         writer.writerow(["wins", snapshot["wins"]])
+
+    _atomic_write(csv_path, _write_csv)
+    # Superseded artifacts may still be streaming to another request; prune_report_artifacts removes them later.
     return html_path, csv_path
 
+
+def prune_report_artifacts(*, now: float | None = None, grace_seconds: int = REPORT_ARTIFACT_GRACE_SECONDS) -> int:
+    """Delete report artifacts superseded by a newer digest for the same stamp more than ``grace_seconds`` ago."""
+    root = report_root()
+    if not root.is_dir():
+        return 0
+    cutoff = (now if now is not None else time.time()) - grace_seconds
+    removed = 0
+    for tenant_dir in root.glob("tenant_*"):
+        by_stamp: dict[str, dict[str, list[Path]]] = {}
+        for path in tenant_dir.iterdir():
+            match = _ARTIFACT_NAME.match(path.name)
+            if match:
+                by_stamp.setdefault(match["stamp"], {}).setdefault(match["digest"], []).append(path)
+        for digests in by_stamp.values():
+            if len(digests) < 2:
+                continue
+            mtimes = {digest: max(p.stat().st_mtime for p in paths) for digest, paths in digests.items()}
+            latest = max(mtimes, key=mtimes.get)
+            for digest, paths in digests.items():
+                # The newer digest's write time is when this one stopped being served.
+                if digest == latest or mtimes[latest] > cutoff:
+                    continue
+                for path in paths:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+    return removed
@@ -0,0 +1,284 @@
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+import app.core.db as core_db
+from app.core.config import get_settings
+from app.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedJob:
+    tenant_id: int
+    job_id: int
+    handler: Callable[[int], None]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class TenantQueueStats:
+    dispatched: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    rejected_runs: int = 0
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class TenantRateLimiter:
+    def __init__(self, per_minute: int, burst: int):
+        self.rate = max(0, per_minute) / 60.0
+        self.burst = burst
+        self._buckets: dict[int, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, tenant_id: int) -> bool:
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            bucket = self._buckets.get(tenant_id)
+            if bucket is None:
+                bucket = self._buckets[tenant_id] = TokenBucket(self.rate, self.burst)
+            return bucket.take(time.monotonic())
+
+
+def parse_tenant_limits(raw: str) -> dict[int, tuple[int | None, int | None]]:
+    """Parse ``tenant_id:concurrency[:weight]`` pairs, e.g. ``"7:4:2,9:1"``."""
+    limits: dict[int, tuple[int | None, int | None]] = {}
+    for part in (raw or "").split(","):
+        bits = [x.strip() for x in part.split(":")]
+        if len(bits) < 2 or not all(x.isdigit() for x in bits if x):
+            continue
+        tenant_id = int(bits[0])
+        concurrency = int(bits[1]) if bits[1] else None
+        weight = int(bits[2]) if len(bits) > 2 and bits[2] else None
+        limits[tenant_id] = (concurrency, weight)
+    return limits
+
+
+def claim_job(db: Session, job_id: int, kind: str) -> Job | None:
+    """Move a queued job to running; ``None`` when another worker or process already claimed it.
+
+    Every process resubmits queued jobs at startup, so a job can sit in several in-memory queues.
+    """
+    result = db.execute(update(Job).where(Job.id == job_id, Job.kind == kind, Job.status == "queued").values(status="running", updated_at=datetime.utcnow()))
+    db.commit()
+    if result.rowcount != 1:
+        return None
+    return db.get(Job, job_id)
+
+
+def heartbeat_job(db: Session, job_id: int) -> None:
+    """Renew a running job's lease (``updated_at``); a missed beat only shortens the lease, it never fails the job."""
+    try:
+        db.execute(update(Job).where(Job.id == job_id, Job.status == "running").values(updated_at=datetime.utcnow()))
+        db.commit()
+    except OperationalError:
+        db.rollback()
+
+
+def requeue_jobs(kind: str, handler: Callable[[int], None], *, lease_seconds: int | None = None) -> int:
+    """Resubmit queued jobs of ``kind`` at startup.
+
+    Running jobs are reclaimed only once their ``updated_at`` is older than the lease: a fresh one
+    belongs to a live worker in another process.
+    """
+    lease = get_settings().job_lease_seconds if lease_seconds is None else lease_seconds
+    db = core_db.SessionLocal()
+    try:
+        db.execute(
+            update(Job)
+            .where(Job.kind == kind, Job.status == "running", Job.updated_at < datetime.utcnow() - timedelta(seconds=lease))
+            .values(status="queued")
+        )
+        db.commit()
+        pending = db.query(Job.id, Job.tenant_id).filter(Job.kind == kind, Job.status == "queued").order_by(Job.id.asc()).all()
+    finally:
+        db.close()
+    for job_id, tenant_id in pending:
+        dispatcher.submit(tenant_id, job_id, handler)
+    return len(pending)
+
+
+class FairJobDispatcher:
+    """Deficit round robin across tenant queues with per-tenant concurrency caps.
+
+    With ``workers=0`` jobs run in the submitting thread (the sqlite/test default); any thread
+    that finishes a job keeps draining, so jobs held back by a concurrency cap are never stranded.
+    """
+
+    def __init__(self, *, workers: int = 0, default_concurrency: int = 2, default_weight: int = 1, tenant_limits: dict[int, tuple[int | None, int | None]] | None = None):
+        self.workers = workers
+        self.default_concurrency = max(1, default_concurrency)
+        self.default_weight = max(1, default_weight)
+        self.tenant_limits = tenant_limits or {}
+        self._queues: dict[int, deque[QueuedJob]] = {}
+        self._ring: deque[int] = deque()
+        self._deficit: dict[int, int] = {}
+        self._running: dict[int, int] = {}
+        self._stats: dict[int, TenantQueueStats] = {}
+        self._cond = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._stopping = False
+
+    def concurrency_for(self, tenant_id: int) -> int:
+        override = self.tenant_limits.get(tenant_id, (None, None))[0]
+        return max(1, override) if override else self.default_concurrency
+
+    def weight_for(self, tenant_id: int) -> int:
+        override = self.tenant_limits.get(tenant_id, (None, None))[1]
+        return max(1, override) if override else self.default_weight
+
+    def submit(self, tenant_id: int, job_id: int, handler: Callable[[int], None]) -> None:
+        with self._cond:
+            queue = self._queues.setdefault(tenant_id, deque())
+            if not queue and tenant_id not in self._ring:
+                self._ring.append(tenant_id)
+                self._deficit[tenant_id] = 0
+            queue.append(QueuedJob(tenant_id=tenant_id, job_id=job_id, handler=handler))
+            self._cond.notify()
+        if self.workers == 0:
+            self.drain()
+
+    def _pick(self) -> QueuedJob | None:
+        for _ in range(len(self._ring) * 2):
+            if not self._ring:
+                return None
+            tenant_id = self._ring[0]
+            queue = self._queues.get(tenant_id)
+            if not queue:
+                self._ring.popleft()
+                self._deficit.pop(tenant_id, None)
+                continue
+            if self._running.get(tenant_id, 0) >= self.concurrency_for(tenant_id):
+                self._ring.rotate(-1)
+                continue
+            if self._deficit.get(tenant_id, 0) < 1:
+                self._deficit[tenant_id] = self._deficit.get(tenant_id, 0) + self.weight_for(tenant_id)
+            item = queue.popleft()
+            self._deficit[tenant_id] -= 1
+            if not queue:
+                self._ring.popleft()
+                self._deficit.pop(tenant_id, None)
+            elif self._deficit[tenant_id] < 1:
+                self._ring.rotate(-1)
+            self._running[tenant_id] = self._running.get(tenant_id, 0) + 1
+            stats = self._stats.setdefault(tenant_id, TenantQueueStats())
+            waited = time.monotonic() - item.enqueued_at
+            stats.dispatched += 1
+            stats.total_wait_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+            return item
+        return None
+
+    def _run(self, item: QueuedJob) -> None:
+        try:
+            item.handler(item.job_id)
+        except Exception:
+            logger.exception("Job %s failed in dispatcher", item.job_id)
+        finally:
+            with self._cond:
+                self._running[item.tenant_id] = max(0, self._running.get(item.tenant_id, 0) - 1)
+                self._cond.notify_all()
+
+    def drain(self) -> int:
+        ran = 0
+        while True:
+            with self._cond:
+                item = self._pick()
+            if item is None:
+                return ran
+            self._run(item)
+            ran += 1
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                item = self._pick()
+                while item is None and not self._stopping:
+                    self._cond.wait(timeout=1.0)
+                    item = self._pick()
+                if item is None:
+                    return
+            self._run(item)
+
+    def start(self) -> None:
+        if self.workers == 0 or self._threads:
+            return
+        self._stopping = False
+        for idx in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{idx}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+    def record_rejection(self, tenant_id: int) -> None:
+        with self._cond:
+            self._stats.setdefault(tenant_id, TenantQueueStats()).rejected_runs += 1
+
+    def tenant_metrics(self, tenant_id: int) -> dict:
+        with self._cond:
+            queue = self._queues.get(tenant_id, deque())
+            stats = self._stats.get(tenant_id, TenantQueueStats())
+            now = time.monotonic()
+            return {
+                "tenant_id": tenant_id,
+                "queue_depth": len(queue),
+                "running": self._running.get(tenant_id, 0),
+                "concurrency_cap": self.concurrency_for(tenant_id),
+                "weight": self.weight_for(tenant_id),
+                "dispatched": stats.dispatched,
+                "avg_wait_seconds": round(stats.total_wait_seconds / stats.dispatched, 4) if stats.dispatched else 0.0,
+                "max_wait_seconds": round(stats.max_wait_seconds, 4),
+                "oldest_queued_seconds": round(now - queue[0].enqueued_at, 4) if queue else 0.0,
+                "rejected_runs": stats.rejected_runs,
+            }
+
+    def totals(self) -> dict:
+        with self._cond:
+            return {
+                "queue_depth": sum(len(q) for q in self._queues.values()),
+                "running": sum(self._running.values()),
+                "tenants_waiting": sum(1 for q in self._queues.values() if q),
+                "workers": self.workers,
+            }
+
+
+_settings = get_settings()
+dispatcher = FairJobDispatcher(
+    workers=_settings.job_workers,
+    default_concurrency=_settings.job_tenant_concurrency,
+    tenant_limits=parse_tenant_limits(_settings.job_tenant_limits),
+)
+run_rate_limiter = TenantRateLimiter(_settings.run_rate_per_minute, _settings.run_rate_burst)
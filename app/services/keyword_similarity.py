@@ -0,0 +1,288 @@
+import zlib
+from collections import Counter
+
+import numpy as np
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+import app.core.db as core_db
+from app.models import Job, KeywordLshBand, KeywordSignature, MarketingKeyword
+from app.services.job_dispatcher import claim_job, dispatcher, requeue_jobs
+from app.services.keywords import batched, normalize_keyword
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE = 3
+INDEX_BATCH = 2000
+JOB_KIND = "keyword_index"
+# near_duplicates scores at most this many candidate pairs per requested result, best band overlap first.
+DUPLICATE_CANDIDATES_PER_RESULT = 20
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20261019)
+_PERM_A = _rng.integers(1, int(_PRIME), NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, int(_PRIME), NUM_PERM, dtype=np.uint64)
+_BAND_MIX = _rng.integers(1, 1 << 62, ROWS_PER_BAND, dtype=np.uint64) | np.uint64(1)
+
+HASH_FEATURES = 2048
+MAX_CLUSTER_KEYWORDS = 2000
+DEFAULT_CLUSTER_THRESHOLD = 0.45
+_GROUP_NAME_SKIP = frozenset({"and", "for", "the", "near", "best", "with", "how", "what"})
+
+
+def _shingles(key: str) -> list[int]:
+    padded = f" {key} "
+    grams = {padded[i : i + SHINGLE] for i in range(max(1, len(padded) - SHINGLE + 1))}
+    return [zlib.crc32(g.encode("utf-8")) for g in grams]
+
+
+def signatures(keys: list[str]) -> np.ndarray:
+    """MinHash signatures, shape ``(len(keys), NUM_PERM)`` as uint32; equal fractions estimate Jaccard."""
+    if not keys:
+        return np.zeros((0, NUM_PERM), dtype=np.uint32)
+    hashed = [_shingles(k) for k in keys]
+    offsets = np.cumsum([0] + [len(h) for h in hashed[:-1]])
+    flat = np.fromiter((x for h in hashed for x in h), dtype=np.uint64)
+    # One (perm, shingle) matrix for the whole batch, reduced per keyword segment.
+    permuted = (_PERM_A[:, None] * flat[None, :] + _PERM_B[:, None]) % _PRIME
+    return np.minimum.reduceat(permuted, offsets, axis=1).T.astype(np.uint32)
+
+
+def band_buckets(sigs: np.ndarray) -> np.ndarray:
+    """LSH bucket per band, shape ``(n, BANDS)`` as int64 (uint64 mix reinterpreted for BigInteger columns)."""
+    banded = sigs.astype(np.uint64).reshape(len(sigs), BANDS, ROWS_PER_BAND)
+    # Integer overflow wraps silently, which is exactly the mixing wanted here.
+    return (banded * _BAND_MIX).sum(axis=2, dtype=np.uint64).view(np.int64)
+
+
+def _similarity(sig: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    return (candidates == sig).mean(axis=1)
+
+
+def refresh_index(db: Session, tenant_id: int) -> int:
+    """Sign and band every keyword of the tenant that is not indexed yet. The caller commits.
+
+    Keywords signed concurrently by another run are skipped, so overlapping runs never duplicate bands.
+    """
+    missing = db.execute(
+        select(MarketingKeyword.id, MarketingKeyword.campaign_id, MarketingKeyword.normalized)
+        .outerjoin(KeywordSignature, KeywordSignature.keyword_id == MarketingKeyword.id)
+        .where(MarketingKeyword.tenant_id == tenant_id, KeywordSignature.id.is_(None))
+        .order_by(MarketingKeyword.id)
+    ).all()
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    indexed = 0
+    for batch in batched(missing, INDEX_BATCH):
+        sigs = signatures([row.normalized for row in batch])
+        buckets = band_buckets(sigs)
+        signed = set(
+            db.scalars(
+                dialect.insert(KeywordSignature).on_conflict_do_nothing(index_elements=["keyword_id"]).returning(KeywordSignature.keyword_id),
+                [
+                    {"tenant_id": tenant_id, "keyword_id": row.id, "campaign_id": row.campaign_id, "signature": sigs[i].astype("<u4").tobytes()}
+                    for i, row in enumerate(batch)
+                ],
+            )
+        )
+        if not signed:
+            continue
+        db.execute(
+            insert(KeywordLshBand),
+            [
+                {"tenant_id": tenant_id, "keyword_id": row.id, "band": band, "bucket": int(buckets[i, band])}
+                for i, row in enumerate(batch)
+                if row.id in signed
+                for band in range(BANDS)
+            ],
+        )
+        indexed += len(signed)
+    return indexed
+
+
+def enqueue_keyword_index(db: Session, tenant_id: int) -> Job:
+    """Index new keywords in the background; a job still waiting in the queue already covers them."""
+    job = db.query(Job).filter(Job.tenant_id == tenant_id, Job.kind == JOB_KIND, Job.status == "queued").order_by(Job.id.asc()).first()
+    if job is not None:
+        return job
+    job = Job(tenant_id=tenant_id, kind=JOB_KIND, status="queued", progress=0, payload_json="{}")
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    dispatcher.submit(tenant_id, job.id, run_keyword_index_job)
+    return job
+
+
+def run_keyword_index_job(job_id: int) -> None:
+    db = core_db.SessionLocal()
+    try:
+        job = claim_job(db, job_id, JOB_KIND)
+        if not job:
+            return
+        try:
+            refresh_index(db, job.tenant_id)
+            job.status = "succeeded"
+            job.progress = 100
+        except Exception as exc:
+            db.rollback()
+            job.status = "failed"
+            job.error_message = str(exc)[:2000]
+        db.commit()
+    finally:
+        db.close()
+
+
+def requeue_keyword_index_jobs() -> int:
+    return requeue_jobs(JOB_KIND, run_keyword_index_job)
+
+
+def _load(rows) -> tuple[list, np.ndarray]:
+    rows = list(rows)
+    sigs = np.frombuffer(b"".join(r.signature for r in rows), dtype="<u4").reshape(len(rows), NUM_PERM) if rows else np.zeros((0, NUM_PERM), dtype=np.uint32)
+    return rows, sigs
+
+
+def similar_keywords(
+    db: Session,
+    tenant_id: int,
+    query: str,
+    *,
+    limit: int = 20,
+    min_similarity: float = 0.3,
+    exclude_campaign_id: int | None = None,
+) -> list[dict]:
+    """Indexed keywords whose estimated character-shingle Jaccard with ``query`` is at least ``min_similarity``."""
+    key = normalize_keyword(query)
+    if not key:
+        return []
+    sig = signatures([key])[0]
+    buckets = band_buckets(sig[None, :])[0]
+    band_match = or_(*(and_(KeywordLshBand.band == band, KeywordLshBand.bucket == int(bucket)) for band, bucket in enumerate(buckets)))
+    candidate_ids = select(KeywordLshBand.keyword_id).where(KeywordLshBand.tenant_id == tenant_id, band_match).distinct()
+    stmt = (
+        select(MarketingKeyword.id, MarketingKeyword.keyword, MarketingKeyword.normalized, MarketingKeyword.campaign_id, KeywordSignature.signature)
+        .join(KeywordSignature, KeywordSignature.keyword_id == MarketingKeyword.id)
+        .where(MarketingKeyword.tenant_id == tenant_id, MarketingKeyword.id.in_(candidate_ids))
+    )
+    if exclude_campaign_id is not None:
+        stmt = stmt.where(MarketingKeyword.campaign_id != exclude_campaign_id)
+    rows, sigs = _load(db.execute(stmt))
+    if not rows:
+        return []
+    scores = _similarity(sig, sigs)
+    order = np.argsort(-scores, kind="stable")
+    return [
+        {"keyword_id": rows[i].id, "keyword": rows[i].keyword, "campaign_id": rows[i].campaign_id, "similarity": round(float(scores[i]), 3)}
+        for i in order[: max(1, limit)]
+        if scores[i] >= min_similarity
+    ]
+
+
+def near_duplicates(db: Session, tenant_id: int, *, min_similarity: float = 0.8, limit: int = 100) -> list[dict]:
+    """Keyword pairs from different campaigns that share an LSH bucket and clear ``min_similarity``.
+
+    Candidate pairs are ranked by shared bands and capped in SQL, so only a bounded set is scored.
+    """
+    left, right = aliased(KeywordLshBand), aliased(KeywordLshBand)
+    left_sig, right_sig = aliased(KeywordSignature), aliased(KeywordSignature)
+    shared = func.count()
+    pairs = db.execute(
+        select(left.keyword_id, right.keyword_id)
+        .join(right, and_(right.tenant_id == left.tenant_id, right.band == left.band, right.bucket == left.bucket, right.keyword_id > left.keyword_id))
+        .join(left_sig, left_sig.keyword_id == left.keyword_id)
+        .join(right_sig, right_sig.keyword_id == right.keyword_id)
+        .where(left.tenant_id == tenant_id, left_sig.campaign_id != right_sig.campaign_id)
+        .group_by(left.keyword_id, right.keyword_id)
+        .order_by(shared.desc(), left.keyword_id, right.keyword_id)
+        .limit(max(1, limit) * DUPLICATE_CANDIDATES_PER_RESULT)
+    ).all()
+    if not pairs:
+        return []
+    ids = {kid for pair in pairs for kid in pair}
+    rows, sigs = _load(
+        db.execute(
+            select(MarketingKeyword.id, MarketingKeyword.keyword, MarketingKeyword.campaign_id, KeywordSignature.signature)
+            .join(KeywordSignature, KeywordSignature.keyword_id == MarketingKeyword.id)
+            .where(MarketingKeyword.id.in_(ids))
+        )
+    )
+    position = {row.id: i for i, row in enumerate(rows)}
+    pairs = [(position[a], position[b]) for a, b in pairs if a in position and b in position]
+    if not pairs:
+        return []
+    a_idx, b_idx = np.array(pairs).T
+    scores = (sigs[a_idx] == sigs[b_idx]).mean(axis=1)
+    order = np.argsort(-scores, kind="stable")
+    out = []
+    for i in order:
+        if scores[i] < min_similarity or len(out) >= limit:
+            break
+        a, b = rows[a_idx[i]], rows[b_idx[i]]
+        out.append(
+            {
+                "keyword": a.keyword,
+                "campaign_id": a.campaign_id,
+                "duplicate": b.keyword,
+                "duplicate_campaign_id": b.campaign_id,
+                "similarity": round(float(scores[i]), 3),
+            }
+        )
+    return out
+
+
+def _tfidf(keys: list[str]) -> np.ndarray:
+    """Row-normalized TF-IDF over hashed character 3/4-grams plus whole words."""
+    rows, cols = [], []
+    for i, key in enumerate(keys):
+        padded = f" {key} "
+        grams = [padded[j : j + n] for n in (3, 4) for j in range(max(1, len(padded) - n + 1))] + key.split()
+        rows.extend([i] * len(grams))
+        cols.extend(zlib.crc32(g.encode("utf-8")) % HASH_FEATURES for g in grams)
+    counts = np.zeros((len(keys), HASH_FEATURES), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+    df = np.count_nonzero(counts, axis=0)
+    idf = np.log((1.0 + len(keys)) / (1.0 + df)) + 1.0
+    weighted = np.log1p(counts) * idf.astype(np.float32)
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    return weighted / np.where(norms == 0, 1.0, norms)
+
+
+def _group_name(members: list[str]) -> str:
+    words = Counter(w for key in members for w in set(key.split()) if len(w) > 2 and w not in _GROUP_NAME_SKIP)
+    if not words:
+        return members[0]
+    top = [w for w, _ in words.most_common(2) if words[w] > 1 or len(members) == 1]
+    return " ".join(top) if top else members[0]
+
+
+def cluster_keywords(keywords: list[str], threshold: float = DEFAULT_CLUSTER_THRESHOLD) -> list[dict]:
+    """Ad-group proposals: the most central unassigned keyword repeatedly claims everything within ``threshold`` cosine."""
+    seen: dict[str, str] = {}
+    for keyword in keywords[:MAX_CLUSTER_KEYWORDS]:
+        key = normalize_keyword(keyword)
+        if key and key not in seen:
+            seen[key] = keyword
+    if not seen:
+        return []
+    keys = list(seen)
+    vectors = _tfidf(keys)
+    sim = vectors @ vectors.T
+    centrality = sim.sum(axis=1)
+    unassigned = np.ones(len(keys), dtype=bool)
+    groups = []
+    while unassigned.any():
+        leader = int(np.argmax(np.where(unassigned, centrality, -np.inf)))
+        members = np.flatnonzero(unassigned & (sim[leader] >= threshold))
+        unassigned[members] = False
+        ordered = members[np.argsort(-sim[leader, members], kind="stable")]
+        group_keys = [keys[i] for i in ordered]
+        groups.append(
+            {
+                "name": _group_name(group_keys),
+                "lead_keyword": seen[keys[leader]],
+                "keywords": [seen[k] for k in group_keys],
+                "cohesion": round(float(sim[np.ix_(members, members)].mean()), 3),
+            }
+        )
+    groups.sort(key=lambda g: -len(g["keywords"]))
+    return groups
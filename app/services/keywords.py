@@ -0,0 +1,136 @@
+import re
+import unicodedata
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models import TenantKeyword
+
+KEYWORD_MAX_LENGTH = 160
+KEYWORD_BATCH = 1000
+DEFAULT_EXPANSION_LIMIT = 10000
+MAX_EXPANSION_LIMIT = 100000
+MAX_NGRAM = 4
+MODIFIER_SLOT = "{kw}"
+
+_NON_WORD = re.compile(r"[^\w]+")
+# Words where dropping a trailing "s" would change the meaning.
+_STEM_EXCEPTIONS = frozenset({"news", "series", "species", "business", "glass", "gas", "bus", "yes", "this", "ads", "sms", "seo"})
+
+
+@lru_cache(maxsize=65536)
+def _stem(token: str) -> str:
+    """Light plural/possessive folding; deliberately conservative so distinct intents stay distinct."""
+    if len(token) <= 3 or token in _STEM_EXCEPTIONS or token.isdigit():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith(("sses", "shes", "ches", "xes", "zes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def normalize_keyword(text: str) -> str:
+    """Dedup key: NFKC, casefolded, punctuation as whitespace, plurals folded, single spaces."""
+    folded = unicodedata.normalize("NFKC", text or "").casefold().replace("'", "")
+    tokens = [_stem(t) for t in _NON_WORD.sub(" ", folded).replace("_", " ").split()]
+    return " ".join(tokens)[:KEYWORD_MAX_LENGTH]
+
+
+def dedupe_keywords(keywords: Iterable[str]) -> list[str]:
+    """Keep the first spelling of each normalized keyword, dropping blanks."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for keyword in keywords:
+        keyword = " ".join((keyword or "").split())
+        key = normalize_keyword(keyword)
+        if key and key not in seen:
+            seen.add(key)
+            out.append(keyword[:KEYWORD_MAX_LENGTH])
+    return out
+
+
+def _ngrams(tokens: list[str], max_ngram: int) -> Iterator[str]:
+    for size in range(min(max_ngram, len(tokens) - 1), 1, -1):
+        for start in range(len(tokens) - size + 1):
+            yield " ".join(tokens[start : start + size])
+
+
+def expand_keywords(
+    seeds: Iterable[str],
+    modifiers: Iterable[str] = (),
+    negatives: Iterable[str] = (),
+    *,
+    max_ngram: int = 3,
+    limit: int = DEFAULT_EXPANSION_LIMIT,
+) -> Iterator[tuple[str, str]]:
+    """Lazily yield ``(keyword, normalized)`` for seeds, their n-gram sub-phrases and modifier combos.
+
+    Seeds are consumed one at a time and the dedup set never holds more than ``limit`` keys,
+    so memory is bounded by the limit rather than by the size of the seed list.
+    """
+    modifiers = [" ".join(m.split()) for m in modifiers if m and m.strip()]
+    blocked = [f" {n} " for n in (normalize_keyword(n) for n in negatives) if n]
+    limit = max(0, min(int(limit), MAX_EXPANSION_LIMIT))
+    max_ngram = max(2, min(int(max_ngram), MAX_NGRAM))
+    seen: set[str] = set()
+    if not limit:
+        return
+    for seed in seeds:
+        tokens = (seed or "").split()
+        if not tokens:
+            continue
+        for base in (" ".join(tokens), *_ngrams(tokens, max_ngram)):
+            for modifier in ("", *modifiers):
+                if not modifier:
+                    keyword = base
+                elif MODIFIER_SLOT in modifier:
+                    keyword = modifier.replace(MODIFIER_SLOT, base)
+                else:
+                    keyword = f"{base} {modifier}"
+                key = normalize_keyword(keyword)
+                if not key or key in seen:
+                    continue
+                padded = f" {key} "
+                if any(neg in padded for neg in blocked):
+                    continue
+                seen.add(key)
+                yield keyword[:KEYWORD_MAX_LENGTH], key
+                if len(seen) >= limit:
+                    return
+
+
+def batched(items: Iterable, size: int = KEYWORD_BATCH) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _insert_ignore(db: Session, table):
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(table)
+
+
+def store_keywords(db: Session, tenant_id: int, keywords: Iterable[str | tuple[str, str]], source: str) -> int:
+    """Add keywords to the tenant's dedup index in batches; existing normalized keys are left untouched.
+
+    Returns the number of new rows. The caller commits.
+    """
+    inserted = 0
+    for batch in batched(keywords):
+        rows = {}
+        for item in batch:
+            keyword, key = item if isinstance(item, tuple) else (item, normalize_keyword(item))
+            if key and key not in rows:
+                rows[key] = {"tenant_id": tenant_id, "keyword": keyword[:KEYWORD_MAX_LENGTH], "normalized": key, "source": source}
+        if not rows:
+            continue
+        stmt = _insert_ignore(db, TenantKeyword.__table__).values(list(rows.values()))
+        result = db.execute(stmt.on_conflict_do_nothing(index_elements=["tenant_id", "normalized"]))
+        inserted += max(0, result.rowcount or 0)
+    return inserted
@@ -1,181 +1,22 @@
 import json
+from dataclasses import dataclass
+from functools import lru_cache
 from math import ceil
+from types import MappingProxyType
+from typing import Any, Mapping
 from urllib.parse import urlparse
 
+from app.services.keywords import dedupe_keywords
+from app.services.marketing_catalog import CATALOG
 
-PAID_PLATFORMS = [
-    "Google Ads",
-    "Meta Ads",
-    "LinkedIn Ads",
-    "Microsoft Ads",
-    "YouTube Ads",
-    "TikTok Ads",
-    "X Ads",
-    "Pinterest Ads",
-    "Reddit Ads",
-    "Snapchat Ads",
-]
-
-OBJECTIVES = ["Lead Generation", "Conversions", "Traffic", "Awareness", "Retargeting"]
-
-PLATFORM_CONFIG = {
-    "Google Ads": {
-        "objectives": ["Lead Generation", "Conversions", "Traffic", "Awareness", "Retargeting"],
-        "sub_options": {
-            "Lead Generation": ["Search Leads", "Call Leads", "Local Services Leads", "Performance Max Leads"],
-            "Conversions": ["Performance Max Sales", "Search Conversions", "Demand Gen Conversions"],
-            "Traffic": ["Search Traffic", "Display Traffic", "Demand Gen Traffic"],
-            "Awareness": ["Video Reach", "Display Reach", "Brand Lift"],
-            "Retargeting": ["Display Remarketing", "YouTube Remarketing", "RLSA Search Retargeting"],
-        },
-        "templates": [
-            "Local Lead Gen Search",
-            "Brand Protection Search",
-            "Competitor Conquest Search",
-            "Performance Max Full-Funnel",
-            "Display + YouTube Remarketing",
-        ],
-    },
-    "YouTube Ads": {
-        "objectives": ["Awareness", "Lead Generation", "Traffic", "Retargeting", "Conversions"],
-        "sub_options": {
-            "Awareness": ["Video Reach Campaign", "Non-Skippable Reach", "Bumper Reach", "Ad Sequence Storytelling"],
-            "Lead Generation": ["Video Action Leads", "Demand Gen Leads", "Lead Form Extension"],
-            "Traffic": ["Video Views", "In-Feed Traffic", "Demand Gen Clicks"],
-            "Retargeting": ["Viewer Retargeting", "Site Visitor Retargeting", "Cart Abandon Retargeting"],
-            "Conversions": ["Video Action Conversions", "Demand Gen Conversions"],
-        },
-        "templates": [
-            "Views Accelerator",
-            "Video Action Lead Gen",
-            "Reach Burst + Bumper",
-            "Sequential Story Campaign",
-            "Demand Gen Conversion Push",
-        ],
-    },
-    "Meta Ads": {
-        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions", "Retargeting"],
-        "sub_options": {
-            "Awareness": ["Reach", "Brand Awareness Video", "Advantage+ Awareness"],
-            "Traffic": ["Landing Page Views", "Engagement Traffic", "Click to Message"],
-            "Lead Generation": ["Instant Form Leads", "Website Leads", "Click to WhatsApp Leads"],
-            "Conversions": ["Sales Conversions", "Catalog Sales", "Advantage+ Shopping"],
-            "Retargeting": ["Website Visitors", "Engaged Audience", "Abandoned Checkout"],
-        },
-        "templates": [
-            "Instant Form Lead Gen",
-            "Click-to-WhatsApp Leads",
-            "Advantage+ Shopping",
-            "Creative Testing Sprint",
-            "Dynamic Retargeting Carousel",
-        ],
-    },
-    "LinkedIn Ads": {
-        "objectives": ["Lead Generation", "Awareness", "Traffic", "Conversions", "Retargeting"],
-        "sub_options": {
-            "Lead Generation": ["Lead Gen Forms", "Conversation Ads Lead Capture", "Event Registration Leads"],
-            "Awareness": ["Brand Awareness Sponsored Content", "Video Thought Leadership"],
-            "Traffic": ["Website Visits", "Document Ad Traffic", "Follower Growth"],
-            "Conversions": ["Website Conversions", "Demo Request Conversions"],
-            "Retargeting": ["Matched Audiences", "Website Retargeting", "Account-Based Retargeting"],
-        },
-        "templates": [
-            "B2B Lead Gen Form",
-            "Thought Leadership + Retarget",
-            "ABM Target Account Push",
-            "Webinar Registration Funnel",
-        ],
-    },
-    "Microsoft Ads": {
-        "objectives": ["Lead Generation", "Conversions", "Traffic", "Retargeting", "Awareness"],
-        "sub_options": {
-            "Lead Generation": ["Search Lead Capture", "Call Extensions Leads", "Local Service Leads"],
-            "Conversions": ["Search Conversions", "Performance Max Conversions", "Shopping Conversions"],
-            "Traffic": ["Search Traffic", "Audience Traffic"],
-            "Retargeting": ["Audience Remarketing", "Dynamic Remarketing"],
-            "Awareness": ["Audience Ads Awareness", "Native Reach"],
-        },
-        "templates": [
-            "Google Import + Improve",
-            "Bing Search Lead Gen",
-            "Microsoft Audience Retargeting",
-            "Shopping + Search Hybrid",
-        ],
-    },
-    "TikTok Ads": {
-        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions", "Retargeting"],
-        "sub_options": {
-            "Awareness": ["Reach", "Video Views", "Brand Lift"],
-            "Traffic": ["Landing Page Traffic", "Profile Visits", "App Traffic"],
-            "Lead Generation": ["Instant Form Leads", "Website Leads", "Message Leads"],
-            "Conversions": ["Website Conversions", "Catalog Sales", "App Conversions"],
-            "Retargeting": ["Viewer Retargeting", "Site Retargeting", "Cart Retargeting"],
-        },
-        "templates": [
-            "UGC Awareness Burst",
-            "TikTok Lead Form Sprint",
-            "Spark Ads Conversion Push",
-            "Creator Whitelist Retargeting",
-        ],
-    },
-    "X Ads": {
-        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions"],
-        "sub_options": {
-            "Awareness": ["Reach Campaign", "Video Views"],
-            "Traffic": ["Website Traffic", "App Clicks"],
-            "Lead Generation": ["Website Lead Capture", "DM Lead Capture"],
-            "Conversions": ["Website Conversions", "App Conversions"],
-        },
-        "templates": [
-            "Real-Time Event Traffic",
-            "Website Click Funnel",
-            "Video Views + Retarget",
-        ],
-    },
-    "Pinterest Ads": {
-        "objectives": ["Awareness", "Traffic", "Conversions"],
-        "sub_options": {
-            "Awareness": ["Brand Awareness", "Video Awareness"],
-            "Traffic": ["Consideration Traffic", "Search Traffic"],
-            "Conversions": ["Catalog Sales", "Checkout Conversions", "Lead Conversions"],
-        },
-        "templates": [
-            "Evergreen Pin Traffic",
-            "Shopping Catalog Conversions",
-            "Seasonal Planning Campaign",
-        ],
-    },
-    "Reddit Ads": {
-        "objectives": ["Awareness", "Traffic", "Conversions"],
-        "sub_options": {
-            "Awareness": ["Conversation Reach", "Community Awareness"],
-            "Traffic": ["Website Traffic", "Landing Page Clicks"],
-            "Conversions": ["Website Conversions", "Lead Submit Conversions"],
-        },
-        "templates": [
-            "Subreddit Interest Awareness",
-            "High-Intent Traffic Threads",
-            "Conversion Retargeting Wave",
-        ],
-    },
-    "Snapchat Ads": {
-        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions"],
-        "sub_options": {
-            "Awareness": ["Reach", "Story Views", "AR Lens Awareness"],
-            "Traffic": ["Website Traffic", "App Traffic"],
-            "Lead Generation": ["Instant Form Leads", "Message Leads"],
-            "Conversions": ["Website Conversions", "App Installs", "Catalog Sales"],
-        },
-        "templates": [
-            "Story Reach Blast",
-            "Lead Form Collection",
-            "App Install Growth",
-            "Snap Retargeting Recovery",
-        ],
-    },
-}
+PLAN_CACHE_SIZE = 512
+CONTENT_PACK_CACHE_SIZE = 1024
 
-PLATFORM_OBJECTIVES = {platform: config["objectives"] for platform, config in PLATFORM_CONFIG.items()}
+
+PAID_PLATFORMS = list(CATALOG.platforms)
+OBJECTIVES = list(CATALOG.objectives)
+PLATFORM_CONFIG = CATALOG.as_config()
+PLATFORM_OBJECTIVES = {name: list(spec.objectives) for name, spec in CATALOG.platforms.items()}
 
 
 def _keyword_seed_from_client(client_name: str) -> list[str]:
@@ -199,11 +40,10 @@ def keyword_suggestions(client_name: str, objective: str, existing: list[str] |
         for t in terms:
             combos.append(f"{b} {t}".strip())
     all_keywords = [*existing, *combos, *[f"{b} agency" for b in base]]
-    dedup = list(dict.fromkeys([k.strip() for k in all_keywords if k.strip()]))
-    return dedup[:20]
+    return dedupe_keywords(all_keywords)[:20]
 
 
-def campaign_plan(
+def _build_plan(
     platform: str,
     objective: str,
     budget_cents: int,
@@ -216,135 +56,29 @@ def campaign_plan(
     safe_days = max(1, days)
     daily_budget_cents = ceil(max(0, budget_cents) / safe_days)
 
-    bid_by_objective = {
-        "lead generation": "Maximize Conversions (with TCPA after 20-30 conversions)",
-        "conversions": "Maximize Conversion Value",
-        "traffic": "Maximize Clicks with CPC cap",
-        "awareness": "Target Impression Share / Reach",
-        "retargeting": "Maximize Conversions (Audience-only)",
-    }
-    objective_key = objective.lower()
-    bid_strategy = bid_by_objective.get(objective_key, "Maximize Conversions")
-
-    platform_profiles = {
-        "Google Ads": {
-            "campaign_type": "Search",
-            "recommended_networks": "Search + Retargeting",
-            "audience_setup": "Intent keywords + remarketing list",
-            "conversion_event": "Qualified lead form submit",
-            "attribution_window": "30-day click",
-            "placement_control": "Search partners OFF initially; Display OFF for lead-gen launch",
-        },
-        "Microsoft Ads": {
-            "campaign_type": "Search",
-            "recommended_networks": "Search + Audience retargeting",
-            "audience_setup": "Intent keywords + LinkedIn profile targeting",
-            "conversion_event": "Lead form submit / call",
-            "attribution_window": "30-day click",
-            "placement_control": "Audience network limited at launch",
-        },
-        "Meta Ads": {
-            "campaign_type": "Leads / Sales",
-            "recommended_networks": "Feeds + Stories + Reels",
-            "audience_setup": "Interest stack + lookalike + engaged retargeting",
-            "conversion_event": "Lead form submit / landing page conversion",
-            "attribution_window": "7-day click / 1-day view",
-            "placement_control": "Advantage+ placements with exclusions after week 1",
-        },
-        "LinkedIn Ads": {
-            "campaign_type": "Lead Gen Forms",
-            "recommended_networks": "Sponsored Content + Lead Gen Forms",
-            "audience_setup": "Job title + industry + company size filters",
-            "conversion_event": "Qualified lead form submit",
-            "attribution_window": "30-day click / 7-day view",
-            "placement_control": "Audience expansion OFF initially",
-        },
-        "YouTube Ads": {
-            "campaign_type": "Video Action / Demand Gen",
-            "recommended_networks": "YouTube In-Stream + In-Feed",
-            "audience_setup": "Custom intent + remarketing audiences",
-            "conversion_event": "Site lead / engaged view",
-            "attribution_window": "30-day click / engaged-view",
-            "placement_control": "Exclude kids content + low-quality placements",
-        },
-        "TikTok Ads": {
-            "campaign_type": "Traffic / Conversions",
-            "recommended_networks": "TikTok Feed",
-            "audience_setup": "Interest + behavior + website retargeting",
-            "conversion_event": "Lead submit / key page view",
-            "attribution_window": "7-day click / 1-day view",
-            "placement_control": "Automated creative ON, tighten after 3 days",
-        },
-        "X Ads": {
-            "campaign_type": "Website Traffic / Leads",
-            "recommended_networks": "Timeline placements",
-            "audience_setup": "Keyword + follower lookalike targeting",
-            "conversion_event": "Landing page lead",
-            "attribution_window": "30-day click",
-            "placement_control": "Brand safety exclusions enabled",
-        },
-        "Pinterest Ads": {
-            "campaign_type": "Consideration / Conversions",
-            "recommended_networks": "Home feed + search placements",
-            "audience_setup": "Interest + keyword + actalike",
-            "conversion_event": "Signup / checkout",
-            "attribution_window": "30-day click / 7-day view",
-            "placement_control": "Catalog + shopping disabled if no product feed",
-        },
-        "Reddit Ads": {
-            "campaign_type": "Traffic / Conversions",
-            "recommended_networks": "Feed placements",
-            "audience_setup": "Subreddit targeting + interest groups",
-            "conversion_event": "Lead submit / key action",
-            "attribution_window": "28-day click / 1-day view",
-            "placement_control": "Brand safety filter high",
-        },
-        "Snapchat Ads": {
-            "campaign_type": "Lead Gen / Conversions",
-            "recommended_networks": "Story + Spotlight placements",
-            "audience_setup": "Lifestyle + custom audience retargeting",
-            "conversion_event": "Lead submit",
-            "attribution_window": "7-day click / 1-day view",
-            "placement_control": "Auto-bid initially, cap after baseline CPA",
-        },
-    }
-    profile = platform_profiles.get(
-        platform,
-        {
-            "campaign_type": "Performance",
-            "recommended_networks": "Core placement + remarketing",
-            "audience_setup": "Local radius + in-market audiences",
-            "conversion_event": "Primary lead event",
-            "attribution_window": "30-day click",
-            "placement_control": "Start broad, then tighten by performance",
-        },
-    )
-    platform_config = PLATFORM_CONFIG.get(platform, {})
-    sub_options = platform_config.get("sub_options", {}).get(objective, [])
-    selected_sub_option = sub_option if sub_option in sub_options else (sub_options[0] if sub_options else "Standard")
-    template_library = platform_config.get("templates", [])
-    selected_template = template_name if template_name in template_library else (template_library[0] if template_library else "Standard Template")
+    selection = CATALOG.resolve(platform, objective, sub_option, template_name)
+    profile = selection.profile
 
     keyword_list = keyword_suggestions(client_name, objective, existing_keywords)
 
     return {
         "platform": platform,
         "objective": objective,
-        "sub_option": selected_sub_option,
-        "available_sub_options": sub_options,
-        "template_name": selected_template,
+        "sub_option": selection.sub_option,
+        "available_sub_options": list(selection.sub_options),
+        "template_name": selection.template,
         "total_budget_cents": budget_cents,
         "days": safe_days,
         "daily_budget_cents": daily_budget_cents,
-        "bid_strategy": bid_strategy,
-        "recommended_networks": profile["recommended_networks"],
-        "campaign_type": profile["campaign_type"],
-        "audience_setup": profile["audience_setup"],
-        "conversion_event": profile["conversion_event"],
-        "attribution_window": profile["attribution_window"],
-        "placement_control": profile["placement_control"],
+        "bid_strategy": selection.bid_strategy,
+        "recommended_networks": profile.recommended_networks,
+        "campaign_type": profile.campaign_type,
+        "audience_setup": profile.audience_setup,
+        "conversion_event": profile.conversion_event,
+        "attribution_window": profile.attribution_window,
+        "placement_control": profile.placement_control,
         "ad_set_count": 2 if safe_days <= 7 else 3,
-        "top_templates": template_library,
+        "top_templates": list(selection.templates),
         "keywords_suggested": keyword_list,
         "efficiency_checklist": [
             "Enable conversion tracking before launch",
@@ -362,6 +96,92 @@ def campaign_plan(
     }
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Deep-copy a frozen plan back into plain dicts and lists, e.g. before json.dumps."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignPlan:
+    data: Mapping[str, Any]
+    json_bytes: bytes
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_plan(
+    platform: str,
+    objective: str,
+    budget_cents: int,
+    days: int,
+    client_name: str,
+    existing_keywords: tuple[str, ...],
+    sub_option: str | None,
+    template_name: str | None,
+) -> CampaignPlan:
+    plan = _build_plan(platform, objective, budget_cents, days, client_name, list(existing_keywords), sub_option, template_name)
+    return CampaignPlan(data=_freeze(plan), json_bytes=json.dumps(plan, ensure_ascii=True).encode("ascii"))
+
+
+def plan_for(
+    platform: str,
+    objective: str,
+    budget_cents: int,
+    days: int,
+    client_name: str,
+    existing_keywords: list[str] | None = None,
+    sub_option: str | None = None,
+    template_name: str | None = None,
+) -> CampaignPlan:
+    # Normalize only in ways that cannot change the plan, so equivalent form posts share one entry.
+    keywords = tuple(k.strip() for k in existing_keywords or () if k.strip())
+    return _cached_plan(platform, objective, int(budget_cents), max(1, int(days)), client_name, keywords, sub_option or None, template_name or None)
+
+
+def campaign_plan(
+    platform: str,
+    objective: str,
+    budget_cents: int,
+    days: int,
+    client_name: str,
+    existing_keywords: list[str] | None = None,
+    sub_option: str | None = None,
+    template_name: str | None = None,
+) -> Mapping[str, Any]:
+    """Read-only plan; it is shared with every other caller asking for the same inputs."""
+    return plan_for(platform, objective, budget_cents, days, client_name, existing_keywords, sub_option, template_name).data
+
+
+def plan_summary(plan: Mapping[str, Any]) -> dict:
+    """Columns denormalized onto MarketingCampaign for list views."""
+    return {
+        "daily_budget_cents": int(plan.get("daily_budget_cents") or 0),
+        "bid_strategy": plan.get("bid_strategy") or "",
+        "sub_option": plan.get("sub_option") or "",
+        "template_name": plan.get("template_name") or "",
+    }
+
+
+def plan_cache_info() -> dict:
+    info = _cached_plan.cache_info()
+    return {"entries": info.currsize, "hits": info.hits, "misses": info.misses, "max_entries": info.maxsize}
+
+
+def clear_plan_cache() -> None:
+    _cached_plan.cache_clear()
+
+
 def parse_keywords(raw_keywords: str) -> list[str]:
     parts = [x.strip() for x in (raw_keywords or "").replace("\n", ",").split(",")]
     return [x for x in parts if x]
@@ -452,5 +272,24 @@ def seo_content_pack(client_name: str, website_url: str, social_handles: list[st
     }
 
 
+@lru_cache(maxsize=CONTENT_PACK_CACHE_SIZE)
+def _cached_content_pack(client_name: str, website_url: str, social_handles: tuple[str, ...], objective: str, keywords: tuple[str, ...]) -> Mapping[str, Any]:
+    return _freeze(seo_content_pack(client_name, website_url, list(social_handles), objective, list(keywords)))
+
+
+def content_pack(client_name: str, website_url: str, social_handles: list[str], objective: str, keywords: list[str]) -> Mapping[str, Any]:
+    """Read-only ``seo_content_pack``, memoized per (client, objective, keyword set)."""
+    return _cached_content_pack(client_name, website_url or "", tuple(social_handles), objective, tuple(keywords))
+
+
+def content_pack_cache_info() -> dict:
+    info = _cached_content_pack.cache_info()
+    return {"entries": info.currsize, "hits": info.hits, "misses": info.misses, "max_entries": info.maxsize}
+
+
+def clear_content_pack_cache() -> None:
+    _cached_content_pack.cache_clear()
+
+
 def campaign_plan_json(platform: str, objective: str, budget_cents: int, days: int, client_name: str, existing_keywords: list[str] | None = None) -> str:
-    return json.dumps(campaign_plan(platform, objective, budget_cents, days, client_name, existing_keywords), ensure_ascii=True)
+    return plan_for(platform, objective, budget_cents, days, client_name, existing_keywords).json_bytes.decode("ascii")
@@ -0,0 +1,437 @@
+"""Marketing platform catalog, compiled once at import into frozen, slotted lookup structures."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+_PLATFORM_ORDER = [
+    "Google Ads",
+    "Meta Ads",
+    "LinkedIn Ads",
+    "Microsoft Ads",
+    "YouTube Ads",
+    "TikTok Ads",
+    "X Ads",
+    "Pinterest Ads",
+    "Reddit Ads",
+    "Snapchat Ads",
+]
+
+_OBJECTIVE_ORDER = ["Lead Generation", "Conversions", "Traffic", "Awareness", "Retargeting"]
+
+_PLATFORM_SOURCE = {
+    "Google Ads": {
+        "objectives": ["Lead Generation", "Conversions", "Traffic", "Awareness", "Retargeting"],
+        "sub_options": {
+            "Lead Generation": ["Search Leads", "Call Leads", "Local Services Leads", "Performance Max Leads"],
+            "Conversions": ["Performance Max Sales", "Search Conversions", "Demand Gen Conversions"],
+            "Traffic": ["Search Traffic", "Display Traffic", "Demand Gen Traffic"],
+            "Awareness": ["Video Reach", "Display Reach", "Brand Lift"],
+            "Retargeting": ["Display Remarketing", "YouTube Remarketing", "RLSA Search Retargeting"],
+        },
+        "templates": [
+            "Local Lead Gen Search",
+            "Brand Protection Search",
+            "Competitor Conquest Search",
+            "Performance Max Full-Funnel",
+            "Display + YouTube Remarketing",
+        ],
+    },
+    "YouTube Ads": {
+        "objectives": ["Awareness", "Lead Generation", "Traffic", "Retargeting", "Conversions"],
+        "sub_options": {
+            "Awareness": ["Video Reach Campaign", "Non-Skippable Reach", "Bumper Reach", "Ad Sequence Storytelling"],
+            "Lead Generation": ["Video Action Leads", "Demand Gen Leads", "Lead Form Extension"],
+            "Traffic": ["Video Views", "In-Feed Traffic", "Demand Gen Clicks"],
+            "Retargeting": ["Viewer Retargeting", "Site Visitor Retargeting", "Cart Abandon Retargeting"],
+            "Conversions": ["Video Action Conversions", "Demand Gen Conversions"],
+        },
+        "templates": [
+            "Views Accelerator",
+            "Video Action Lead Gen",
+            "Reach Burst + Bumper",
+            "Sequential Story Campaign",
+            "Demand Gen Conversion Push",
+        ],
+    },
+    "Meta Ads": {
+        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions", "Retargeting"],
+        "sub_options": {
+            "Awareness": ["Reach", "Brand Awareness Video", "Advantage+ Awareness"],
+            "Traffic": ["Landing Page Views", "Engagement Traffic", "Click to Message"],
+            "Lead Generation": ["Instant Form Leads", "Website Leads", "Click to WhatsApp Leads"],
+            "Conversions": ["Sales Conversions", "Catalog Sales", "Advantage+ Shopping"],
+            "Retargeting": ["Website Visitors", "Engaged Audience", "Abandoned Checkout"],
+        },
+        "templates": [
+            "Instant Form Lead Gen",
+            "Click-to-WhatsApp Leads",
+            "Advantage+ Shopping",
+            "Creative Testing Sprint",
+            "Dynamic Retargeting Carousel",
+        ],
+    },
+    "LinkedIn Ads": {
+        "objectives": ["Lead Generation", "Awareness", "Traffic", "Conversions", "Retargeting"],
+        "sub_options": {
+            "Lead Generation": ["Lead Gen Forms", "Conversation Ads Lead Capture", "Event Registration Leads"],
+            "Awareness": ["Brand Awareness Sponsored Content", "Video Thought Leadership"],
+            "Traffic": ["Website Visits", "Document Ad Traffic", "Follower Growth"],
+            "Conversions": ["Website Conversions", "Demo Request Conversions"],
+            "Retargeting": ["Matched Audiences", "Website Retargeting", "Account-Based Retargeting"],
+        },
+        "templates": [
+            "B2B Lead Gen Form",
+            "Thought Leadership + Retarget",
+            "ABM Target Account Push",
+            "Webinar Registration Funnel",
+        ],
+    },
+    "Microsoft Ads": {
+        "objectives": ["Lead Generation", "Conversions", "Traffic", "Retargeting", "Awareness"],
+        "sub_options": {
+            "Lead Generation": ["Search Lead Capture", "Call Extensions Leads", "Local Service Leads"],
+            "Conversions": ["Search Conversions", "Performance Max Conversions", "Shopping Conversions"],
+            "Traffic": ["Search Traffic", "Audience Traffic"],
+            "Retargeting": ["Audience Remarketing", "Dynamic Remarketing"],
+            "Awareness": ["Audience Ads Awareness", "Native Reach"],
+        },
+        "templates": [
+            "Google Import + Improve",
+            "Bing Search Lead Gen",
+            "Microsoft Audience Retargeting",
+            "Shopping + Search Hybrid",
+        ],
+    },
+    "TikTok Ads": {
+        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions", "Retargeting"],
+        "sub_options": {
+            "Awareness": ["Reach", "Video Views", "Brand Lift"],
+            "Traffic": ["Landing Page Traffic", "Profile Visits", "App Traffic"],
+            "Lead Generation": ["Instant Form Leads", "Website Leads", "Message Leads"],
+            "Conversions": ["Website Conversions", "Catalog Sales", "App Conversions"],
+            "Retargeting": ["Viewer Retargeting", "Site Retargeting", "Cart Retargeting"],
+        },
+        "templates": [
+            "UGC Awareness Burst",
+            "TikTok Lead Form Sprint",
+            "Spark Ads Conversion Push",
+            "Creator Whitelist Retargeting",
+        ],
+    },
+    "X Ads": {
+        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions"],
+        "sub_options": {
+            "Awareness": ["Reach Campaign", "Video Views"],
+            "Traffic": ["Website Traffic", "App Clicks"],
+            "Lead Generation": ["Website Lead Capture", "DM Lead Capture"],
+            "Conversions": ["Website Conversions", "App Conversions"],
+        },
+        "templates": [
+            "Real-Time Event Traffic",
+            "Website Click Funnel",
+            "Video Views + Retarget",
+        ],
+    },
+    "Pinterest Ads": {
+        "objectives": ["Awareness", "Traffic", "Conversions"],
+        "sub_options": {
+            "Awareness": ["Brand Awareness", "Video Awareness"],
+            "Traffic": ["Consideration Traffic", "Search Traffic"],
+            "Conversions": ["Catalog Sales", "Checkout Conversions", "Lead Conversions"],
+        },
+        "templates": [
+            "Evergreen Pin Traffic",
+            "Shopping Catalog Conversions",
+            "Seasonal Planning Campaign",
+        ],
+    },
+    "Reddit Ads": {
+        "objectives": ["Awareness", "Traffic", "Conversions"],
+        "sub_options": {
+            "Awareness": ["Conversation Reach", "Community Awareness"],
+            "Traffic": ["Website Traffic", "Landing Page Clicks"],
+            "Conversions": ["Website Conversions", "Lead Submit Conversions"],
+        },
+        "templates": [
+            "Subreddit Interest Awareness",
+            "High-Intent Traffic Threads",
+            "Conversion Retargeting Wave",
+        ],
+    },
+    "Snapchat Ads": {
+        "objectives": ["Awareness", "Traffic", "Lead Generation", "Conversions"],
+        "sub_options": {
+            "Awareness": ["Reach", "Story Views", "AR Lens Awareness"],
+            "Traffic": ["Website Traffic", "App Traffic"],
+            "Lead Generation": ["Instant Form Leads", "Message Leads"],
+            "Conversions": ["Website Conversions", "App Installs", "Catalog Sales"],
+        },
+        "templates": [
+            "Story Reach Blast",
+            "Lead Form Collection",
+            "App Install Growth",
+            "Snap Retargeting Recovery",
+        ],
+    },
+}
+
+_PROFILE_SOURCE = {
+    "Google Ads": {
+        "campaign_type": "Search",
+        "recommended_networks": "Search + Retargeting",
+        "audience_setup": "Intent keywords + remarketing list",
+        "conversion_event": "Qualified lead form submit",
+        "attribution_window": "30-day click",
+        "placement_control": "Search partners OFF initially; Display OFF for lead-gen launch",
+    },
+    "Microsoft Ads": {
+        "campaign_type": "Search",
+        "recommended_networks": "Search + Audience retargeting",
+        "audience_setup": "Intent keywords + LinkedIn profile targeting",
+        "conversion_event": "Lead form submit / call",
+        "attribution_window": "30-day click",
+        "placement_control": "Audience network limited at launch",
+    },
+    "Meta Ads": {
+        "campaign_type": "Leads / Sales",
+        "recommended_networks": "Feeds + Stories + Reels",
+        "audience_setup": "Interest stack + lookalike + engaged retargeting",
+        "conversion_event": "Lead form submit / landing page conversion",
+        "attribution_window": "7-day click / 1-day view",
+        "placement_control": "Advantage+ placements with exclusions after week 1",
+    },
+    "LinkedIn Ads": {
+        "campaign_type": "Lead Gen Forms",
+        "recommended_networks": "Sponsored Content + Lead Gen Forms",
+        "audience_setup": "Job title + industry + company size filters",
+        "conversion_event": "Qualified lead form submit",
+        "attribution_window": "30-day click / 7-day view",
+        "placement_control": "Audience expansion OFF initially",
+    },
+    "YouTube Ads": {
+        "campaign_type": "Video Action / Demand Gen",
+        "recommended_networks": "YouTube In-Stream + In-Feed",
+        "audience_setup": "Custom intent + remarketing audiences",
+        "conversion_event": "Site lead / engaged view",
+        "attribution_window": "30-day click / engaged-view",
+        "placement_control": "Exclude kids content + low-quality placements",
+    },
+    "TikTok Ads": {
+        "campaign_type": "Traffic / Conversions",
+        "recommended_networks": "TikTok Feed",
+        "audience_setup": "Interest + behavior + website retargeting",
+        "conversion_event": "Lead submit / key page view",
+        "attribution_window": "7-day click / 1-day view",
+        "placement_control": "Automated creative ON, tighten after 3 days",
+    },
+    "X Ads": {
+        "campaign_type": "Website Traffic / Leads",
+        "recommended_networks": "Timeline placements",
+        "audience_setup": "Keyword + follower lookalike targeting",
+        "conversion_event": "Landing page lead",
+        "attribution_window": "30-day click",
+        "placement_control": "Brand safety exclusions enabled",
+    },
+    "Pinterest Ads": {
+        "campaign_type": "Consideration / Conversions",
+        "recommended_networks": "Home feed + search placements",
+        "audience_setup": "Interest + keyword + actalike",
+        "conversion_event": "Signup / checkout",
+        "attribution_window": "30-day click / 7-day view",
+        "placement_control": "Catalog + shopping disabled if no product feed",
+    },
+    "Reddit Ads": {
+        "campaign_type": "Traffic / Conversions",
+        "recommended_networks": "Feed placements",
+        "audience_setup": "Subreddit targeting + interest groups",
+        "conversion_event": "Lead submit / key action",
+        "attribution_window": "28-day click / 1-day view",
+        "placement_control": "Brand safety filter high",
+    },
+    "Snapchat Ads": {
+        "campaign_type": "Lead Gen / Conversions",
+        "recommended_networks": "Story + Spotlight placements",
+        "audience_setup": "Lifestyle + custom audience retargeting",
+        "conversion_event": "Lead submit",
+        "attribution_window": "7-day click / 1-day view",
+        "placement_control": "Auto-bid initially, cap after baseline CPA",
+    },
+}
+
+_BID_SOURCE = {
+    "lead generation": "Maximize Conversions (with TCPA after 20-30 conversions)",
+    "conversions": "Maximize Conversion Value",
+    "traffic": "Maximize Clicks with CPC cap",
+    "awareness": "Target Impression Share / Reach",
+    "retargeting": "Maximize Conversions (Audience-only)",
+}
+
+_DEFAULT_PROFILE = {
+    "campaign_type": "Performance",
+    "recommended_networks": "Core placement + remarketing",
+    "audience_setup": "Local radius + in-market audiences",
+    "conversion_event": "Primary lead event",
+    "attribution_window": "30-day click",
+    "placement_control": "Start broad, then tighten by performance",
+}
+DEFAULT_BID_STRATEGY = "Maximize Conversions"
+DEFAULT_SUB_OPTION = "Standard"
+DEFAULT_TEMPLATE = "Standard Template"
+
+
+class CatalogError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformProfile:
+    campaign_type: str
+    recommended_networks: str
+    audience_setup: str
+    conversion_event: str
+    attribution_window: str
+    placement_control: str
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformSpec:
+    name: str
+    objectives: tuple[str, ...]
+    sub_options: Mapping[str, tuple[str, ...]]
+    templates: tuple[str, ...]
+    profile: PlatformProfile
+
+
+@dataclass(frozen=True, slots=True)
+class Selection:
+    """A resolved (platform, objective, sub_option, template) choice with everything a plan needs."""
+
+    platform: str
+    objective: str
+    sub_option: str
+    template: str
+    sub_options: tuple[str, ...]
+    templates: tuple[str, ...]
+    bid_strategy: str
+    profile: PlatformProfile
+
+
+DEFAULT_PROFILE = PlatformProfile(**_DEFAULT_PROFILE)
+
+
+@dataclass(frozen=True, slots=True)
+class Catalog:
+    platforms: Mapping[str, PlatformSpec]
+    objectives: tuple[str, ...]
+    # (platform, objective, sub_option) -> Selection; sub_option None holds the platform default.
+    selections: Mapping[tuple[str, str, str | None], Selection]
+
+    def platform(self, name: str) -> PlatformSpec:
+        spec = self.platforms.get(name)
+        if spec is None:
+            raise CatalogError("Unsupported ad platform")
+        return spec
+
+    def select(self, platform: str, objective: str, sub_option: str | None = None, template: str | None = None) -> Selection:
+        """Strict lookup for user input; raises CatalogError on any combination the platform does not offer."""
+        spec = self.platform(platform)
+        selection = self.selections.get((platform, objective, sub_option or None))
+        if selection is None:
+            if (platform, objective, None) not in self.selections:
+                raise CatalogError("Objective not supported by this platform")
+            raise CatalogError("Sub-option not supported by this platform objective")
+        if template:
+            if template not in spec.templates:
+                raise CatalogError("Template not supported by this platform")
+            selection = _with_template(selection, template)
+        return selection
+
+    def resolve(self, platform: str, objective: str, sub_option: str | None = None, template: str | None = None) -> Selection:
+        """Lenient lookup used by plan generation: unknown choices fall back to platform or global defaults."""
+        selection = self.selections.get((platform, objective, sub_option or None)) or self.selections.get((platform, objective, None))
+        if selection is None:
+            spec = self.platforms.get(platform)
+            selection = Selection(
+                platform=platform,
+                objective=objective,
+                sub_option=DEFAULT_SUB_OPTION,
+                template=spec.templates[0] if spec else DEFAULT_TEMPLATE,
+                sub_options=(),
+                templates=spec.templates if spec else (),
+                bid_strategy=_BID_SOURCE.get(objective.lower(), DEFAULT_BID_STRATEGY),
+                profile=spec.profile if spec else DEFAULT_PROFILE,
+            )
+        if template and template in selection.templates:
+            selection = _with_template(selection, template)
+        return selection
+
+    def as_config(self) -> dict:
+        """Plain-JSON view for the planner UI."""
+        return {
+            name: {
+                "objectives": list(spec.objectives),
+                "sub_options": {objective: list(options) for objective, options in spec.sub_options.items()},
+                "templates": list(spec.templates),
+            }
+            for name, spec in self.platforms.items()
+        }
+
+
+def _with_template(selection: Selection, template: str) -> Selection:
+    if template == selection.template:
+        return selection
+    return Selection(
+        platform=selection.platform,
+        objective=selection.objective,
+        sub_option=selection.sub_option,
+        template=template,
+        sub_options=selection.sub_options,
+        templates=selection.templates,
+        bid_strategy=selection.bid_strategy,
+        profile=selection.profile,
+    )
+
+
+def compile_catalog() -> Catalog:
+    if set(_PLATFORM_ORDER) != set(_PLATFORM_SOURCE):
+        raise CatalogError("Platform order and platform config disagree")
+    known_objectives = set(_OBJECTIVE_ORDER)
+    platforms: dict[str, PlatformSpec] = {}
+    selections: dict[tuple[str, str, str | None], Selection] = {}
+    for name in _PLATFORM_ORDER:
+        raw = _PLATFORM_SOURCE[name]
+        if name not in _PROFILE_SOURCE:
+            raise CatalogError(f"{name}: missing platform profile")
+        objectives = tuple(raw["objectives"])
+        templates = tuple(raw["templates"])
+        if not templates:
+            raise CatalogError(f"{name}: no templates")
+        unknown = set(objectives) - known_objectives
+        if unknown:
+            raise CatalogError(f"{name}: unknown objectives {sorted(unknown)}")
+        if set(raw["sub_options"]) != set(objectives):
+            raise CatalogError(f"{name}: sub-options must be defined for exactly its objectives")
+        sub_options = {objective: tuple(raw["sub_options"][objective]) for objective in objectives}
+        profile = PlatformProfile(**_PROFILE_SOURCE[name])
+        spec = PlatformSpec(name=name, objectives=objectives, sub_options=MappingProxyType(sub_options), templates=templates, profile=profile)
+        platforms[name] = spec
+        for objective, options in sub_options.items():
+            if not options:
+                raise CatalogError(f"{name}/{objective}: no sub-options")
+            bid_strategy = _BID_SOURCE.get(objective.lower(), DEFAULT_BID_STRATEGY)
+            for option in (None, *options):
+                selections[(name, objective, option)] = Selection(
+                    platform=name,
+                    objective=objective,
+                    sub_option=option or options[0],
+                    template=templates[0],
+                    sub_options=options,
+                    templates=templates,
+                    bid_strategy=bid_strategy,
+                    profile=profile,
+                )
+    return Catalog(platforms=MappingProxyType(platforms), objectives=tuple(_OBJECTIVE_ORDER), selections=MappingProxyType(selections))
+
+
+CATALOG = compile_catalog()
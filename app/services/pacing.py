@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+PACING_SHAPES = ("even", "front", "back")
+DEFAULT_SCENARIOS = 2000
+MAX_SCENARIOS = 20000
+ALLOCATION_STEPS = 40
+# Score = mean - RISK_AVERSION * stddev of conversions across scenarios.
+RISK_AVERSION = 0.5
+CPC_SIGMA = 0.35
+CVR_CONCENTRATION = 200.0
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    cpc_cents: float
+    conversion_rate: float
+    # Spend at which returns are ~63% saturated; past it extra budget buys less.
+    saturation_cents: float
+
+
+PLATFORM_BENCHMARKS = {
+    "Google Ads": Benchmark(cpc_cents=320, conversion_rate=0.045, saturation_cents=600000),
+    "Meta Ads": Benchmark(cpc_cents=110, conversion_rate=0.022, saturation_cents=400000),
+    "LinkedIn Ads": Benchmark(cpc_cents=560, conversion_rate=0.035, saturation_cents=250000),
+    "Microsoft Ads": Benchmark(cpc_cents=190, conversion_rate=0.038, saturation_cents=200000),
+    "YouTube Ads": Benchmark(cpc_cents=90, conversion_rate=0.009, saturation_cents=300000),
+    "TikTok Ads": Benchmark(cpc_cents=95, conversion_rate=0.012, saturation_cents=300000),
+    "X Ads": Benchmark(cpc_cents=85, conversion_rate=0.008, saturation_cents=120000),
+    "Pinterest Ads": Benchmark(cpc_cents=150, conversion_rate=0.015, saturation_cents=150000),
+    "Reddit Ads": Benchmark(cpc_cents=75, conversion_rate=0.010, saturation_cents=120000),
+    "Snapchat Ads": Benchmark(cpc_cents=80, conversion_rate=0.009, saturation_cents=150000),
+}
+DEFAULT_BENCHMARK = Benchmark(cpc_cents=200, conversion_rate=0.02, saturation_cents=200000)
+
+
+def benchmark(platform: str) -> Benchmark:
+    return PLATFORM_BENCHMARKS.get(platform, DEFAULT_BENCHMARK)
+
+
+def _split_cents(total_cents: int, weights: np.ndarray) -> np.ndarray:
+    """Integer cents proportional to ``weights`` that sum exactly to ``total_cents`` (largest remainder)."""
+    raw = total_cents * weights / weights.sum()
+    cents = np.floor(raw).astype(np.int64)
+    short = int(total_cents - cents.sum())
+    if short:
+        cents[np.argsort(cents - raw, kind="stable")[:short]] += 1
+    return cents
+
+
+def pacing_curve(budget_cents: int, days: int, shape: str = "even", strength: float = 0.5) -> np.ndarray:
+    """Daily spend in cents; ``front``/``back`` tilt linearly so day one spends (1 ± strength) of the even rate."""
+    if shape not in PACING_SHAPES:
+        raise ValueError(f"Unknown pacing shape: {shape}")
+    days = max(1, int(days))
+    tilt = np.linspace(1.0, -1.0, days) if days > 1 else np.zeros(1)
+    if shape == "back":
+        tilt = -tilt
+    elif shape == "even":
+        tilt = np.zeros(days)
+    weights = 1.0 + float(np.clip(strength, 0.0, 0.9)) * tilt
+    return _split_cents(max(0, int(budget_cents)), weights)
+
+
+def _draw_rates(platforms: list[str], scenarios: int, rng: np.random.Generator) -> np.ndarray:
+    """Conversions per cent of spend, shape ``(len(platforms), scenarios)``."""
+    marks = [benchmark(p) for p in platforms]
+    cpc = np.array([b.cpc_cents for b in marks])[:, None]
+    cvr = np.array([b.conversion_rate for b in marks])[:, None]
+    cpc_draws = cpc * rng.lognormal(-0.5 * CPC_SIGMA**2, CPC_SIGMA, size=(len(marks), scenarios))
+    cvr_draws = rng.beta(cvr * CVR_CONCENTRATION, (1.0 - cvr) * CVR_CONCENTRATION, size=(len(marks), scenarios))
+    return cvr_draws / cpc_draws
+
+
+def _effective_spend(spend_cents: np.ndarray, saturation: np.ndarray) -> np.ndarray:
+    return saturation * -np.expm1(-spend_cents / saturation)
+
+
+def _summary(conversions: np.ndarray, spend_cents: float) -> dict:
+    p10, p50, p90 = np.percentile(conversions, [10, 50, 90])
+    mean = float(conversions.mean())
+    return {
+        "expected_conversions": round(mean, 2),
+        "conversions_p10": round(float(p10), 2),
+        "conversions_p50": round(float(p50), 2),
+        "conversions_p90": round(float(p90), 2),
+        "cpa_cents": int(round(spend_cents / mean)) if mean > 0 else None,
+    }
+
+
+def simulate_outcomes(platform: str, budget_cents: int, scenarios: int = DEFAULT_SCENARIOS, seed: int = 0) -> dict:
+    """Monte Carlo conversions and CPA for one campaign budget on one platform."""
+    scenarios = max(1, min(int(scenarios), MAX_SCENARIOS))
+    rng = np.random.default_rng(seed)
+    mark = benchmark(platform)
+    rates = _draw_rates([platform], scenarios, rng)
+    expected = _effective_spend(float(budget_cents), mark.saturation_cents) * rates[0]
+    conversions = rng.poisson(expected)
+    cpa = budget_cents / conversions[conversions > 0]
+    out = _summary(conversions, budget_cents)
+    out["cpa_cents_p10"], out["cpa_cents_p90"] = (int(v) for v in np.percentile(cpa, [10, 90])) if cpa.size else (None, None)
+    out["zero_conversion_share"] = round(float(np.mean(conversions == 0)), 3)
+    out["scenarios"] = scenarios
+    return out
+
+
+def optimize_allocation(
+    budget_cents: int,
+    platforms: list[str],
+    scenarios: int = DEFAULT_SCENARIOS,
+    seed: int = 0,
+    steps: int = ALLOCATION_STEPS,
+    rates: np.ndarray | None = None,
+) -> dict:
+    """Greedy risk-adjusted split of ``budget_cents``: each step funds the platform with the best marginal score."""
+    platforms = list(dict.fromkeys(platforms))
+    if not platforms:
+        raise ValueError("At least one platform is required")
+    scenarios = max(1, min(int(scenarios), MAX_SCENARIOS))
+    if rates is None:
+        rates = _draw_rates(platforms, scenarios, np.random.default_rng(seed))
+    saturation = np.array([benchmark(p).saturation_cents for p in platforms])
+    steps = max(1, int(steps))
+    unit = max(0, int(budget_cents)) / steps
+
+    spend = np.zeros(len(platforms))
+    totals = np.zeros(rates.shape[1])
+    for _ in range(steps):
+        gain = _effective_spend(spend + unit, saturation) - _effective_spend(spend, saturation)
+        # Conversions per scenario if the next unit went to each platform: shape (platforms, scenarios).
+        candidate = totals[None, :] + gain[:, None] * rates
+        score = candidate.mean(axis=1) - RISK_AVERSION * candidate.std(axis=1)
+        best = int(np.argmax(score))
+        spend[best] += unit
+        totals = candidate[best]
+
+    per_platform = _effective_spend(spend, saturation) * rates.mean(axis=1)
+    cents = _split_cents(max(0, int(budget_cents)), spend) if spend.sum() > 0 else np.zeros(len(platforms), dtype=np.int64)
+    return {
+        "budget_cents": int(budget_cents),
+        "scenarios": int(rates.shape[1]),
+        "allocation": [
+            {
+                "platform": platform,
+                "budget_cents": int(cents[i]),
+                "share": round(float(cents[i]) / budget_cents, 3) if budget_cents else 0.0,
+                "expected_conversions": round(float(per_platform[i]), 2),
+            }
+            for i, platform in enumerate(platforms)
+        ],
+        **_summary(totals, budget_cents),
+    }
+
+
+def evaluate_allocation(spend_by_platform: dict[str, int], rates: np.ndarray) -> dict:
+    """Score a fixed split against the same scenario draws used to optimize it."""
+    spend = np.array([float(v) for v in spend_by_platform.values()])
+    saturation = np.array([benchmark(p).saturation_cents for p in spend_by_platform])
+    conversions = (_effective_spend(spend, saturation)[:, None] * rates).sum(axis=0)
+    return _summary(conversions, spend.sum())
+
+
+def portfolio_allocation(campaigns: list[tuple[str, int]], scenarios: int = DEFAULT_SCENARIOS, seed: int = 0) -> dict | None:
+    """Compare a tenant's current per-platform budgets with the recommended split of the same total."""
+    current: dict[str, int] = {}
+    for platform, budget_cents in campaigns:
+        current[platform] = current.get(platform, 0) + max(0, int(budget_cents))
+    total = sum(current.values())
+    if not total:
+        return None
+    platforms = list(current)
+    rates = _draw_rates(platforms, max(1, min(int(scenarios), MAX_SCENARIOS)), np.random.default_rng(seed))
+    recommended = optimize_allocation(total, platforms, rates=rates)
+    baseline = evaluate_allocation(current, rates)
+    shares = {row["platform"]: row for row in recommended["allocation"]}
+    lift = recommended["expected_conversions"] / baseline["expected_conversions"] - 1 if baseline["expected_conversions"] else 0.0
+    return {
+        "budget_cents": total,
+        "scenarios": recommended["scenarios"],
+        "rows": [
+            {
+                "platform": platform,
+                "current_cents": current[platform],
+                "current_share": round(current[platform] / total, 3),
+                "recommended_cents": shares[platform]["budget_cents"],
+                "recommended_share": shares[platform]["share"],
+            }
+            for platform in platforms
+        ],
+        "current": baseline,
+        "recommended": {k: v for k, v in recommended.items() if k not in ("allocation", "budget_cents", "scenarios")},
+        "lift_pct": round(lift * 100, 1),
+    }
@@ -0,0 +1,210 @@
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.orm import Session
+
+from app.models import AuditLog, Event, RetentionPolicy, RunLog, RunStep, Tenant
+from app.services.intelligence import prune_report_artifacts
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# table name -> (model, timestamp column, default retention in days)
+RETENTION_TABLES = {
+    "events": (Event, Event.created_at, 180),
+    "audit_log": (AuditLog, AuditLog.created_at, 730),
+    "run_logs": (RunLog, RunLog.created_at, 90),
+    "run_steps": (RunStep, RunStep.started_at, 90),
+}
+PARTITIONED_TABLES = ("events", "audit_log", "run_logs")
+PARTITION_NAME = re.compile(r"_p(\d{4})(\d{2})$")
+DEFAULT_BATCH_SIZE = 5000
+
+
+def archive_root() -> Path:
+    path = Path(os.getenv("ARCHIVE_ROOT", "data/archive"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def archive_format() -> str:
+    fmt = os.getenv("ARCHIVE_FORMAT", "jsonl").lower()
+    if fmt == "parquet" and pq is None:
+        logger.warning("ARCHIVE_FORMAT=parquet but pyarrow is not installed; writing jsonl.gz")
+        return "jsonl"
+    return fmt if fmt in {"jsonl", "parquet"} else "jsonl"
+
+
+def effective_policies(db: Session, tenant_id: int) -> dict[str, dict]:
+    policies = {name: {"table_name": name, "retain_days": spec[2], "archive": True, "custom": False} for name, spec in RETENTION_TABLES.items()}
+    for row in db.query(RetentionPolicy).filter(RetentionPolicy.tenant_id == tenant_id).all():
+        if row.table_name in policies:
+            policies[row.table_name] = {"table_name": row.table_name, "retain_days": row.retain_days, "archive": row.archive, "custom": True}
+    return policies
+
+
+def set_policy(db: Session, tenant_id: int, table_name: str, retain_days: int, archive: bool) -> RetentionPolicy:
+    if table_name not in RETENTION_TABLES:
+        raise ValueError(f"Unknown retention table: {table_name}")
+    if retain_days < 1:
+        raise ValueError("retain_days must be at least 1")
+    row = db.query(RetentionPolicy).filter(RetentionPolicy.tenant_id == tenant_id, RetentionPolicy.table_name == table_name).first()
+    if row is None:
+        row = RetentionPolicy(tenant_id=tenant_id, table_name=table_name)
+        db.add(row)
+    row.retain_days = retain_days
+    row.archive = archive
+    return row
+
+
+def _add_month(value: date) -> date:
+    return date(value.year + (value.month // 12), value.month % 12 + 1, 1)
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _write_archive(tenant_id: int, table_name: str, rows: list[dict], ts_key: str, fmt: str) -> list[Path]:
+    by_month: dict[str, list[dict]] = {}
+    for row in rows:
+        stamp = row.get(ts_key)
+        by_month.setdefault(stamp.strftime("%Y-%m") if stamp else "undated", []).append(row)
+
+    out_dir = archive_root() / f"tenant_{tenant_id}" / table_name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for month, month_rows in by_month.items():
+        if fmt == "parquet":
+            # Parquet files are immutable, so each batch becomes its own file within the month.
+            path = out_dir / f"{month}-{month_rows[0]['id']}.parquet"
+            pq.write_table(pa.Table.from_pylist(month_rows), path, compression="zstd")
+        else:
+            # Appending gzip members keeps the file a valid multi-member gzip stream.
+            path = out_dir / f"{month}.jsonl.gz"
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                for row in month_rows:
+                    f.write(json.dumps(row, default=_json_default, separators=(",", ":")) + "\n")
+        written.append(path)
+    return written
+
+
+def archive_and_purge(db: Session, tenant_id: int, *, now: datetime | None = None, batch_size: int = DEFAULT_BATCH_SIZE) -> dict[str, int]:
+    now = now or datetime.utcnow()
+    fmt = archive_format()
+    purged: dict[str, int] = {}
+    for table_name, policy in effective_policies(db, tenant_id).items():
+        model, ts_col, _ = RETENTION_TABLES[table_name]
+        table = model.__table__
+        cutoff = now - timedelta(days=policy["retain_days"])
+        last_id = 0
+        total = 0
+        while True:
+            rows = [
+                dict(r)
+                for r in db.execute(
+                    select(table)
+                    .where(table.c.tenant_id == tenant_id, ts_col < cutoff, table.c.id > last_id)
+                    .order_by(table.c.id.asc())
+                    .limit(batch_size)
+                ).mappings()
+            ]
+            if not rows:
+                break
+            if policy["archive"]:
+                _write_archive(tenant_id, table_name, rows, ts_col.key, fmt)
+            ids = [r["id"] for r in rows]
+            db.execute(delete(table).where(table.c.id.in_(ids)))
+            db.commit()
+            last_id = ids[-1]
+            total += len(ids)
+        purged[table_name] = total
+    return purged
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _partitions(db: Session, table_name: str) -> list[str]:
+    return list(
+        db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = :parent ORDER BY c.relname"
+            ),
+            {"parent": table_name},
+        ).scalars()
+    )
+
+
+def ensure_partitions(db: Session, *, months_ahead: int = 3, now: datetime | None = None) -> list[str]:
+    if not _is_postgres(db):
+        return []
+    now = now or datetime.utcnow()
+    created = []
+    for table_name in PARTITIONED_TABLES:
+        existing = set(_partitions(db, table_name))
+        month = date(now.year, now.month, 1)
+        for _ in range(months_ahead + 1):
+            upper = _add_month(month)
+            name = f"{table_name}_p{month:%Y%m}"
+            if name not in existing:
+                db.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table_name} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+                    )
+                )
+                created.append(name)
+            month = upper
+    db.commit()
+    return created
+
+
+def drop_expired_partitions(db: Session, *, now: datetime | None = None) -> list[str]:
+    """Drop monthly partitions that every tenant's policy has expired and that purging left empty."""
+    if not _is_postgres(db):
+        return []
+    now = now or datetime.utcnow()
+    tenant_ids = [t for (t,) in db.query(Tenant.id).all()]
+    dropped = []
+    for table_name in PARTITIONED_TABLES:
+        longest = max([effective_policies(db, t)[table_name]["retain_days"] for t in tenant_ids] or [RETENTION_TABLES[table_name][2]])
+        cutoff = (now - timedelta(days=longest)).date()
+        for name in _partitions(db, table_name):
+            match = PARTITION_NAME.search(name)
+            if not match or _add_month(date(int(match.group(1)), int(match.group(2)), 1)) > cutoff:
+                continue
+            if db.execute(text(f"SELECT 1 FROM {name} LIMIT 1")).first() is not None:
+                continue
+            db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    db.commit()
+    return dropped
+
+
+def run_retention(db: Session, *, tenant_id: int | None = None, now: datetime | None = None, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    now = now or datetime.utcnow()
+    created = ensure_partitions(db, now=now)
+    query = db.query(Tenant.id).order_by(Tenant.id.asc())
+    if tenant_id is not None:
+        query = query.filter(Tenant.id == tenant_id)
+    purged = {t: archive_and_purge(db, t, now=now, batch_size=batch_size) for (t,) in query.all()}
+    dropped = drop_expired_partitions(db, now=now)
+    pruned = prune_report_artifacts()
+    return {"partitions_created": created, "purged": purged, "partitions_dropped": dropped, "report_artifacts_pruned": pruned}
@@ -0,0 +1,272 @@
+import json
+import os
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, or_, update
+from sqlalchemy.orm import Session
+
+from app.models import Approval, ClientFinancial, Deal, Event, Tenant, TenantDailyRollup, WorkflowRun
+from app.services import changes
+
+PERIODS = ("week", "month", "quarter")
+GAUGE_METRICS = ("mrr_total_cents", "pipeline_14d_cents", "blocked_items")
+RISK_SEVERITIES = ("high", "critical")
+ROLLUP_SOURCES = {model.__tablename__ for model in (ClientFinancial, Deal, Approval, WorkflowRun)}
+# ClientFinancial keeps no history, so its current MRR is only recorded for today and the day being finalized.
+MRR_LIVE_DAYS = 1
+# How far back the nightly job fills missing days; older buckets are simply absent from reports.
+ROLLUP_BACKFILL_DAYS = int(os.getenv("ROLLUP_BACKFILL_DAYS", "92"))
+
+
+def period_bounds(period: str, report_date: date) -> tuple[date, date]:
+    if period == "month":
+        return report_date.replace(day=1), report_date
+    if period == "quarter":
+        return date(report_date.year, 3 * ((report_date.month - 1) // 3) + 1, 1), report_date
+    return report_date - timedelta(days=7), report_date
+
+
+def compute_day(db: Session, tenant_id: int, day: date, *, today: date | None = None) -> dict:
+    """Metrics for one day; ``mrr_total_cents`` is ``None`` for days older than ``MRR_LIVE_DAYS``."""
+    today = today or date.today()
+    day_end = datetime.combine(day + timedelta(days=1), datetime.min.time())
+    mrr = None
+    if day >= today - timedelta(days=MRR_LIVE_DAYS):
+        mrr = db.query(func.coalesce(func.sum(ClientFinancial.mrr_cents), 0)).filter(ClientFinancial.tenant_id == tenant_id).scalar()
+    pipeline = (
+        db.query(func.coalesce(func.sum(Deal.value_cents), 0))
+        .filter(Deal.tenant_id == tenant_id, Deal.close_date.is_not(None), Deal.close_date <= day + timedelta(days=14), Deal.created_at < day_end)
+        .scalar()
+    )
+    blocked = (
+        db.query(func.count(Approval.id))
+        .filter(
+            Approval.tenant_id == tenant_id,
+            Approval.created_at < day_end,
+            or_(Approval.status == "pending", Approval.decided_at >= day_end),
+        )
+        .scalar()
+    )
+    wins = (
+        db.query(func.count(WorkflowRun.id))
+        .filter(
+            WorkflowRun.tenant_id == tenant_id,
+            WorkflowRun.status == "succeeded",
+            WorkflowRun.created_at >= datetime.combine(day, datetime.min.time()),
+            WorkflowRun.created_at < day_end,
+        )
+        .scalar()
+    )
+    recent = (
+        db.query(Event.title, Event.severity)
+        .filter(Event.tenant_id == tenant_id, Event.created_at < day_end)
+        .order_by(Event.created_at.desc())
+        .limit(20)
+        .all()
+    )
+    return {
+        "mrr_total_cents": int(mrr) if mrr is not None else None,
+        "pipeline_14d_cents": int(pipeline or 0),
+        "blocked_items": int(blocked or 0),
+        "wins": int(wins or 0),
+        "top_risks": [title for title, severity in recent if severity in RISK_SEVERITIES][:5],
+    }
+
+
+def refresh_day(db: Session, tenant_id: int, day: date, row: TenantDailyRollup | None = None, *, today: date | None = None) -> TenantDailyRollup:
+    values = compute_day(db, tenant_id, day, today=today)
+    if row is None:
+        row = TenantDailyRollup(tenant_id=tenant_id, day=day)
+        db.add(row)
+    # Recomputing an older day keeps the MRR captured when it was live.
+    if values["mrr_total_cents"] is not None:
+        row.mrr_total_cents = values["mrr_total_cents"]
+    row.pipeline_14d_cents = values["pipeline_14d_cents"]
+    row.blocked_items = values["blocked_items"]
+    row.wins = values["wins"]
+    row.top_risks_json = json.dumps(values["top_risks"])
+    row.dirty = False
+    row.computed_at = datetime.utcnow()
+    return row
+
+
+def ensure_rollups(db: Session, tenant_id: int, start: date, end: date, *, today: date | None = None) -> int:
+    """Compute missing or dirty rollup rows in ``[start, end]``; days after today are skipped."""
+    today = today or date.today()
+    end = min(end, today)
+    existing = {
+        row.day: row
+        for row in db.query(TenantDailyRollup).filter(TenantDailyRollup.tenant_id == tenant_id, TenantDailyRollup.day >= start, TenantDailyRollup.day <= end)
+    }
+    refreshed = 0
+    day = start
+    while day <= end:
+        row = existing.get(day)
+        if row is None or row.dirty:
+            refresh_day(db, tenant_id, day, row, today=today)
+            refreshed += 1
+        day += timedelta(days=1)
+    if refreshed:
+        db.commit()
+    return refreshed
+
+
+def _live_wins(db: Session, tenant_id: int, start: date, end: date) -> dict[date, int]:
+    day = func.date(WorkflowRun.created_at)
+    rows = (
+        db.query(day, func.count(WorkflowRun.id))
+        .filter(
+            WorkflowRun.tenant_id == tenant_id,
+            WorkflowRun.status == "succeeded",
+            WorkflowRun.created_at >= datetime.combine(start, datetime.min.time()),
+            WorkflowRun.created_at < datetime.combine(end + timedelta(days=1), datetime.min.time()),
+        )
+        .group_by(day)
+        .all()
+    )
+    return {date.fromisoformat(str(d)): int(n) for d, n in rows}
+
+
+def period_snapshot(db: Session, tenant_id: int, start: date, end: date) -> dict:
+    """Read-only: clean rollup rows are used as stored, missing or dirty days are computed live.
+
+    Only ``refresh_rollups`` writes rollups, so concurrent report requests never race on the unique day.
+    """
+    end = min(end, date.today())
+    rows = {
+        row.day: row
+        for row in db.query(TenantDailyRollup).filter(TenantDailyRollup.tenant_id == tenant_id, TenantDailyRollup.day >= start, TenantDailyRollup.day <= end)
+    }
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    stale = [day for day in days if day not in rows or rows[day].dirty]
+    wins = sum(row.wins for row in rows.values() if not row.dirty)
+    if stale:
+        live = _live_wins(db, tenant_id, stale[0], stale[-1])
+        wins += sum(live.get(day, 0) for day in stale)
+
+    latest = rows.get(end)
+    if latest is None or latest.dirty:
+        gauges = compute_day(db, tenant_id, end)
+    else:
+        gauges = {name: getattr(latest, name) for name in GAUGE_METRICS}
+        gauges["top_risks"] = json.loads(latest.top_risks_json)
+    return {
+        "report_date": end.isoformat(),
+        "period_start": start.isoformat(),
+        # None when the day is past MRR_LIVE_DAYS and no live value was recorded for it.
+        "mrr_total_cents": gauges["mrr_total_cents"],
+        "pipeline_14d_cents": gauges["pipeline_14d_cents"],
+        "blocked_items": gauges["blocked_items"],
+        "wins": int(wins),
+        "top_risks": gauges["top_risks"],
+    }
+
+
+def bucket_start(day: date, grain: str) -> date:
+    if grain == "month":
+        return day.replace(day=1)
+    if grain == "quarter":
+        return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    return day - timedelta(days=day.weekday())
+
+
+def _previous_bucket(start: date, grain: str) -> date:
+    return bucket_start(start - timedelta(days=1), grain)
+
+
+def _series(values: np.ndarray, window: int) -> dict:
+    delta = np.full(values.shape, np.nan)
+    delta[1:] = np.diff(values)
+    previous = np.full(values.shape, np.nan)
+    previous[1:] = values[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(previous != 0, delta / previous * 100.0, np.nan)
+    moving = np.full(values.shape, np.nan)
+    if window >= 1 and len(values) >= window:
+        moving[window - 1 :] = np.convolve(values, np.ones(window) / window, mode="valid")
+
+    def _clean(arr: np.ndarray) -> list:
+        return [None if np.isnan(x) else round(float(x), 2) for x in arr]
+
+    return {"values": _clean(values), "delta": _clean(delta), "pct_change": _clean(pct), "moving_avg": _clean(moving)}
+
+
+def timeseries(db: Session, tenant_id: int, *, grain: str = "week", periods: int = 52, end: date | None = None, window: int = 4) -> dict:
+    """Per-period metrics for the last ``periods`` buckets: gauges take the last day in the bucket, wins are summed.
+
+    Reads stored rollups only; buckets the nightly job has not covered come back empty.
+    """
+    end = end or date.today()
+    starts = [bucket_start(end, grain)]
+    for _ in range(periods - 1):
+        starts.append(_previous_bucket(starts[-1], grain))
+    starts.reverse()
+
+    rows = (
+        db.query(
+            TenantDailyRollup.day,
+            TenantDailyRollup.mrr_total_cents,
+            TenantDailyRollup.pipeline_14d_cents,
+            TenantDailyRollup.blocked_items,
+            TenantDailyRollup.wins,
+        )
+        .filter(TenantDailyRollup.tenant_id == tenant_id, TenantDailyRollup.day >= starts[0], TenantDailyRollup.day <= end)
+        .order_by(TenantDailyRollup.day.asc())
+        .all()
+    )
+    n = len(starts)
+    metrics = {name: np.full(n, np.nan) for name in GAUGE_METRICS}
+    metrics["wins"] = np.zeros(n)
+    if rows:
+        data = np.array([r[1:] for r in rows], dtype=float)
+        idx = np.searchsorted(np.array(starts, dtype="datetime64[D]"), np.array([r.day for r in rows], dtype="datetime64[D]"), side="right") - 1
+        # Rows are day-ordered, so the last row of each bucket is where the bucket index changes.
+        last = np.flatnonzero(np.r_[idx[1:] != idx[:-1], True])
+        for col, name in enumerate(GAUGE_METRICS):
+            metrics[name][idx[last]] = data[last, col]
+        np.add.at(metrics["wins"], idx, data[:, 3])
+
+    return {
+        "tenant_id": tenant_id,
+        "grain": grain,
+        "window": window,
+        "periods": [s.isoformat() for s in starts],
+        "metrics": {name: _series(values, window) for name, values in metrics.items()},
+    }
+
+
+def refresh_rollups(db: Session, *, today: date | None = None) -> int:
+    """Nightly job: fill gaps within ``ROLLUP_BACKFILL_DAYS``, finalize yesterday, compute today and recompute anything dirty."""
+    today = today or date.today()
+    horizon = today - timedelta(days=max(1, ROLLUP_BACKFILL_DAYS))
+    refreshed = 0
+    for tenant_id, created_at in db.query(Tenant.id, Tenant.created_at).order_by(Tenant.id.asc()).all():
+        start = max(horizon, created_at.date()) if created_at else horizon
+        refreshed += ensure_rollups(db, tenant_id, min(start, today - timedelta(days=1)), today, today=today)
+    for row in db.query(TenantDailyRollup).filter(TenantDailyRollup.dirty.is_(True)).all():
+        refresh_day(db, row.tenant_id, row.day, row, today=today)
+        refreshed += 1
+    db.commit()
+    return refreshed
+
+
+@changes.on_prepare
+def _mark_rollups_dirty(session: Session, batch: list[changes.Change]) -> None:
+    today = date.today()
+    by_tenant: dict[int, set[date]] = {}
+    for change in batch:
+        created_at = change.values.get("created_at")
+        if change.table in ROLLUP_SOURCES:
+            by_tenant.setdefault(change.tenant_id, set()).add(today)
+            if change.table == WorkflowRun.__tablename__ and created_at is not None:
+                by_tenant[change.tenant_id].add(created_at.date())
+        elif change.table == Event.__tablename__ and change.values.get("severity") in RISK_SEVERITIES and created_at is not None:
+            by_tenant.setdefault(change.tenant_id, set()).add(created_at.date())
+    for tenant_id, days in by_tenant.items():
+        session.execute(
+            update(TenantDailyRollup)
+            .where(TenantDailyRollup.tenant_id == tenant_id, TenantDailyRollup.day.in_(sorted(days)), TenantDailyRollup.dirty.is_(False))
+            .values(dirty=True)
+            .execution_options(synchronize_session=False)
+        )
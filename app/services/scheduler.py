@@ -0,0 +1,395 @@
+import heapq
+import logging
+import os
+import random
+import socket
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import app.core.db as core_db
+from app.core.config import get_settings
+from app.models import SchedulerLease, WorkflowRun, WorkflowSchedule, WorkflowTemplate
+from app.services.intelligence import emit_event
+from app.services.workflow_engine import enqueue_workflow_run
+
+logger = logging.getLogger(__name__)
+
+CATCHUP_POLICIES = {"skip", "catch_up"}
+ACTIVE_RUN_STATUSES = {"queued", "running", "blocked"}
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+_MONTH_NAMES = {name: idx for idx, name in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+_WEEKDAY_NAMES = {name: idx for idx, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+
+class CronError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    minutes: tuple[int, ...]
+    hours: tuple[int, ...]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    day_restricted: bool
+    weekday_restricted: bool
+
+    def matches_day(self, value: date) -> bool:
+        cron_weekday = (value.weekday() + 1) % 7
+        if self.day_restricted and self.weekday_restricted:
+            return value.day in self.days or cron_weekday in self.weekdays
+        if self.day_restricted:
+            return value.day in self.days
+        if self.weekday_restricted:
+            return cron_weekday in self.weekdays
+        return True
+
+
+def _field_value(raw: str, names: dict[str, int]) -> int:
+    key = raw.strip().lower()
+    if key in names:
+        return names[key]
+    if not key.isdigit():
+        raise CronError(f"Invalid cron value: {raw}")
+    return int(key)
+
+
+def _parse_field(token: str, low: int, high: int, names: dict[str, int] | None = None) -> set[int]:
+    names = names or {}
+    values: set[int] = set()
+    for part in token.split(","):
+        step = 1
+        has_step = "/" in part
+        if has_step:
+            part, raw_step = part.split("/", 1)
+            if not raw_step.isdigit() or int(raw_step) < 1:
+                raise CronError(f"Invalid cron step: {raw_step}")
+            step = int(raw_step)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            raw_start, raw_end = part.split("-", 1)
+            start, end = _field_value(raw_start, names), _field_value(raw_end, names)
+        else:
+            start = _field_value(part, names)
+            end = high if has_step else start
+        if not (low <= start <= end <= high):
+            raise CronError(f"Cron field out of range: {token}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expr: str) -> CronExpression:
+    raw = (expr or "").strip().lower()
+    raw = _ALIASES.get(raw, raw)
+    fields = raw.split()
+    if len(fields) != 5:
+        raise CronError("Cron expression needs 5 fields: minute hour day month weekday")
+    minute, hour, day, month, weekday = fields
+    weekdays = {0 if x == 7 else x for x in _parse_field(weekday, 0, 7, _WEEKDAY_NAMES)}
+    return CronExpression(
+        minutes=tuple(sorted(_parse_field(minute, 0, 59))),
+        hours=tuple(sorted(_parse_field(hour, 0, 23))),
+        days=frozenset(_parse_field(day, 1, 31)),
+        months=frozenset(_parse_field(month, 1, 12, _MONTH_NAMES)),
+        weekdays=frozenset(weekdays),
+        day_restricted=day != "*",
+        weekday_restricted=weekday != "*",
+    )
+
+
+def resolve_timezone(name: str) -> ZoneInfo:
+    try:
+        return ZoneInfo((name or "UTC").strip())
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise CronError(f"Unknown timezone: {name}") from exc
+
+
+def next_fire(cron: CronExpression, after: datetime, tz_name: str = "UTC") -> datetime:
+    """Next fire time strictly after ``after``; both are naive UTC like the rest of the models."""
+    zone = resolve_timezone(tz_name)
+    local = after.replace(tzinfo=timezone.utc).astimezone(zone).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+    limit = local + timedelta(days=366 * 5)
+    while local <= limit:
+        if local.month not in cron.months:
+            local = (local.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            continue
+        if not cron.matches_day(local.date()):
+            local = local.replace(hour=0, minute=0) + timedelta(days=1)
+            continue
+        if local.hour not in cron.hours:
+            later_hour = next((h for h in cron.hours if h > local.hour), None)
+            if later_hour is None:
+                local = local.replace(hour=0, minute=0) + timedelta(days=1)
+            else:
+                local = local.replace(hour=later_hour, minute=0)
+            continue
+        if local.minute not in cron.minutes:
+            later_minute = next((m for m in cron.minutes if m > local.minute), None)
+            if later_minute is None:
+                local = local.replace(minute=0) + timedelta(hours=1)
+            else:
+                local = local.replace(minute=later_minute)
+            continue
+        fire_at = local.replace(tzinfo=zone).astimezone(timezone.utc).replace(tzinfo=None)
+        if fire_at > after:
+            return fire_at
+        local += timedelta(minutes=1)
+    raise CronError("Cron expression never fires")
+
+
+def compute_next_run(cron_expr: str, tz_name: str, after: datetime | None = None) -> datetime:
+    return next_fire(parse_cron(cron_expr), after or datetime.utcnow(), tz_name)
+
+
+class WorkflowScheduler:
+    """Leader-elected loop that turns due schedules into queued workflow runs.
+
+    Due times live in a min-heap so each tick only touches schedules that are actually due;
+    stale heap entries are skipped through a per-schedule generation counter. Each leader tick
+    also re-reads schedules whose ``updated_at`` moved, so edits made in other processes land
+    within one poll instead of waiting for the periodic full reload.
+    """
+
+    lease_name = "workflow_scheduler"
+
+    def __init__(self, *, poll_seconds: float = 15.0, lease_seconds: int = 60, refresh_seconds: int = 300, max_catchup: int = 24):
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.refresh_seconds = refresh_seconds
+        self.max_catchup = max_catchup
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._heap: list[tuple[datetime, int, int]] = []
+        self._generation: dict[int, int] = {}
+        self._loaded_at: datetime | None = None
+        self._seen_updated_at: datetime | None = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _push(self, schedule_id: int, next_run_at: datetime, jitter_seconds: int) -> None:
+        due = next_run_at
+        if jitter_seconds > 0:
+            due = next_run_at + timedelta(seconds=random.uniform(0, jitter_seconds))
+        with self._lock:
+            generation = self._generation.get(schedule_id, 0) + 1
+            self._generation[schedule_id] = generation
+            heapq.heappush(self._heap, (due, schedule_id, generation))
+
+    def _drop(self, schedule_id: int) -> None:
+        with self._lock:
+            self._generation.pop(schedule_id, None)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._generation)
+
+    def load(self, db: Session, now: datetime | None = None) -> None:
+        rows = (
+            db.query(WorkflowSchedule.id, WorkflowSchedule.next_run_at, WorkflowSchedule.jitter_seconds)
+            .filter(WorkflowSchedule.enabled.is_(True), WorkflowSchedule.next_run_at.is_not(None))
+            .all()
+        )
+        with self._lock:
+            self._heap = []
+            self._generation = {}
+        for schedule_id, next_run_at, jitter_seconds in rows:
+            self._push(schedule_id, next_run_at, jitter_seconds or 0)
+        self._seen_updated_at = db.query(func.max(WorkflowSchedule.updated_at)).scalar()
+        self._loaded_at = now or datetime.utcnow()
+
+    def sync_changes(self, db: Session) -> int:
+        """Apply schedules edited since the last load or sync; returns how many were re-read."""
+        query = db.query(WorkflowSchedule.id, WorkflowSchedule.enabled, WorkflowSchedule.next_run_at, WorkflowSchedule.jitter_seconds, WorkflowSchedule.updated_at)
+        if self._seen_updated_at is not None:
+            # >= so rows committed later with the same timestamp are not missed; re-pushing is harmless.
+            query = query.filter(WorkflowSchedule.updated_at >= self._seen_updated_at)
+        rows = query.all()
+        for schedule_id, enabled, next_run_at, jitter_seconds, updated_at in rows:
+            if enabled and next_run_at:
+                self._push(schedule_id, next_run_at, jitter_seconds or 0)
+            else:
+                self._drop(schedule_id)
+            if self._seen_updated_at is None or updated_at > self._seen_updated_at:
+                self._seen_updated_at = updated_at
+        return len(rows)
+
+    def notify_changed(self, schedule: WorkflowSchedule) -> None:
+        """Reschedule an edited schedule right away when this process leads; other leaders pick it up via ``sync_changes``."""
+        if not self.is_leader:
+            return
+        if schedule.enabled and schedule.next_run_at:
+            self._push(schedule.id, schedule.next_run_at, schedule.jitter_seconds or 0)
+        else:
+            self._drop(schedule.id)
+        self._wake.set()
+
+    def acquire_lease(self, db: Session, now: datetime) -> bool:
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        updated = (
+            db.query(SchedulerLease)
+            .filter(SchedulerLease.name == self.lease_name, or_(SchedulerLease.holder == self.holder, SchedulerLease.expires_at < now))
+            .update({"holder": self.holder, "expires_at": expires_at}, synchronize_session=False)
+        )
+        if updated:
+            db.commit()
+            return True
+        if db.query(SchedulerLease.id).filter(SchedulerLease.name == self.lease_name).first():
+            db.rollback()
+            return False
+        db.add(SchedulerLease(name=self.lease_name, holder=self.holder, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        return True
+
+    def tick(self, now: datetime | None = None) -> int:
+        now = now or datetime.utcnow()
+        db = core_db.SessionLocal()
+        try:
+            if not self.acquire_lease(db, now):
+                self.is_leader = False
+                return 0
+            if not self.is_leader or self._loaded_at is None or (now - self._loaded_at).total_seconds() >= self.refresh_seconds:
+                self.load(db, now)
+            else:
+                self.sync_changes(db)
+            self.is_leader = True
+
+            fired = 0
+            while True:
+                with self._lock:
+                    if not self._heap or self._heap[0][0] > now:
+                        break
+                    _, schedule_id, generation = heapq.heappop(self._heap)
+                    if self._generation.get(schedule_id) != generation:
+                        continue
+                fired += self._fire(db, schedule_id, now)
+            return fired
+        finally:
+            db.close()
+
+    def _has_active_run(self, db: Session, schedule: WorkflowSchedule) -> bool:
+        if not schedule.last_run_id:
+            return False
+        status = db.query(WorkflowRun.status).filter(WorkflowRun.id == schedule.last_run_id).scalar()
+        return status in ACTIVE_RUN_STATUSES
+
+    def _fire(self, db: Session, schedule_id: int, now: datetime) -> int:
+        schedule = db.query(WorkflowSchedule).filter(WorkflowSchedule.id == schedule_id).first()
+        if not schedule or not schedule.enabled or schedule.next_run_at is None:
+            self._drop(schedule_id)
+            return 0
+        if schedule.next_run_at > now:
+            self._push(schedule.id, schedule.next_run_at, schedule.jitter_seconds or 0)
+            return 0
+        workflow = db.query(WorkflowTemplate).filter(WorkflowTemplate.id == schedule.workflow_id, WorkflowTemplate.tenant_id == schedule.tenant_id).first()
+        try:
+            cron = parse_cron(schedule.cron_expr)
+        except CronError:
+            cron = None
+        if not workflow or cron is None:
+            schedule.enabled = False
+            db.commit()
+            self._drop(schedule.id)
+            return 0
+
+        slots = [schedule.next_run_at]
+        if schedule.catchup_policy == "catch_up":
+            slot = next_fire(cron, schedule.next_run_at, schedule.timezone)
+            while slot <= now and len(slots) < self.max_catchup:
+                slots.append(slot)
+                slot = next_fire(cron, slot, schedule.timezone)
+        schedule.next_run_at = next_fire(cron, now, schedule.timezone)
+
+        fired = 0
+        for slot in slots:
+            if not schedule.allow_overlap and self._has_active_run(db, schedule):
+                emit_event(
+                    db,
+                    tenant_id=schedule.tenant_id,
+                    event_type="workflow_schedule_skipped",
+                    entity_type="workflow_schedule",
+                    entity_id=schedule.id,
+                    severity="info",
+                    title=f"Scheduled run skipped: {workflow.name}",
+                    detail={"detail": f"Run #{schedule.last_run_id} still active for slot {slot.isoformat()}"},
+                )
+                break
+            run = WorkflowRun(tenant_id=schedule.tenant_id, workflow_id=workflow.id, status="queued", triggered_by_user_id=schedule.created_by_user_id)
+            db.add(run)
+            db.flush()
+            schedule.last_run_id = run.id
+            schedule.last_run_at = now
+            emit_event(
+                db,
+                tenant_id=schedule.tenant_id,
+                event_type="workflow_run_queued",
+                entity_type="workflow_run",
+                entity_id=run.id,
+                severity="info",
+                title=f"Scheduled workflow run queued (Run #{run.id})",
+                detail={"detail": f"{workflow.name} · slot {slot.isoformat()}"},
+            )
+            db.commit()
+            enqueue_workflow_run(schedule.tenant_id, run.id)
+            fired += 1
+            db.expire_all()
+
+        db.commit()
+        self._push(schedule.id, schedule.next_run_at, schedule.jitter_seconds or 0)
+        return fired
+
+    def _sleep_seconds(self) -> float:
+        with self._lock:
+            if not self._heap:
+                return self.poll_seconds
+            delta = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+        return max(0.5, min(self.poll_seconds, delta))
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception:
+                logger.exception("Workflow scheduler tick failed")
+            self._wake.wait(self._sleep_seconds())
+            self._wake.clear()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="workflow-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+scheduler = WorkflowScheduler(poll_seconds=get_settings().scheduler_poll_seconds)
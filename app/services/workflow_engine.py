@@ -3,8 +3,10 @@ import time
 from datetime import datetime
 
 import app.core.db as core_db
-from app.models import Approval, ApprovalRequest, Job, RunLog, RunStep, WorkflowRun, WorkflowStep
+from app.models import Approval, ApprovalRequest, Job, RunLog, RunStep, WorkflowRun
 from app.services.intelligence import audit_change, emit_event
+from app.services.job_dispatcher import claim_job, dispatcher
+from app.services.workflow_templates import compile_template
 
 
 TERMINAL = {"succeeded", "failed", "blocked", "canceled"}
@@ -20,12 +22,24 @@ def enqueue_workflow_run(tenant_id: int, run_id: int) -> Job:
     finally:
         db.close()
 
-    # Execute inline to keep DB session behavior deterministic across local sqlite
-    # and tests; UI still receives progress updates via job/run state polling/SSE.
-    _execute_workflow_job(job.id)
+    # With JOB_WORKERS=0 the dispatcher executes inline to keep DB session behavior
+    # deterministic across local sqlite and tests; UI still receives progress updates
+    # via job/run state polling/SSE.
+    dispatcher.submit(tenant_id, job.id, _execute_workflow_job)
     return job
 
 
+def requeue_pending_jobs() -> int:
+    db = core_db.SessionLocal()
+    try:
+        pending = db.query(Job.id, Job.tenant_id).filter(Job.kind == "workflow_run", Job.status == "queued").order_by(Job.id.asc()).all()
+    finally:
+        db.close()
+    for job_id, tenant_id in pending:
+        dispatcher.submit(tenant_id, job_id, _execute_workflow_job)
+    return len(pending)
+
+
 def _log(db, tenant_id: int, run_id: int, msg: str, level: str = "info"):
     db.add(RunLog(tenant_id=tenant_id, run_id=run_id, level=level, message=msg))
 
@@ -33,7 +47,7 @@ def _log(db, tenant_id: int, run_id: int, msg: str, level: str = "info"):
 def _execute_workflow_job(job_id: int) -> None:
     db = core_db.SessionLocal()
     try:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = claim_job(db, job_id, "workflow_run")
         if not job:
             return
         payload = json.loads(job.payload_json or "{}")
@@ -46,17 +60,12 @@ def _execute_workflow_job(job_id: int) -> None:
             db.commit()
             return
 
-        steps = (
-            db.query(WorkflowStep)
-            .filter(WorkflowStep.workflow_id == run.workflow_id, WorkflowStep.tenant_id == run.tenant_id)
-            .order_by(WorkflowStep.step_order.asc())
-            .all()
-        )
+        compiled = compile_template(db, run.workflow_id, run.tenant_id)
+        steps = compiled.steps if compiled else ()
         total = max(1, len(steps))
 
         run.status = "running"
         run.started_at = datetime.utcnow()
-        job.status = "running"
         _log(db, run.tenant_id, run.id, "Workflow started")
         db.commit()
 
@@ -72,7 +81,7 @@ def _execute_workflow_job(job_id: int) -> None:
             _log(db, run.tenant_id, run.id, f"Step {idx}: {step.name} started")
             db.commit()
 
-            if step.gating_policy == "approve":
+            if step.requires_approval:
                 rs.status = "blocked"
                 rs.ended_at = datetime.utcnow()
                 run.status = "blocked"
@@ -219,9 +228,9 @@ def approve_run(run_id: int, tenant_id: int, user_id: int) -> None:
 
         _log(db, tenant_id, run_id, "Approval granted, workflow resumed")
 
-        steps = db.query(WorkflowStep).filter(WorkflowStep.workflow_id == run.workflow_id, WorkflowStep.tenant_id == tenant_id).order_by(WorkflowStep.step_order.asc()).all()
-        finished_names = {x.step_name for x in db.query(RunStep).filter(RunStep.run_id == run_id, RunStep.tenant_id == tenant_id, RunStep.status == "succeeded").all()}
-        remaining = [s for s in steps if s.name not in finished_names]
+        compiled = compile_template(db, run.workflow_id, tenant_id)
+        finished_names = {x.step_name for x in db.query(RunStep.step_name).filter(RunStep.run_id == run_id, RunStep.tenant_id == tenant_id, RunStep.status == "succeeded").all()}
+        remaining = compiled.remaining_after(finished_names) if compiled else ()
 
         for idx, step in enumerate(remaining, start=1):
             rs = RunStep(tenant_id=tenant_id, run_id=run_id, step_name=step.name, status="running", started_at=datetime.utcnow())
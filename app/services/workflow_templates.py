@@ -0,0 +1,151 @@
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from sqlalchemy.orm import Session
+
+from app.models import WorkflowStep, WorkflowTemplate
+
+MAX_COMPILED_TEMPLATES = 512
+
+
+@dataclass(frozen=True)
+class CompiledStep:
+    step_id: int
+    order: int
+    name: str
+    action_type: str
+    agent_key: str
+    gating_policy: str
+    config: Mapping[str, Any]
+
+    @property
+    def requires_approval(self) -> bool:
+        return self.gating_policy == "approve"
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    template_id: int
+    tenant_id: int
+    version: int
+    name: str
+    steps: tuple[CompiledStep, ...]
+    gates: tuple[str, ...]
+
+    def remaining_after(self, finished_names: set[str]) -> tuple[CompiledStep, ...]:
+        return tuple(s for s in self.steps if s.name not in finished_names)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _parse_config(raw: str) -> Mapping[str, Any]:
+    try:
+        parsed = json.loads(raw or "{}")
+    except (TypeError, ValueError):
+        parsed = {}
+    if not isinstance(parsed, dict):
+        parsed = {"value": parsed}
+    return _freeze(parsed)
+
+
+class TemplateCache:
+    def __init__(self, max_entries: int = MAX_COMPILED_TEMPLATES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[int, int], CompiledTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[int, int]) -> CompiledTemplate | None:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return compiled
+
+    def put(self, compiled: CompiledTemplate) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == compiled.template_id and k[1] != compiled.version]:
+                del self._entries[key]
+            self._entries[(compiled.template_id, compiled.version)] = compiled
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, template_id: int) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == template_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "max_entries": self.max_entries}
+
+
+template_cache = TemplateCache()
+
+
+def compile_template(db: Session, template_id: int, tenant_id: int) -> CompiledTemplate | None:
+    head = (
+        db.query(WorkflowTemplate.id, WorkflowTemplate.version, WorkflowTemplate.name)
+        .filter(WorkflowTemplate.id == template_id, WorkflowTemplate.tenant_id == tenant_id)
+        .first()
+    )
+    if head is None:
+        return None
+    cached = template_cache.get((head.id, head.version))
+    if cached is not None:
+        return cached
+
+    rows = (
+        db.query(WorkflowStep)
+        .filter(WorkflowStep.workflow_id == template_id, WorkflowStep.tenant_id == tenant_id)
+        .order_by(WorkflowStep.step_order.asc(), WorkflowStep.id.asc())
+        .all()
+    )
+    steps = tuple(
+        CompiledStep(
+            step_id=row.id,
+            order=row.step_order,
+            name=row.name,
+            action_type=row.action_type,
+            agent_key=row.agent_key,
+            gating_policy=row.gating_policy,
+            config=_parse_config(row.config_json),
+        )
+        for row in rows
+    )
+    compiled = CompiledTemplate(
+        template_id=head.id,
+        tenant_id=tenant_id,
+        version=head.version,
+        name=head.name,
+        steps=steps,
+        gates=tuple(s.name for s in steps if s.requires_approval),
+    )
+    template_cache.put(compiled)
+    return compiled
+
+
+def bump_template_version(workflow: WorkflowTemplate) -> int:
+    workflow.version = (workflow.version or 1) + 1
+    template_cache.invalidate(workflow.id)
+    return workflow.version
@@ -34,6 +34,7 @@
     "project-created": "Project created.",
     "financials-updated": "Client financials updated.",
     "campaign-created": "Campaign saved to Marketing.",
+    "content-packs-queued": "Content packs are being generated.",
   };
 
   const params = new URLSearchParams(window.location.search);
@@ -170,8 +171,11 @@
     overlay.hidden = false;
   }
 
-  document.querySelectorAll("[data-quick-view]").forEach((btn) => {
-    btn.addEventListener("click", async () => {
+  // Delegated so quick-view buttons inside lazily loaded fragments work too.
+  document.addEventListener("click", async (e) => {
+    const btn = e.target.closest("[data-quick-view]");
+    if (!btn) return;
+    {
       const contacts = (btn.dataset.contacts || "")
         .split("||")
         .map((x) => x.trim())
@@ -187,7 +191,7 @@
         }
       }
       openPanel(btn.dataset.title || "Quick View", btn.dataset.meta || "", btn.dataset.details || "", contacts, quickData);
-    });
+    }
   });
 
   if (panelClose) panelClose.addEventListener("click", closePanel);
@@ -195,14 +199,13 @@
 
   const focusToggle = qs("focus-mode-toggle");
   const intelligenceCol = qs("intelligence-col");
-  const sectionsToHide = Array.from(document.querySelectorAll("[data-focus-hide]"));
   if (focusToggle) {
     let focusMode = false;
     focusToggle.addEventListener("click", () => {
       focusMode = !focusMode;
       body.classList.toggle("focus-mode", focusMode);
       if (intelligenceCol) intelligenceCol.style.display = focusMode ? "none" : "";
-      sectionsToHide.forEach((el) => {
+      document.querySelectorAll("[data-focus-hide]").forEach((el) => {
         el.style.display = focusMode ? "none" : "";
       });
       focusToggle.textContent = focusMode ? "Exit Focus" : "Focus Mode";
@@ -210,13 +213,19 @@
   }
 
   const feedFilters = document.querySelectorAll("[data-feed-filter]");
-  const feedRows = document.querySelectorAll("[data-feed-kind]");
+  const feedRowsNow = () => document.querySelectorAll("[data-feed-kind]");
   const muteBtn = qs("feed-mute");
   const mutedFeedKey = `muted_feed_${tenantId}`;
   const mutedIds = new Set(JSON.parse(localStorage.getItem(mutedFeedKey) || "[]"));
-  feedRows.forEach((row) => {
-    const id = row.dataset.feedId;
-    if (id && mutedIds.has(id)) row.hidden = true;
+  function applyFeedMutes() {
+    feedRowsNow().forEach((row) => {
+      const id = row.dataset.feedId;
+      if (id && mutedIds.has(id)) row.hidden = true;
+    });
+  }
+  applyFeedMutes();
+  document.addEventListener("fragment:loaded", (e) => {
+    if (e.detail.name === "feed") applyFeedMutes();
   });
   let feedMuted = false;
   if (feedFilters.length) {
@@ -228,7 +237,7 @@
           feedFilters.forEach((el) => {
             if (el !== chip) el.classList.remove("active");
           });
-          feedRows.forEach((row) => {
+          feedRowsNow().forEach((row) => {
             row.hidden = false;
           });
           chip.classList.add("active");
@@ -241,14 +250,14 @@
         if (!active.length) {
           const all = document.querySelector('[data-feed-filter="all"]');
           if (all) all.classList.add("active");
-          feedRows.forEach((row) => {
+          feedRowsNow().forEach((row) => {
             row.hidden = false;
           });
           return;
         }
         const all = document.querySelector('[data-feed-filter="all"]');
         if (all) all.classList.remove("active");
-        feedRows.forEach((row) => {
+        feedRowsNow().forEach((row) => {
           row.hidden = !active.includes(row.dataset.feedKind);
         });
       });
@@ -259,17 +268,17 @@
       feedMuted = !feedMuted;
       muteBtn.textContent = feedMuted ? "Unmute" : "Mute";
       if (feedMuted) {
-        feedRows.forEach((row) => {
+        feedRowsNow().forEach((row) => {
           if (!row.hidden && row.dataset.feedId) mutedIds.add(row.dataset.feedId);
         });
         localStorage.setItem(mutedFeedKey, JSON.stringify(Array.from(mutedIds)));
-        feedRows.forEach((row) => {
+        feedRowsNow().forEach((row) => {
           if (row.dataset.feedId && mutedIds.has(row.dataset.feedId)) row.hidden = true;
         });
       } else {
         mutedIds.clear();
         localStorage.setItem(mutedFeedKey, "[]");
-        feedRows.forEach((row) => {
+        feedRowsNow().forEach((row) => {
           row.hidden = false;
         });
       }
@@ -544,17 +553,21 @@
 
     board.querySelectorAll(cardSelector).forEach((card) => {
       card.draggable = true;
-      card.addEventListener("dragstart", () => {
-        dragEl = card;
-        dragId = card.dataset[options.cardIdDataset];
-        const lane = card.closest(laneSelector);
-        sourceLaneValue = lane ? lane.dataset[options.laneDataset] : null;
-        card.classList.add("dragging");
-      });
-      card.addEventListener("dragend", () => {
-        card.classList.remove("dragging");
-        board.querySelectorAll(laneSelector).forEach((l) => l.classList.remove("lane-over"));
-      });
+    });
+    // Delegated so cards appended by lazy loading are draggable too.
+    board.addEventListener("dragstart", (e) => {
+      const card = e.target.closest(cardSelector);
+      if (!card) return;
+      dragEl = card;
+      dragId = card.dataset[options.cardIdDataset];
+      const lane = card.closest(laneSelector);
+      sourceLaneValue = lane ? lane.dataset[options.laneDataset] : null;
+      card.classList.add("dragging");
+    });
+    board.addEventListener("dragend", (e) => {
+      const card = e.target.closest(cardSelector);
+      if (card) card.classList.remove("dragging");
+      board.querySelectorAll(laneSelector).forEach((l) => l.classList.remove("lane-over"));
     });
 
     board.querySelectorAll(laneSelector).forEach((lane) => {
@@ -575,15 +588,21 @@
         const bodyParams = new URLSearchParams();
         bodyParams.set(options.fieldName, targetValue);
         try {
+          const headers = { "Content-Type": "application/x-www-form-urlencoded" };
+          if (options.onMoved) headers.Accept = "application/json";
           const response = await fetch(`${options.endpoint(dragId)}?tenant_id=${encodeURIComponent(tenantId)}`, {
             method: "POST",
-            headers: { "Content-Type": "application/x-www-form-urlencoded" },
+            headers,
             body: bodyParams.toString(),
           });
           if (!response.ok) throw new Error(`Update failed (${response.status})`);
           showToast(options.successToast(targetValue));
-          // Keep behavior deterministic with server ordering and empty-state handling.
-          window.location.reload();
+          if (options.onMoved) {
+            options.onMoved(board, lane, dragEl, await response.json());
+          } else {
+            // Keep behavior deterministic with server ordering and empty-state handling.
+            window.location.reload();
+          }
         } catch (err) {
           showToast("Could not update lane. Try again.");
         }
@@ -600,6 +619,16 @@
     fieldName: "status",
     endpoint: (id) => `/tasks/${id}/status`,
     successToast: (status) => `Task moved to ${status.replaceAll("_", " ")}.`,
+    onMoved: (board, lane, card, payload) => {
+      const items = lane.querySelector("[data-lane-items]") || lane;
+      items.prepend(card);
+      Object.entries(payload.counts || {}).forEach(([status, count]) => {
+        const badge = board.querySelector(`[data-lane-count="${status}"]`);
+        if (badge) badge.textContent = count;
+        const empty = board.querySelector(`[data-task-lane="${status}"] .lane-empty`);
+        if (empty) empty.hidden = count > 0;
+      });
+    },
   });
 
   setupDnD({
@@ -613,6 +642,100 @@
     successToast: (stage) => `Service moved to ${stage.replaceAll("_", " ")}.`,
   });
 
+  async function loadMore(btn) {
+    const target = qs(btn.dataset.target);
+    const cursor = btn.dataset.cursor;
+    if (!target || cursor === undefined || btn.dataset.loading === "1") return;
+    btn.dataset.loading = "1";
+    try {
+      const response = await fetch(cursor ? `${btn.dataset.url}&cursor=${encodeURIComponent(cursor)}` : btn.dataset.url);
+      if (!response.ok) throw new Error(`Load failed (${response.status})`);
+      target.insertAdjacentHTML("beforeend", await response.text());
+      // Loaded rows can carry their own lazy loaders (e.g. per-campaign keywords).
+      if (autoLoader) target.querySelectorAll("[data-load-more][data-auto]").forEach((el) => autoLoader.observe(el));
+      const next = response.headers.get("X-Next-Cursor");
+      if (next) {
+        btn.dataset.cursor = next;
+      } else {
+        btn.remove();
+      }
+    } catch (err) {
+      showToast("Could not load more items.");
+    } finally {
+      btn.dataset.loading = "0";
+    }
+  }
+
+  const autoLoader = "IntersectionObserver" in window
+    ? new IntersectionObserver((entries) => {
+        entries.forEach((entry) => {
+          if (entry.isIntersecting) loadMore(entry.target);
+        });
+      })
+    : null;
+
+  document.addEventListener("click", (event) => {
+    const btn = event.target.closest("[data-load-more]");
+    if (btn) loadMore(btn);
+  });
+  if (autoLoader) document.querySelectorAll("[data-load-more][data-auto]").forEach((btn) => autoLoader.observe(btn));
+
+  function applyFragment(container, html) {
+    container.innerHTML = html;
+    // Out-of-band pieces (hero counts, pulse strip) replace the element with the matching id.
+    container.querySelectorAll("template[data-oob]").forEach((tpl) => {
+      const target = qs(tpl.dataset.oob);
+      if (target) target.replaceChildren(tpl.content.cloneNode(true));
+      tpl.remove();
+    });
+    container.dataset.fragmentLoaded = "1";
+    document.dispatchEvent(new CustomEvent("fragment:loaded", { detail: { name: container.dataset.fragment } }));
+  }
+
+  async function loadFragment(container) {
+    try {
+      const response = await fetch(container.dataset.fragmentUrl);
+      if (!response.ok) throw new Error(`Fragment failed (${response.status})`);
+      applyFragment(container, await response.text());
+    } catch (err) {
+      showToast(`Could not load ${container.dataset.fragment}.`);
+    }
+  }
+
+  function refreshFragments(names) {
+    return Promise.all(
+      names.map((name) => {
+        const container = document.querySelector(`[data-fragment="${name}"]`);
+        return container ? loadFragment(container) : null;
+      }),
+    );
+  }
+
+  // Fire every fragment request at once; each panel fills in as soon as its own response lands.
+  document.querySelectorAll("[data-fragment-url]").forEach((container) => {
+    if (!container.hasAttribute("data-fragment-loaded")) loadFragment(container);
+  });
+
+  document.addEventListener("submit", async (e) => {
+    const form = e.target.closest("form[data-refresh]");
+    if (!form) return;
+    e.preventDefault();
+    try {
+      const response = await fetch(form.action, {
+        method: "POST",
+        headers: { "Content-Type": "application/x-www-form-urlencoded" },
+        body: new URLSearchParams(new FormData(form)).toString(),
+        redirect: "manual",
+      });
+      if (response.type !== "opaqueredirect" && !response.ok) throw new Error(`Save failed (${response.status})`);
+      form.reset();
+      await refreshFragments(form.dataset.refresh.split(/\s+/).filter(Boolean));
+      showToast("Saved.");
+    } catch (err) {
+      showToast("Could not save. Try again.");
+    }
+  });
+
   const platformEl = qs("marketing-platform");
   const objectiveEl = qs("marketing-objective");
   const subOptionEl = qs("marketing-sub-option");
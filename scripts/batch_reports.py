@@ -0,0 +1,39 @@
+import argparse
+import os
+import sys
+from datetime import date
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.services.batch_reports import generate_all_reports
+from app.services.rollups import PERIODS
+
+
+def run(workers: int, period: str, pdf: bool, tenant_ids: list[int] | None, report_date: date | None):
+    db = SessionLocal()
+    try:
+        result = generate_all_reports(
+            db,
+            database_url=get_settings().database_url,
+            workers=workers,
+            report_date=report_date,
+            period=period,
+            pdf=pdf,
+            tenant_ids=tenant_ids,
+        )
+        print(f"Batch {result['batch_id']}: {result['tenants']} tenants, {result['failed']} failed in {result['seconds']}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--period", choices=PERIODS, default="week")
+    parser.add_argument("--pdf", action="store_true")
+    parser.add_argument("--tenant-id", type=int, action="append", dest="tenant_ids")
+    parser.add_argument("--date", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+    run(args.workers, args.period, args.pdf, args.tenant_ids, args.date)
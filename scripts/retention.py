@@ -0,0 +1,31 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.db import SessionLocal
+from app.services.retention import DEFAULT_BATCH_SIZE, run_retention
+
+
+def run(tenant_id: int | None, batch_size: int):
+    db = SessionLocal()
+    try:
+        result = run_retention(db, tenant_id=tenant_id, batch_size=batch_size)
+        for name in result["partitions_created"]:
+            print(f"Created partition {name}")
+        for tid, purged in result["purged"].items():
+            print(f"Tenant {tid}: " + ", ".join(f"{table}={count}" for table, count in purged.items()))
+        for name in result["partitions_dropped"]:
+            print(f"Dropped partition {name}")
+        print(f"Pruned {result['report_artifacts_pruned']} superseded report artifacts")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tenant-id", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    run(args.tenant_id, args.batch_size)
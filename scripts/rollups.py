@@ -0,0 +1,20 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.db import SessionLocal
+from app.services.rollups import refresh_rollups
+
+
+def run():
+    db = SessionLocal()
+    try:
+        refreshed = refresh_rollups(db)
+        print(f"Refreshed {refreshed} daily rollups")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -11,6 +11,8 @@ from app.core.db import Base, get_db
 from app.core.security import hash_password
 from app.main import app
 from app.models import Membership, Tenant, User
+from app.services.cache import dashboard_cache
+from app.services.workflow_templates import template_cache
 
 
 @pytest.fixture()
@@ -44,6 +46,8 @@ def client() -> Generator[TestClient, None, None]:
     db.commit()
     db.close()
 
+    template_cache.clear()
+    dashboard_cache.clear()
     original_session_local = core_db.SessionLocal
     core_db.SessionLocal = TestingSessionLocal
 
@@ -0,0 +1,61 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import jsonutil
+from app.core.db import Base
+from app.main import app
+from app.models import Job, Tenant
+from app.services import batch_reports
+from app.services.batch_reports import generate_all_reports
+
+
+def test_batch_reports_fan_out_over_process_pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORT_ROOT", str(tmp_path / "reports"))
+    database_url = f"sqlite:///{tmp_path / 'batch.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    try:
+        db.add_all([Tenant(name=f"Tenant {i}") for i in range(5)])
+        db.commit()
+
+        result = generate_all_reports(db, database_url=database_url, workers=2, report_date=date(2026, 10, 19))
+        assert result["tenants"] == 5
+        assert result["failed"] == 0
+
+        jobs = db.query(Job).filter(Job.kind == batch_reports.JOB_KIND).all()
+        assert {j.status for j in jobs} == {"succeeded"}
+        payload = jsonutil.loads(jobs[0].payload_json)
+        assert payload["batch_id"] == result["batch_id"]
+        assert payload["seconds"] >= 0
+        assert payload["artifacts"]["csv"].endswith(".csv")
+    finally:
+        db.close()
+        engine.dispose()
+    assert len(list((tmp_path / "reports").glob("tenant_*/*.html"))) == 5
+
+
+def test_batch_reports_record_per_tenant_failures(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORT_ROOT", str(tmp_path))
+    original = batch_reports.build_tenant_report
+
+    def flaky(db, tenant_id, report_date, period, pdf):
+        if tenant_id == 2:
+            raise RuntimeError("boom")
+        return original(db, tenant_id, report_date, period, pdf)
+
+    monkeypatch.setattr(batch_reports, "build_tenant_report", flaky)
+    db = app.state.testing_sessionmaker()
+    try:
+        result = generate_all_reports(db, database_url="sqlite://", workers=0, pdf=True)
+        assert result["failed"] == 1
+        failed = db.query(Job).filter(Job.kind == batch_reports.JOB_KIND, Job.status == "failed").one()
+        assert failed.tenant_id == 2
+        assert failed.error_message == "boom"
+        ok = db.query(Job).filter(Job.kind == batch_reports.JOB_KIND, Job.tenant_id == 1).one()
+        assert "pdf" in jsonutil.loads(ok.payload_json)["artifacts"]
+    finally:
+        db.close()
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from app.services.marketing import campaign_plan, campaign_plan_json, clear_plan_cache, plan_cache_info, plan_for, thaw
+
+
+def test_plans_are_memoized_on_normalized_inputs():
+    clear_plan_cache()
+    first = campaign_plan("Google Ads", "Traffic", 50000, 7, "Acme Dental", ["implants ", "", "veneers"], sub_option="")
+    second = campaign_plan("Google Ads", "Traffic", 50000, 7, "Acme Dental", ["implants", "veneers"], sub_option=None)
+    assert first is second
+    assert plan_cache_info()["misses"] == 1
+    assert plan_cache_info()["hits"] == 1
+
+    other = campaign_plan("Google Ads", "Traffic", 50000, 14, "Acme Dental", ["implants", "veneers"])
+    assert other["ad_set_count"] == 3
+    assert plan_cache_info()["entries"] == 2
+
+    raw = campaign_plan_json("Google Ads", "Traffic", 50000, 7, "Acme Dental", ["implants", "veneers"])
+    assert json.loads(raw) == thaw(first)
+    assert plan_for("Google Ads", "Traffic", 50000, 7, "Acme Dental", ["implants", "veneers"]).json_bytes == raw.encode("ascii")
+
+
+def test_cached_plans_cannot_be_mutated():
+    plan = campaign_plan("Meta Ads", "Lead Generation", 10000, 5, "Brightside Clinic")
+    with pytest.raises(TypeError):
+        plan["bid_strategy"] = "Manual"
+    with pytest.raises(AttributeError):
+        plan["keywords_suggested"].append("free")
+    copy = thaw(plan)
+    copy["keywords_suggested"].append("free")
+    assert "free" not in campaign_plan("Meta Ads", "Lead Generation", 10000, 5, "Brightside Clinic")["keywords_suggested"]
@@ -0,0 +1,69 @@
+import json
+
+from app.models import Client, MarketingCampaign
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _campaigns(client, count_clients, keywords=("zebra keyword",)):
+    names = [f"Summary Client {i}" for i in range(count_clients)]
+    for name in names:
+        client.post("/clients?tenant_id=1", data={"name": name, "contact_name": "Owner", "contact_email": "o@example.test"}, follow_redirects=False)
+    db = client.app.state.testing_sessionmaker()
+    try:
+        client_ids = [cid for (cid,) in db.query(Client.id).filter(Client.tenant_id == 1, Client.name.in_(names))]
+    finally:
+        db.close()
+    response = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": client_ids, "platforms": ["Google Ads", "Meta Ads"], "objectives": ["Traffic"], "budget": 70, "days": 7, "existing_keywords": list(keywords)},
+    )
+    assert response.status_code == 201
+    return response.json()["campaign_ids"]
+
+
+def test_summary_columns_are_written_with_the_campaign(client):
+    _login(client, "owner@test.local", "pass1234")
+    campaign_ids = _campaigns(client, 1)
+    db = client.app.state.testing_sessionmaker()
+    try:
+        for campaign in db.query(MarketingCampaign).filter(MarketingCampaign.id.in_(campaign_ids)):
+            plan = json.loads(campaign.plan_json)
+            assert campaign.daily_budget_cents == plan["daily_budget_cents"] == 1000
+            assert campaign.bid_strategy == plan["bid_strategy"]
+            assert campaign.sub_option == plan["sub_option"]
+            assert campaign.template_name == plan["template_name"]
+            assert campaign.keyword_count == 1 + len([k for k in plan["keywords_suggested"] if k != "zebra keyword"])
+    finally:
+        db.close()
+
+
+def test_marketing_page_pages_campaigns_and_loads_keywords_lazily(client):
+    _login(client, "owner@test.local", "pass1234")
+    campaign_ids = _campaigns(client, 15, ["zebra keyword", *(f"extra term {i}" for i in range(24))])
+
+    page = client.get("/marketing?tenant_id=1")
+    assert page.status_code == 200
+    assert "30 total" in page.text
+    assert "zebra keyword" not in page.text
+    assert page.text.count("Load keywords") == 25
+    assert "Load more campaigns" in page.text
+
+    first = client.get("/marketing/campaigns/rows?tenant_id=1")
+    more = client.get(f"/marketing/campaigns/rows?tenant_id=1&cursor={first.headers['X-Next-Cursor']}")
+    assert more.status_code == 200
+    assert "X-Next-Cursor" not in more.headers
+    assert more.text.count("<li>") == 5
+    assert client.get("/marketing/campaigns/rows?tenant_id=1&cursor=bogus").status_code == 400
+
+    keywords = client.get(f"/marketing/campaigns/{campaign_ids[0]}/keywords?tenant_id=1")
+    assert keywords.status_code == 200
+    assert keywords.text.count("<li>") == 20
+    rest = client.get(f"/marketing/campaigns/{campaign_ids[0]}/keywords?tenant_id=1&cursor={keywords.headers['X-Next-Cursor']}")
+    assert rest.text.count("<li>") == 5
+    assert "X-Next-Cursor" not in rest.headers
+    assert "zebra keyword" in keywords.text + rest.text
+    assert client.get("/marketing/campaigns/999999/keywords?tenant_id=1").status_code == 404
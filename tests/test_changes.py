@@ -0,0 +1,36 @@
+from app.main import app
+from app.models import Client
+from app.services import changes
+from app.services.intelligence import audit_change
+
+
+def test_changes_are_published_once_per_commit(client):
+    published: list[list[changes.Change]] = []
+    handler = changes.on_commit(published.append)
+    db = app.state.testing_sessionmaker()
+    try:
+        row = Client(tenant_id=2, name="Hooked Co")
+        db.add(row)
+        db.flush()
+        audit_change(db, tenant_id=2, actor_user_id=None, entity_type="client", entity_id=row.id, action="create", after={"name": row.name})
+        db.commit()
+
+        assert len(published) == 1
+        tables = {(c.tenant_id, c.table, c.op) for c in published[0]}
+        assert (2, "clients", "insert") in tables
+        assert (2, "audit_log", "insert") in tables
+        inserted = next(c for c in published[0] if c.table == "clients")
+        assert inserted.row_id == row.id
+        assert inserted.values["name"] == "Hooked Co"
+
+        row.name = "Renamed Co"
+        db.flush()
+        db.rollback()
+        assert len(published) == 1
+
+        db.delete(db.get(Client, row.id))
+        db.commit()
+        assert published[-1] == [changes.Change(2, "clients", row.id, "delete")]
+    finally:
+        changes.unsubscribe(handler)
+        db.close()
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.models import ConnectorRecord, ConnectorType
+from app.services import connector_sync
+from app.services import connector_http as connector_http_module
+from app.services.connector_http import ConnectorHttpPool, connector_http
+from app.services.connector_sync import FetchPage, HttpConnector, Record
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: Counter = Counter()
+    peers: set = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, **headers):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in headers.items():
+            self.send_header(key.replace("_", "-"), value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        self.hits[path] += 1
+        self.peers.add(self.client_address)
+        count = self.hits[path]
+        if path == "/cached":
+            self._send(200, {"count": count}, Cache_Control="max-age=60")
+        elif path == "/flaky":
+            self._send(503, {"error": "busy"}, Retry_After="0") if count <= 2 else self._send(200, {"count": count})
+        elif path == "/slow":
+            time.sleep(0.5)
+            self._send(200, {"count": count})
+        elif path == "/records":
+            start = int(self.path.partition("offset=")[2] or 0)
+            rows = [{"id": f"q{i}", "day": "2026-10-01", "clicks": i} for i in range(start, min(start + 3, 7))]
+            self._send(200, {"rows": rows, "next": start + 3 if start + 3 < 7 else None})
+        else:
+            self._send(200, {"count": count}, Cache_Control="no-store")
+
+
+@pytest.fixture()
+def upstream():
+    _Handler.hits = Counter()
+    _Handler.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def pool():
+    pool = ConnectorHttpPool(max_connections=4, retries=3)
+    yield pool
+    pool.close()
+
+
+def test_pool_reuses_connections_and_caches_gets(upstream, pool):
+    first = pool.run(pool.get(f"{upstream}/cached", params={"a": 1}))
+    second = pool.run(pool.get(f"{upstream}/cached", params={"a": 1}))
+    other_token = pool.run(pool.get(f"{upstream}/cached", params={"a": 1}, headers={"Authorization": "Bearer other"}))
+    assert first.json() == second.json() == {"count": 1}
+    assert other_token.json() == {"count": 2}
+
+    for _ in range(4):
+        pool.run(pool.get(f"{upstream}/fresh"))
+    assert _Handler.hits["/fresh"] == 4
+    assert len(_Handler.peers) == 1
+
+    metrics = pool.metrics()
+    host = metrics["hosts"][upstream]
+    assert metrics["http2"] is (connector_http_module.h2 is not None) and metrics["clients"] == 1
+    assert host["requests"] == 6 and host["cache_hits"] == 1
+    assert host["in_flight"] == 0 and 0 < host["peak_utilization"] <= 1
+
+
+def test_pool_retries_retryable_statuses(upstream, pool):
+    response = pool.run(pool.get(f"{upstream}/flaky"))
+    assert response.status_code == 200
+    assert pool.metrics()["hosts"][upstream]["retries"] == 2
+
+    with pytest.raises(RuntimeError):
+        pool.run(_direct_request(pool, upstream))
+
+
+def test_call_bridges_from_another_loop_with_a_timeout(upstream, pool):
+    async def caller():
+        response = await pool.call(pool.get(f"{upstream}/fresh"))
+        with pytest.raises(TimeoutError):
+            await pool.call(pool.get(f"{upstream}/slow"), timeout=0.05)
+        return response, asyncio.get_running_loop()
+
+    response, caller_loop = asyncio.run(caller())
+    assert response.json() == {"count": 1}
+    assert caller_loop is not pool._loop
+
+
+async def _direct_request(pool, upstream):
+    # A coroutine scheduled on the pool loop that tries to block on the pool again.
+    return pool.run(pool.get(f"{upstream}/fresh"))
+
+
+def test_http_connector_syncs_through_the_shared_pool(client, upstream, monkeypatch):
+    class ConsoleApi(HttpConnector):
+        key = "search_console"
+        base_url = upstream
+
+        async def fetch(self, cursor, config):
+            # The sync itself stays off the pool thread; only get_json hops onto it.
+            assert threading.current_thread() is not connector_http._thread
+            body = await self.get_json("/records", params={"offset": cursor or 0})
+            records = [Record("query_day", row["id"], date.fromisoformat(row["day"]), name=row["id"], clicks=row["clicks"]) for row in body["rows"]]
+            return FetchPage(records, str(body["next"] or "done"), body["next"] is not None)
+
+    monkeypatch.setitem(connector_sync.CONNECTORS, "search_console", ConsoleApi())
+    client.post("/login", data={"email": "owner@test.local", "password": "pass1234"}, follow_redirects=False)
+    client.get("/connectors?tenant_id=1")
+    db = client.app.state.testing_sessionmaker()
+    type_id = db.query(ConnectorType.id).filter(ConnectorType.key == "search_console").scalar()
+    db.close()
+    client.post("/connectors?tenant_id=1", data={"connector_type_id": type_id, "name": "Console", "mode": "api"}, follow_redirects=False)
+    client.post("/connectors/sync?tenant_id=1", follow_redirects=False)
+
+    db = client.app.state.testing_sessionmaker()
+    try:
+        assert db.query(ConnectorRecord).filter(ConnectorRecord.record_type == "query_day").count() == 7
+    finally:
+        db.close()
+    assert _Handler.hits["/records"] == 3
+    assert client.get("/connectors/http-metrics?tenant_id=1").json()["hosts"][upstream]["requests"] == 3
+    assert connector_http.metrics()["clients"] >= 1
@@ -0,0 +1,152 @@
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models import ConnectorInstance, ConnectorRecord, ConnectorRun, ConnectorType
+from app.services import connector_sync
+from app.services.connector_sync import FIXTURE_DAYS, FIXTURES, AsyncRateLimiter, FakeConnector, RetryableError, with_backoff
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _instance(client, key, name, mode="fixture"):
+    client.get("/connectors?tenant_id=1")
+    db = client.app.state.testing_sessionmaker()
+    try:
+        type_id = db.query(ConnectorType.id).filter(ConnectorType.key == key).scalar()
+    finally:
+        db.close()
+    client.post("/connectors?tenant_id=1", data={"connector_type_id": type_id, "name": name, "mode": mode}, follow_redirects=False)
+    db = client.app.state.testing_sessionmaker()
+    try:
+        return db.query(ConnectorInstance.id).filter(ConnectorInstance.name == name).scalar()
+    finally:
+        db.close()
+
+
+def _state(client, instance_id):
+    db = client.app.state.testing_sessionmaker()
+    try:
+        instance = db.get(ConnectorInstance, instance_id)
+        runs = db.query(ConnectorRun).filter(ConnectorRun.connector_instance_id == instance_id).order_by(ConnectorRun.id).all()
+        records = db.query(ConnectorRecord).filter(ConnectorRecord.connector_instance_id == instance_id).count()
+        return instance.sync_cursor, [(r.status, r.records_synced) for r in runs], records
+    finally:
+        db.close()
+
+
+def test_sync_all_fetches_fixtures_and_resumes_incrementally(client):
+    _login(client, "owner@test.local", "pass1234")
+    ads = _instance(client, "google_ads", "Ads API")
+    ga4 = _instance(client, "ga4", "GA4 API")
+    manual = _instance(client, "email", "Mailer", mode="manual")
+    # No real Google Ads connector is registered, so an api instance keeps the manual path and writes nothing.
+    live = _instance(client, "google_ads", "Ads Live", mode="api")
+
+    assert client.post("/connectors/sync?tenant_id=1", follow_redirects=False).status_code == 303
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    ads_rows = FIXTURE_DAYS * len(FIXTURES["google_ads"].entities)
+    assert _state(client, ads) == (yesterday, [("succeeded", ads_rows)], ads_rows)
+    assert _state(client, ga4)[2] == FIXTURE_DAYS * len(FIXTURES["ga4"].entities)
+    assert _state(client, manual)[1] == [("succeeded", 0)]
+    assert _state(client, live) == ("", [("succeeded", 0)], 0)
+
+    db = client.app.state.testing_sessionmaker()
+    try:
+        extras = {row.extra_json for row in db.query(ConnectorRecord).filter(ConnectorRecord.connector_instance_id.in_([ads, ga4]))}
+        assert all(json.loads(extra)["source"] == "fixture" for extra in extras)
+        assert "No api connector for google_ads" in db.query(ConnectorRun.log).filter(ConnectorRun.connector_instance_id == live).scalar()
+    finally:
+        db.close()
+
+    client.post(f"/connectors/{ads}/run?tenant_id=1", follow_redirects=False)
+    assert _state(client, ads) == (yesterday, [("succeeded", ads_rows), ("succeeded", 0)], ads_rows)
+
+    listed = client.get(f"/api/connector-records?tenant_id=1&connector_instance_id={ads}&limit=5").json()
+    assert len(listed["items"]) == 5 and listed["next_cursor"]
+    page = client.get("/connectors?tenant_id=1")
+    assert f"{ads_rows} records" in page.text
+
+
+def test_failed_run_resumes_from_the_last_committed_page(client, monkeypatch):
+    class FlakyConnector(FakeConnector):
+        exploded = False
+
+        async def fetch(self, cursor, config):
+            if ":" in cursor and not self.exploded:
+                self.exploded = True
+                raise RuntimeError("upstream exploded")
+            return await super().fetch(cursor, config)
+
+    monkeypatch.setitem(connector_sync.FIXTURE_CONNECTORS, "meta_ads", FlakyConnector("meta_ads", FIXTURES["meta_ads"]))
+    _login(client, "owner@test.local", "pass1234")
+    meta = _instance(client, "meta_ads", "Meta API")
+
+    client.post(f"/connectors/{meta}/run?tenant_id=1", follow_redirects=False)
+    cursor, runs, records = _state(client, meta)
+    assert runs == [("failed", 0)]
+    assert cursor.endswith(":40") and records == 40
+
+    client.post(f"/connectors/{meta}/run?tenant_id=1", follow_redirects=False)
+    total = FIXTURE_DAYS * len(FIXTURES["meta_ads"].entities)
+    cursor, runs, records = _state(client, meta)
+    assert runs[-1] == ("succeeded", total - 40)
+    assert records == total
+
+
+def test_backoff_retries_transient_errors_and_rate_limiter_spaces_calls():
+    connector = FakeConnector("google_ads", FIXTURES["google_ads"], transient_failures=2)
+    page = asyncio.run(with_backoff(lambda: connector.fetch("", {})))
+    assert connector.calls == 3 and page.records
+
+    async def always_limited():
+        raise RetryableError("429", retry_after=0)
+
+    with pytest.raises(RetryableError):
+        asyncio.run(with_backoff(always_limited, retries=2))
+
+    limiter = AsyncRateLimiter(rate_per_second=100, burst=1)
+
+    async def burst():
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+
+    started = time.monotonic()
+    asyncio.run(burst())
+    assert time.monotonic() - started >= 0.045
+
+
+def test_requeue_leaves_live_runs_alone_and_claims_one_run_per_instance(client):
+    _login(client, "owner@test.local", "pass1234")
+    ads = _instance(client, "google_ads", "Ads Lease")
+    db = client.app.state.testing_sessionmaker()
+    try:
+        now = datetime.utcnow()
+        # Another process is syncing this instance right now.
+        live = ConnectorRun(tenant_id=1, connector_instance_id=ads, status="running", started_at=now, heartbeat_at=now)
+        queued = ConnectorRun(tenant_id=1, connector_instance_id=ads, status="queued")
+        db.add_all([live, queued])
+        db.commit()
+        live_id, queued_id = live.id, queued.id
+    finally:
+        db.close()
+
+    connector_sync.requeue_connector_runs()
+    db = client.app.state.testing_sessionmaker()
+    try:
+        assert db.get(ConnectorRun, live_id).status == "running"
+        assert db.get(ConnectorRun, queued_id).status == "skipped"
+        # The live worker died: its lease runs out and the next start resumes the run.
+        db.get(ConnectorRun, live_id).heartbeat_at = datetime.utcnow() - timedelta(seconds=connector_sync.RUN_LEASE_SECONDS + 1)
+        db.commit()
+    finally:
+        db.close()
+
+    assert connector_sync.requeue_connector_runs() == 1
+    _, runs, records = _state(client, ads)
+    assert runs[0] == ("succeeded", records) and records == FIXTURE_DAYS * len(FIXTURES["google_ads"].entities)
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from app.models import Client, ContentPack, Job
+from app.services.marketing import clear_content_pack_cache, content_pack, content_pack_cache_info, seo_content_pack, thaw
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _campaigns(client, name, keywords):
+    client.post("/clients?tenant_id=1", data={"name": name, "contact_name": "Owner", "contact_email": "o@example.test"}, follow_redirects=False)
+    db = client.app.state.testing_sessionmaker()
+    try:
+        client_id = db.query(Client.id).filter(Client.tenant_id == 1, Client.name == name).scalar()
+    finally:
+        db.close()
+    response = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": [client_id], "platforms": ["Google Ads", "Meta Ads"], "objectives": ["Traffic"], "budget": 50, "days": 7, "existing_keywords": keywords},
+    )
+    assert response.status_code == 201
+    return client_id, response.json()["campaign_ids"]
+
+
+def _packs(client, campaign_ids):
+    db = client.app.state.testing_sessionmaker()
+    try:
+        return {(p.campaign_id, p.cluster_index): (p.cache_key, p.job_id, json.loads(p.pack_json)) for p in db.query(ContentPack).filter(ContentPack.campaign_id.in_(campaign_ids))}
+    finally:
+        db.close()
+
+
+def test_content_pack_cache_matches_uncached_output():
+    clear_content_pack_cache()
+    args = ("Acme", "https://acme.test", ["acme"], "Leads", ["roof repair", "roof repair cost"])
+    first = content_pack(*args)
+    assert content_pack(*args) is first
+    assert thaw(first) == seo_content_pack(*args)
+    assert content_pack_cache_info()["hits"] == 1
+    with pytest.raises(TypeError):
+        first["on_page"]["h1"] = "changed"
+
+
+def test_job_writes_a_pack_per_cluster_and_skips_unchanged_inputs(client):
+    _login(client, "owner@test.local", "pass1234")
+    keywords = ["roof repair", "roof repair cost", "emergency roof repair", "gutter cleaning", "gutter cleaning near me"]
+    client_id, campaign_ids = _campaigns(client, "Pack Client", keywords)
+
+    queued = client.post(f"/marketing/content-packs/jobs?tenant_id=1&client_id={client_id}", headers={"Accept": "application/json"})
+    assert queued.status_code == 202
+    job_id = queued.json()["job_id"]
+    status = client.get(f"/marketing/content-packs/jobs/{job_id}?tenant_id=1").json()
+    assert status["status"] == "succeeded" and status["progress"] == 100
+
+    packs = _packs(client, campaign_ids)
+    assert {campaign_id for campaign_id, _ in packs} == set(campaign_ids)
+    assert len(packs) > len(campaign_ids)
+    assert all(job == job_id and "on_page" in pack for _, job, pack in packs.values())
+
+    rerun = client.post(f"/marketing/content-packs/jobs?tenant_id=1&client_id={client_id}", headers={"Accept": "application/json"}).json()
+    again = _packs(client, campaign_ids)
+    assert {key: (cache_key, job) for key, (cache_key, job, _) in again.items()} == {key: (cache_key, job) for key, (cache_key, job, _) in packs.items()}
+    assert rerun["job_id"] != job_id
+
+    listed = client.get(f"/api/content-packs?tenant_id=1&campaign_id={campaign_ids[0]}").json()
+    assert {item["campaign_id"] for item in listed["items"]} == {campaign_ids[0]}
+
+    page = client.get("/marketing?tenant_id=1")
+    assert "Load content packs" in page.text
+    fragment = client.get(f"/marketing/campaigns/{campaign_ids[0]}/content-packs?tenant_id=1")
+    assert fragment.status_code == 200
+    assert "Pack Client" in fragment.text
+
+
+def test_content_pack_job_requires_admin_and_tenant_client(client):
+    _login(client, "owner@test.local", "pass1234")
+    assert client.post("/marketing/content-packs/jobs?tenant_id=1&client_id=999999").status_code == 404
+    redirect = client.post("/marketing/content-packs/jobs?tenant_id=1", follow_redirects=False)
+    assert redirect.status_code == 303
+    db = client.app.state.testing_sessionmaker()
+    try:
+        job = db.query(Job).filter(Job.kind == "content_packs").order_by(Job.id.desc()).first()
+        assert job.status == "succeeded"
+    finally:
+        db.close()
+
+    client.post("/logout", follow_redirects=False)
+    _login(client, "viewer@test.local", "pass1234")
+    assert client.post("/marketing/content-packs/jobs?tenant_id=1").status_code == 403
+    assert client.get(f"/marketing/content-packs/jobs/{job.id}?tenant_id=1").status_code == 200
+
+
+def test_resubmitted_content_pack_job_runs_once(client):
+    from app.services.content_packs import requeue_content_pack_jobs, run_content_pack_job
+
+    _login(client, "owner@test.local", "pass1234")
+    client_id, campaign_ids = _campaigns(client, "Once Client", ["roof repair", "gutter cleaning"])
+    job_id = client.post(f"/marketing/content-packs/jobs?tenant_id=1&client_id={client_id}", headers={"Accept": "application/json"}).json()["job_id"]
+    packs = _packs(client, campaign_ids)
+
+    # Another process picking the same id out of its queue finds the job already claimed.
+    run_content_pack_job(job_id)
+    assert requeue_content_pack_jobs() == 0
+    assert client.get(f"/marketing/content-packs/jobs/{job_id}?tenant_id=1").json()["status"] == "succeeded"
+    assert _packs(client, campaign_ids) == packs
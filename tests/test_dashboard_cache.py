@@ -0,0 +1,85 @@
+import threading
+import time
+
+from app.main import app
+from app.services import cache as cache_module
+from app.services.cache import LRUCache, TenantCache, dashboard_cache
+from app.services.intelligence import emit_event
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_lru_backend_evicts_and_expires(monkeypatch):
+    backend = LRUCache(max_entries=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    assert backend.get("a") == "1"
+    backend.set("c", "3")
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+
+    now = time.monotonic()
+    backend.set("ttl", "x", ttl=5)
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 10)
+    assert backend.get("ttl") is None
+    assert backend.incr("v") == 1 and backend.counter("v") == 1
+
+
+def test_concurrent_misses_compute_once():
+    cache = TenantCache("test", backend=LRUCache())
+    calls = []
+    barrier = threading.Barrier(8)
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"value": 42}
+
+    def worker():
+        barrier.wait()
+        results.append(cache.get_or_compute(1, ("tiles",), compute))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 8
+
+    cache.bump(1)
+    assert cache.get_or_compute(1, ("tiles",), compute) == {"value": 42}
+    assert len(calls) == 2
+
+
+def test_dashboard_fragments_are_cached_until_tenant_writes(client):
+    _login(client, "owner@test.local", "pass1234")
+    client.get("/dashboard/fragments/feed?tenant_id=1")
+    misses = dashboard_cache.misses
+    client.get("/dashboard/fragments/feed?tenant_id=1")
+    assert dashboard_cache.misses == misses
+    assert dashboard_cache.hits >= 1
+
+    version = dashboard_cache.version(1)
+    other_version = dashboard_cache.version(2)
+    db = app.state.testing_sessionmaker()
+    try:
+        emit_event(db, tenant_id=1, event_type="deal_won", entity_type="deal", entity_id=1, severity="info", title="Cache buster", detail={})
+        db.rollback()
+        assert dashboard_cache.version(1) == version
+        emit_event(db, tenant_id=1, event_type="deal_won", entity_type="deal", entity_id=1, severity="info", title="Cache buster", detail={})
+        db.commit()
+    finally:
+        db.close()
+    assert dashboard_cache.version(1) == version + 1
+    assert dashboard_cache.version(2) == other_version
+    assert "Cache buster" in client.get("/dashboard/fragments/feed?tenant_id=1").text
+
+    created = client.post("/clients?tenant_id=1", data={"name": "Orm Flush Co"}, follow_redirects=False)
+    assert created.status_code == 303
+    assert dashboard_cache.version(1) >= version + 2
+    assert "Orm Flush Co" in client.get("/dashboard/fragments/tiles?tenant_id=1").text
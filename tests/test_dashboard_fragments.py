@@ -0,0 +1,73 @@
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_dashboard_shell_defers_panels_to_fragments(client):
+    _login(client, "owner@test.local", "pass1234")
+    created = client.post("/clients?tenant_id=1", data={"name": "Fragment Co", "contact_name": "Fay"}, follow_redirects=False)
+    assert created.status_code == 303
+
+    shell = client.get("/dashboard?tenant_id=1")
+    assert shell.status_code == 200
+    for name in ("decisions", "tiles", "feed", "metrics", "today"):
+        assert f"/dashboard/fragments/{name}?tenant_id=1&amp;mode=admin" in shell.text
+    assert "Fragment Co</h3>" not in shell.text
+
+    tiles = client.get("/dashboard/fragments/tiles?tenant_id=1")
+    assert tiles.status_code == 200
+    assert "Fragment Co</h3>" in tiles.text
+    assert tiles.headers["cache-control"] == "private, no-cache"
+
+    decisions = client.get("/dashboard/fragments/decisions?tenant_id=1")
+    assert "Approvals waiting" in decisions.text
+    assert 'data-oob="triage-numbers"' in decisions.text
+    assert "Client contact gaps: 1" in decisions.text
+
+    metrics = client.get("/dashboard/fragments/metrics?tenant_id=1")
+    assert "Automation Load" in metrics.text
+
+    revalidated = client.get("/dashboard/fragments/tiles?tenant_id=1", headers={"If-None-Match": tiles.headers["etag"]})
+    assert revalidated.status_code == 304
+
+    client.post("/approvals?tenant_id=1", data={"title": "Sign off"}, follow_redirects=False)
+    refreshed = client.get("/dashboard/fragments/decisions?tenant_id=1", headers={"If-None-Match": decisions.headers["etag"]})
+    assert refreshed.status_code == 200
+    assert "Approvals waiting: 1" in refreshed.text
+
+    client_mode = client.get("/dashboard/fragments/decisions?tenant_id=1&mode=client")
+    assert "Client approvals waiting" in client_mode.text
+    assert client.get("/dashboard/fragments/everything?tenant_id=1").status_code == 404
+
+
+def test_tile_quick_actions_refresh_fragments_with_shared_health(client, monkeypatch):
+    import app.routes.dashboard as dashboard
+
+    calls = []
+    real = dashboard.compute_client_health
+    monkeypatch.setattr(dashboard, "compute_client_health", lambda db, tenant_id, client_id: calls.append(client_id) or real(db, tenant_id, client_id))
+    _login(client, "owner@test.local", "pass1234")
+    client.post("/clients?tenant_id=1", data={"name": "Quick Co"}, follow_redirects=False)
+
+    tiles = client.get("/dashboard/fragments/tiles?tenant_id=1")
+    client.get("/dashboard/fragments/decisions?tenant_id=1")
+    # Decisions and tiles read one cached health computation per client.
+    assert len(calls) == 1
+    assert tiles.text.count('data-refresh="tiles decisions feed today"') == 2
+    assert "Approvals: <strong>0</strong>" in tiles.text
+
+    client_id = calls[0]
+    assert client.post("/approvals?tenant_id=1", data={"client_id": client_id, "title": "Tile sign off"}, follow_redirects=False).status_code == 303
+    refreshed = client.get("/dashboard/fragments/tiles?tenant_id=1", headers={"If-None-Match": tiles.headers["etag"]})
+    assert refreshed.status_code == 200
+    assert "Approvals: <strong>1</strong>" in refreshed.text
+    assert len(calls) == 2
+
+    _login(client, "viewer@test.local", "pass1234")
+    assert "data-refresh" not in client.get("/dashboard/fragments/tiles?tenant_id=1").text
+
+
+def test_dashboard_fragments_respect_tenant_access(client):
+    _login(client, "viewer@test.local", "pass1234")
+    assert client.get("/dashboard/fragments/feed?tenant_id=1").status_code == 200
+    assert client.get("/dashboard/fragments/feed?tenant_id=2").status_code == 403
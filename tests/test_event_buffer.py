@@ -0,0 +1,56 @@
+from sqlalchemy import event
+
+from app.main import app
+from app.models import AuditLog, Event, Tenant
+from app.services.event_buffer import flush_buffered
+from app.services.intelligence import audit_change, emit_event
+
+
+def _emit(db, n):
+    for idx in range(n):
+        emit_event(db, tenant_id=1, event_type="t", entity_type="x", entity_id=idx, severity="info", title=f"e{idx}", detail={"n": idx})
+        audit_change(db, tenant_id=1, actor_user_id=None, entity_type="x", entity_id=idx, action="update", after={"n": idx})
+
+
+def test_history_rows_are_bulk_inserted_with_the_business_write(client):
+    db = app.state.testing_sessionmaker()
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO events") or statement.startswith("INSERT INTO audit_log"):
+            statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        db.add(Tenant(name="Buffered"))
+        _emit(db, 3)
+        db.commit()
+        assert len(statements) == 2
+        assert db.query(Event).filter(Event.title.like("e%")).count() == 3
+        row = db.query(AuditLog).filter(AuditLog.entity_id == 2).one()
+        assert row.after_json == '{"n":2}'
+
+        db.add(Tenant(name="Rolled back"))
+        _emit(db, 2)
+        db.rollback()
+        db.commit()
+        assert db.query(Tenant).filter(Tenant.name == "Rolled back").count() == 0
+        assert db.query(Event).filter(Event.title.like("e%")).count() == 3
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+        db.close()
+
+
+def test_buffered_rows_return_a_handle_and_can_be_flushed_for_read_back(client):
+    db = app.state.testing_sessionmaker()
+    try:
+        handle = emit_event(db, tenant_id=1, event_type="handle", entity_type="x", entity_id=7, severity="info", title="handle")
+        assert handle["entity_id"] == 7 and "id" not in handle
+        assert db.query(Event).filter(Event.type == "handle").count() == 0
+        assert flush_buffered(db) == 1
+        assert db.query(Event).filter(Event.type == "handle").count() == 1
+        db.commit()
+        assert db.query(Event).filter(Event.type == "handle").count() == 1
+    finally:
+        db.close()
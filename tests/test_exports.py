@@ -0,0 +1,93 @@
+import csv
+import io
+import zipfile
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.models import Job, Task
+from app.services import exports
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _seed_tasks(n):
+    db = app.state.testing_sessionmaker()
+    try:
+        db.add_all([Task(tenant_id=1, created_by_user_id=1, title=f"Task <{i}>", status="done" if i % 2 else "todo") for i in range(n)])
+        db.add(Task(tenant_id=2, created_by_user_id=1, title="Other tenant"))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_streaming_csv_and_xlsx_exports(client, monkeypatch):
+    monkeypatch.setattr(exports, "YIELD_PER", 7)
+    _login(client, "owner@test.local", "pass1234")
+    _seed_tasks(25)
+
+    response = client.get("/exports/tasks?tenant_id=1&columns=id,title,status&status=done")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["id", "title", "status"]
+    assert len(rows) == 13
+    assert {r[2] for r in rows[1:]} == {"done"}
+
+    xlsx = client.get("/exports/tasks?tenant_id=1&fmt=xlsx&columns=id,title")
+    assert xlsx.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(xlsx.content)) as archive:
+        assert archive.testzip() is None
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert sheet.count("<row>") == 26
+    assert "Task &lt;3&gt;" in sheet
+    assert "Other tenant" not in sheet
+
+    assert client.get("/exports/tasks?tenant_id=1&columns=password_hash").status_code == 400
+    assert client.get("/exports/tasks?tenant_id=1&title=x").status_code == 400
+    assert client.get("/exports/users?tenant_id=1").status_code == 404
+
+
+def test_background_export_job(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("EXPORT_ROOT", str(tmp_path))
+    _login(client, "owner@test.local", "pass1234")
+    _seed_tasks(5)
+
+    created = client.post("/exports/tasks/jobs?tenant_id=1&status=todo")
+    assert created.status_code == 202
+    job_id = created.json()["job_id"]
+    assert client.get(f"/exports/jobs/{job_id}?tenant_id=1").json()["status"] == "succeeded"
+
+    download = client.get(f"/exports/jobs/{job_id}/download?tenant_id=1")
+    assert download.status_code == 200
+    assert len(list(csv.reader(io.StringIO(download.text)))) == 4
+    assert client.get(f"/exports/jobs/{job_id}?tenant_id=2").status_code == 404
+
+
+def test_requeue_reclaims_only_stale_running_exports(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("EXPORT_ROOT", str(tmp_path))
+    _seed_tasks(3)
+    params = exports.export_params("tasks", "csv", None, {}, None, None)
+    db = app.state.testing_sessionmaker()
+    try:
+        now = datetime.utcnow()
+        # One export is streaming in another process; the other lost its worker an hour ago.
+        live = Job(tenant_id=1, kind=exports.JOB_KIND, status="running", payload_json=exports.jsonutil.dumps(params), updated_at=now)
+        stale = Job(tenant_id=1, kind=exports.JOB_KIND, status="running", payload_json=exports.jsonutil.dumps(params), updated_at=now - timedelta(hours=1))
+        db.add_all([live, stale])
+        db.commit()
+        live_id, stale_id = live.id, stale.id
+    finally:
+        db.close()
+
+    assert exports.requeue_export_jobs() == 1
+    exports.run_export_job(live_id)
+    db = app.state.testing_sessionmaker()
+    try:
+        assert db.get(Job, live_id).status == "running"
+        assert db.get(Job, stale_id).status == "succeeded"
+    finally:
+        db.close()
+    assert not exports.export_path(Job(id=live_id, tenant_id=1, payload_json=exports.jsonutil.dumps(params))).exists()
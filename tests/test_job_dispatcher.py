@@ -0,0 +1,60 @@
+import app.routes.workflows as workflow_routes
+from app.services.job_dispatcher import FairJobDispatcher, TenantRateLimiter, parse_tenant_limits
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_dispatcher_interleaves_tenants_by_weight():
+    order: list[tuple[int, int]] = []
+    dispatcher = FairJobDispatcher(workers=1, tenant_limits=parse_tenant_limits("2::2"))
+
+    def handler_for(tenant_id):
+        return lambda job_id: order.append((tenant_id, job_id))
+
+    for job_id in range(1, 7):
+        dispatcher.submit(1, job_id, handler_for(1))
+    for job_id in range(101, 105):
+        dispatcher.submit(2, job_id, handler_for(2))
+    dispatcher.submit(3, 201, handler_for(3))
+
+    assert dispatcher.tenant_metrics(1)["queue_depth"] == 6
+    assert dispatcher.drain() == 11
+    assert [t for t, _ in order[:7]] == [1, 2, 2, 3, 1, 2, 2]
+    assert [j for t, j in order if t == 1] == [1, 2, 3, 4, 5, 6]
+    metrics = dispatcher.tenant_metrics(2)
+    assert metrics["dispatched"] == 4
+    assert metrics["weight"] == 2
+    assert metrics["queue_depth"] == 0
+
+
+def test_dispatcher_respects_tenant_concurrency_cap():
+    dispatcher = FairJobDispatcher(workers=1, default_concurrency=1)
+    dispatcher.submit(1, 1, lambda job_id: None)
+    dispatcher.submit(1, 2, lambda job_id: None)
+    dispatcher.submit(2, 3, lambda job_id: None)
+
+    with dispatcher._cond:
+        first = dispatcher._pick()
+        second = dispatcher._pick()
+        third = dispatcher._pick()
+    assert (first.tenant_id, second.tenant_id) == (1, 2)
+    assert third is None
+
+
+def test_run_creation_is_rate_limited_per_tenant(client, monkeypatch):
+    _login(client, "owner@test.local", "pass1234")
+    monkeypatch.setattr(workflow_routes, "run_rate_limiter", TenantRateLimiter(per_minute=1, burst=1))
+
+    wf = client.post("/workflows?tenant_id=1", data={"name": "Limited", "description": "x"}, follow_redirects=False)
+    workflow_id = int(wf.headers["location"].split("workflow_id=")[1])
+
+    assert client.post(f"/workflows/{workflow_id}/run?tenant_id=1", follow_redirects=False).status_code == 303
+    assert client.post(f"/workflows/{workflow_id}/run?tenant_id=1", follow_redirects=False).status_code == 429
+
+    metrics = client.get("/jobs/metrics?tenant_id=1").json()
+    assert metrics["tenant"]["tenant_id"] == 1
+    assert metrics["tenant"]["rejected_runs"] >= 1
+    assert "totals" not in metrics
@@ -0,0 +1,128 @@
+from app.models import Job, KeywordLshBand, KeywordSignature, MarketingKeyword
+from app.services.keyword_similarity import BANDS, JOB_KIND, cluster_keywords, near_duplicates, refresh_index, signatures
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _bulk_campaigns(client, names, objectives, keywords):
+    for name in names:
+        client.post("/clients?tenant_id=1", data={"name": name, "contact_name": "Owner", "contact_email": "o@example.test"}, follow_redirects=False)
+    found = client.get("/search?tenant_id=1&q=Sim").json()["clients"]
+    client_ids = [item["id"] for item in found if item["name"] in names]
+    response = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": client_ids, "platforms": ["Google Ads"], "objectives": objectives, "budget": 50, "existing_keywords": keywords},
+    )
+    assert response.status_code == 201
+    return response.json()["campaign_ids"]
+
+
+def test_minhash_estimates_similarity():
+    sigs = signatures(["dental implant toronto", "toronto dental implant", "roof repair"])
+    assert (sigs[0] == sigs[1]).mean() > 0.7
+    assert (sigs[0] == sigs[2]).mean() < 0.2
+
+
+def test_clusters_propose_ad_groups():
+    groups = cluster_keywords(
+        ["dental implants", "dental implant cost", "Dental Implants", "teeth whitening", "teeth whitening kit", "emergency dentist", "emergency dental care"]
+    )
+    by_lead = {g["lead_keyword"]: g["keywords"] for g in groups}
+    assert sum(len(g["keywords"]) for g in groups) == 6
+    assert any(set(kws) == {"teeth whitening", "teeth whitening kit"} for kws in by_lead.values())
+    assert any({"dental implants", "dental implant cost"} <= set(kws) for kws in by_lead.values())
+    assert cluster_keywords([]) == []
+
+
+def test_index_is_persisted_and_answers_similarity_queries(client):
+    _login(client, "owner@test.local", "pass1234")
+    campaign_ids = _bulk_campaigns(client, ["Sim Dental", "Sim Smiles"], ["Traffic"], ["dental implants toronto", "invisalign cost"])
+
+    db = client.app.state.testing_sessionmaker()
+    try:
+        keyword_count = db.query(MarketingKeyword).filter(MarketingKeyword.campaign_id.in_(campaign_ids)).count()
+        assert db.query(KeywordSignature).filter(KeywordSignature.campaign_id.in_(campaign_ids)).count() == keyword_count
+        indexed = db.query(KeywordLshBand).join(KeywordSignature, KeywordSignature.keyword_id == KeywordLshBand.keyword_id)
+        assert indexed.filter(KeywordSignature.campaign_id.in_(campaign_ids)).count() == keyword_count * BANDS
+    finally:
+        db.close()
+
+    similar = client.get("/marketing/keywords/similar?tenant_id=1&q=toronto dental implant&min_similarity=0.5").json()["results"]
+    assert {row["campaign_id"] for row in similar if row["keyword"] == "dental implants toronto"} == set(campaign_ids)
+    assert similar[0]["similarity"] >= similar[-1]["similarity"]
+
+    excluded = client.get(f"/marketing/keywords/similar?tenant_id=1&q=dental implants toronto&exclude_campaign_id={campaign_ids[0]}").json()["results"]
+    assert all(row["campaign_id"] != campaign_ids[0] for row in excluded)
+
+    pairs = client.get("/marketing/keywords/duplicates?tenant_id=1&min_similarity=0.9").json()["pairs"]
+    assert any(p["keyword"] == "invisalign cost" and p["duplicate"] == "invisalign cost" for p in pairs)
+    assert all(p["campaign_id"] != p["duplicate_campaign_id"] for p in pairs)
+
+    groups = client.get(f"/marketing/campaigns/{campaign_ids[0]}/ad-groups?tenant_id=1").json()["ad_groups"]
+    assert sum(len(g["keywords"]) for g in groups) == keyword_count // 2
+    assert client.get("/marketing/campaigns/999999/ad-groups?tenant_id=1").status_code == 404
+
+
+def test_reads_never_index_and_duplicate_candidates_are_bounded(client, monkeypatch):
+    import app.services.keyword_similarity as keyword_similarity
+
+    _login(client, "owner@test.local", "pass1234")
+    queued = []
+    monkeypatch.setattr(keyword_similarity.dispatcher, "submit", lambda tenant_id, job_id, handler: queued.append(job_id))
+    campaign_ids = _bulk_campaigns(client, ["Sim Alpha", "Sim Beta", "Sim Gamma"], ["Traffic"], ["roof repair", "gutter cleaning", "skylight install"])
+    _bulk_campaigns(client, ["Sim Delta"], ["Traffic"], ["roof repairs"])
+    # A job still waiting in the queue already covers the second batch.
+    assert len(queued) == 1
+
+    assert client.get("/marketing/keywords/similar?tenant_id=1&q=roof repair").json()["results"] == []
+    assert client.get("/marketing/keywords/duplicates?tenant_id=1").json()["pairs"] == []
+    db = client.app.state.testing_sessionmaker()
+    try:
+        assert db.query(KeywordSignature).count() == 0
+        assert db.query(Job).filter(Job.kind == JOB_KIND, Job.status == "queued").count() == 1
+    finally:
+        db.close()
+
+    keyword_similarity.run_keyword_index_job(queued[0])
+    db = client.app.state.testing_sessionmaker()
+    try:
+        keyword_count = db.query(MarketingKeyword).filter(MarketingKeyword.tenant_id == 1).count()
+        assert db.query(KeywordSignature).count() == keyword_count
+        # Re-running is a no-op, so overlapping jobs cannot duplicate bands.
+        assert refresh_index(db, 1) == 0
+        assert db.query(KeywordLshBand).count() == keyword_count * BANDS
+
+        everything = near_duplicates(db, 1, min_similarity=0.5, limit=500)
+        assert len(everything) > 2
+        monkeypatch.setattr(keyword_similarity, "DUPLICATE_CANDIDATES_PER_RESULT", 1)
+        capped = near_duplicates(db, 1, min_similarity=0.5, limit=2)
+        assert len(capped) <= 2
+        assert capped[0]["similarity"] == everything[0]["similarity"]
+    finally:
+        db.close()
+    assert {row["campaign_id"] for row in client.get("/marketing/keywords/similar?tenant_id=1&q=roof repair&min_similarity=0.9").json()["results"]} >= set(campaign_ids)
+
+
+def test_index_job_running_elsewhere_is_not_claimed_again(client):
+    import app.services.keyword_similarity as keyword_similarity
+
+    db = client.app.state.testing_sessionmaker()
+    try:
+        job = Job(tenant_id=1, kind=JOB_KIND, status="running", payload_json="{}")
+        db.add(job)
+        db.commit()
+        job_id = job.id
+    finally:
+        db.close()
+
+    assert keyword_similarity.requeue_keyword_index_jobs() == 0
+    keyword_similarity.run_keyword_index_job(job_id)
+    db = client.app.state.testing_sessionmaker()
+    try:
+        assert db.get(Job, job_id).status == "running"
+        assert db.query(KeywordSignature).count() == 0
+    finally:
+        db.close()
@@ -0,0 +1,114 @@
+import json
+
+from app.models import MarketingCampaign, MarketingKeyword, TenantKeyword
+from app.services.keywords import dedupe_keywords, expand_keywords, normalize_keyword, store_keywords
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_normalization_folds_case_spacing_punctuation_and_plurals():
+    assert normalize_keyword("  Dentists   NEAR-me ") == "dentist near me"
+    assert normalize_keyword("Joe's Bakeries") == "joe bakery"
+    assert normalize_keyword("business classes") == "business class"
+    assert normalize_keyword("google ads") == "google ads"
+    assert dedupe_keywords(["Dental Implants", "dental implant", "", "  ", "Implants"]) == ["Dental Implants", "Implants"]
+
+
+def test_orm_keyword_rows_fill_normalized(client):
+    db = client.app.state.testing_sessionmaker()
+    try:
+        campaign = MarketingCampaign(tenant_id=1, name="Seeded", platform="Google Ads", objective="Leads")
+        db.add(campaign)
+        db.flush()
+        row = MarketingKeyword(tenant_id=1, campaign_id=campaign.id, keyword="Emergency Plumbers")
+        db.add_all([row, TenantKeyword(tenant_id=1, keyword="Roof Repairs")])
+        db.commit()
+        assert row.normalized == "emergency plumber"
+        assert db.query(TenantKeyword.normalized).filter(TenantKeyword.tenant_id == 1).scalar() == "roof repair"
+        row.keyword = "Drain Cleaning"
+        assert row.normalized == "drain cleaning"
+    finally:
+        db.close()
+
+
+def test_expansion_streams_with_modifiers_negatives_and_cap():
+    seeds_consumed = 0
+
+    def seeds():
+        nonlocal seeds_consumed
+        for i in range(100000):
+            seeds_consumed += 1
+            yield f"emergency dental clinic {i}"
+
+    first = list(expand_keywords(seeds(), ["near me", "best {kw}"], limit=25))
+    assert len(first) == 25
+    assert seeds_consumed < 10
+    assert ("best emergency dental clinic 0", "best emergency dental clinic 0") in first
+
+    rows = list(expand_keywords(["cheap dental implants toronto"], ["near me"], ["cheap"], max_ngram=2))
+    keys = [key for _, key in rows]
+    assert all("cheap" not in key for key in keys)
+    assert "dental implant" in keys and "dental implant near me" in keys
+    assert len(keys) == len(set(keys))
+
+
+def test_tenant_index_ignores_duplicates(client):
+    db = client.app.state.testing_sessionmaker()
+    try:
+        assert store_keywords(db, 1, ["Roof Repair", "roof repairs", "gutter cleaning"], source="expansion") == 2
+        assert store_keywords(db, 1, ["ROOF REPAIR", "skylight install"], source="expansion") == 1
+        db.commit()
+        assert db.query(TenantKeyword).filter(TenantKeyword.tenant_id == 1).count() == 3
+        assert store_keywords(db, 2, ["roof repair"], source="expansion") == 1
+    finally:
+        db.close()
+
+
+def test_expand_and_index_endpoints(client):
+    _login(client, "owner@test.local", "pass1234")
+    payload = {"seeds": ["water heater repair", "Water Heater Repairs"], "modifiers": ["cost", "{kw} near me"], "negatives": ["diy"], "limit": 50}
+    streamed = client.post("/marketing/keywords/expand?tenant_id=1", json=payload)
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert lines[0] == {"keyword": "water heater repair", "normalized": "water heater repair"}
+    assert len({line["normalized"] for line in lines}) == len(lines)
+
+    indexed = client.post("/marketing/keywords/index?tenant_id=1", json=payload)
+    assert indexed.json() == {"expanded": len(lines), "inserted": len(lines), "existing": 0}
+    again = client.post("/marketing/keywords/index?tenant_id=1", json=payload)
+    assert again.json()["inserted"] == 0
+
+    listed = client.get("/api/keywords?tenant_id=1&source=expansion&limit=200")
+    assert len(listed.json()["items"]) == len(lines)
+
+
+def test_campaign_keywords_are_stored_normalized(client):
+    _login(client, "owner@test.local", "pass1234")
+    client.post("/clients?tenant_id=1", data={"name": "Norm Dental", "contact_name": "Owner", "contact_email": "o@example.test"}, follow_redirects=False)
+    client_id = next(item["id"] for item in client.get("/search?tenant_id=1&q=Norm Dental").json()["clients"] if item["name"] == "Norm Dental")
+    response = client.post(
+        "/marketing/campaigns?tenant_id=1",
+        data={
+            "name": "Norm",
+            "client_id": str(client_id),
+            "platform": "Google Ads",
+            "objective": "Traffic",
+            "budget": "100",
+            "days": "7",
+            "existing_keywords": "Dental Implants, dental implant, norm guide",
+        },
+        follow_redirects=False,
+    )
+    assert response.status_code == 303
+    db = client.app.state.testing_sessionmaker()
+    try:
+        rows = db.query(MarketingKeyword).filter(MarketingKeyword.tenant_id == 1, MarketingKeyword.keyword.ilike("%implant%")).all()
+        assert [(r.keyword, r.normalized, r.source) for r in rows] == [("Dental Implants", "dental implant", "user")]
+        assert db.query(MarketingKeyword).filter(MarketingKeyword.normalized == "norm guide").count() == 1
+        assert db.query(TenantKeyword).filter(TenantKeyword.normalized == "dental implant").count() == 1
+    finally:
+        db.close()
@@ -2,6 +2,7 @@ import time
 
 from app.main import app
 from app.models import Job, WorkflowRun
+from app.services.workflow_templates import compile_template
 
 
 def _login(client, email, password):
@@ -41,3 +42,74 @@ def test_workflow_run_creates_job_and_reaches_terminal_state(client):
         time.sleep(0.1)
 
     assert final_status in {"succeeded", "blocked"}
+
+
+def test_compiled_template_is_cached_per_version(client):
+    _login(client, "owner@test.local", "pass1234")
+
+    wf = client.post("/workflows?tenant_id=1", data={"name": "Cached Flow", "description": "x"}, follow_redirects=False)
+    workflow_id = int(wf.headers["location"].split("workflow_id=")[1])
+    client.post(
+        f"/workflows/{workflow_id}/steps?tenant_id=1",
+        data={"name": "Plan", "action_type": "plan", "agent_key": "ops", "gating_policy": "auto", "config_json": '{"channels": ["seo"]}'},
+        follow_redirects=False,
+    )
+
+    db = app.state.testing_sessionmaker()
+    try:
+        first = compile_template(db, workflow_id, 1)
+        assert first.version == 2
+        assert [s.name for s in first.steps] == ["Plan"]
+        assert first.steps[0].config["channels"] == ("seo",)
+        assert compile_template(db, workflow_id, 1) is first
+        assert compile_template(db, workflow_id, 2) is None
+    finally:
+        db.close()
+
+    client.post(
+        f"/workflows/{workflow_id}/steps?tenant_id=1",
+        data={"name": "Review", "action_type": "review", "agent_key": "ops", "gating_policy": "approve", "config_json": "{}"},
+        follow_redirects=False,
+    )
+
+    db = app.state.testing_sessionmaker()
+    try:
+        second = compile_template(db, workflow_id, 1)
+        assert second.version == 3
+        assert [s.name for s in second.steps] == ["Plan", "Review"]
+        assert second.gates == ("Review",)
+    finally:
+        db.close()
+
+
+def test_resubmitted_workflow_job_runs_once(client):
+    from app.models import RunStep
+    from app.services.workflow_engine import _execute_workflow_job, requeue_pending_jobs
+
+    _login(client, "owner@test.local", "pass1234")
+    wf = client.post("/workflows?tenant_id=1", data={"name": "Once", "description": "x"}, follow_redirects=False)
+    workflow_id = int(wf.headers["location"].split("workflow_id=")[1])
+    client.post(
+        f"/workflows/{workflow_id}/steps?tenant_id=1",
+        data={"name": "Auto Step", "action_type": "noop", "agent_key": "ops", "gating_policy": "auto", "config_json": "{}"},
+        follow_redirects=False,
+    )
+    client.post(f"/workflows/{workflow_id}/run?tenant_id=1", follow_redirects=False)
+
+    db = app.state.testing_sessionmaker()
+    try:
+        run = db.query(WorkflowRun).filter(WorkflowRun.workflow_id == workflow_id).one()
+        job = db.query(Job).filter(Job.kind == "workflow_run").order_by(Job.id.desc()).first()
+        steps = db.query(RunStep).filter(RunStep.run_id == run.id).count()
+    finally:
+        db.close()
+
+    # A second process resubmitting the same job id finds it already claimed.
+    _execute_workflow_job(job.id)
+    assert requeue_pending_jobs() == 0
+
+    db = app.state.testing_sessionmaker()
+    try:
+        assert db.query(RunStep).filter(RunStep.run_id == run.id).count() == steps == 1
+    finally:
+        db.close()
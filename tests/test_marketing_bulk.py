@@ -0,0 +1,108 @@
+import json
+import time
+
+from app.models import AuditLog, Event, Job, KeywordSignature, MarketingCampaign, MarketingKeyword
+from app.services.marketing_catalog import CATALOG
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _create_clients(client, names):
+    for name in names:
+        response = client.post(
+            "/clients?tenant_id=1",
+            data={"name": name, "contact_name": "Owner", "contact_email": "owner@example.test"},
+            follow_redirects=False,
+        )
+        assert response.status_code == 303
+    search = client.get("/search?tenant_id=1&q=Bulk")
+    return [item["id"] for item in search.json()["clients"] if item["name"] in names]
+
+
+def test_bulk_campaigns_insert_matrix_with_one_audit_record(client, monkeypatch):
+    import app.services.keyword_similarity as keyword_similarity
+
+    # Time the request alone; the keyword index job is run explicitly afterwards.
+    queued = []
+    monkeypatch.setattr(keyword_similarity.dispatcher, "submit", lambda tenant_id, job_id, handler: queued.append((job_id, handler)))
+    _login(client, "owner@test.local", "pass1234")
+    client_ids = _create_clients(client, ["Bulk Dental", "Bulk Roofing"])
+    assert len(client_ids) == 2
+    platforms = list(CATALOG.platforms)
+    objectives = ["Lead Generation", "Traffic"]
+    supported = [(p, o) for p in platforms for o in objectives if (p, o, None) in CATALOG.selections]
+
+    started = time.perf_counter()
+    response = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={
+            "client_ids": client_ids,
+            "platforms": platforms,
+            "objectives": objectives,
+            "budget": 100,
+            "days": 10,
+            "existing_keywords": ["emergency repair", " "],
+            "name_prefix": "Spring",
+        },
+    )
+    elapsed = time.perf_counter() - started
+    assert response.status_code == 201
+    body = response.json()
+    assert body["created"] == len(client_ids) * len(supported)
+    assert len(body["skipped"]) == len(platforms) * len(objectives) - len(supported)
+    assert elapsed < 1.0
+    assert len(queued) == 1
+    job_id, handler = queued[0]
+    handler(job_id)
+
+    db = client.app.state.testing_sessionmaker()
+    try:
+        campaigns = db.query(MarketingCampaign).filter(MarketingCampaign.id.in_(body["campaign_ids"])).all()
+        assert len(campaigns) == body["created"]
+        first = campaigns[0]
+        assert first.name.startswith("Spring · Bulk")
+        assert first.budget_cents == 10000
+        plan = json.loads(first.plan_json)
+        assert plan["daily_budget_cents"] == 1000
+        assert "seo_content" in plan
+        assert json.loads(first.existing_keywords_json) == ["emergency repair"]
+
+        keywords = db.query(MarketingKeyword).filter(MarketingKeyword.campaign_id == first.id).all()
+        assert {k.source for k in keywords if k.keyword == "emergency repair"} == {"user"}
+        assert db.query(MarketingKeyword).filter(MarketingKeyword.campaign_id.in_(body["campaign_ids"])).count() == body["keywords"]
+        assert db.get(Job, job_id).status == "succeeded"
+        assert db.query(KeywordSignature).filter(KeywordSignature.campaign_id.in_(body["campaign_ids"])).count() == body["keywords"]
+
+        audits = db.query(AuditLog).filter(AuditLog.action == "bulk_create_marketing_campaigns").all()
+        assert len(audits) == 1
+        assert json.loads(audits[0].after_json)["campaign_ids"] == body["campaign_ids"]
+        assert db.query(Event).filter(Event.type == "marketing_campaigns_bulk_created").count() == 1
+    finally:
+        db.close()
+
+
+def test_bulk_campaigns_validate_input(client):
+    _login(client, "owner@test.local", "pass1234")
+    client_ids = _create_clients(client, ["Bulk Bakery"])
+
+    unknown = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": [*client_ids, 999999], "platforms": ["Google Ads"], "objectives": ["Traffic"], "budget": 10},
+    )
+    assert unknown.status_code == 404
+
+    unsupported = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": client_ids, "platforms": ["Google Ads"], "objectives": ["Nope"], "budget": 10},
+    )
+    assert unsupported.status_code == 400
+
+    _login(client, "viewer@test.local", "pass1234")
+    forbidden = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": client_ids, "platforms": ["Google Ads"], "objectives": ["Traffic"], "budget": 10},
+    )
+    assert forbidden.status_code == 403
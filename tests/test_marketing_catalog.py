@@ -0,0 +1,57 @@
+import copy
+import dataclasses
+
+import pytest
+
+from app.services import marketing_catalog
+from app.services.marketing_catalog import CATALOG, CatalogError, compile_catalog
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_catalog_selections_are_frozen_and_indexed():
+    selection = CATALOG.select("Meta Ads", "Lead Generation", "Website Leads", "Advantage+ Shopping")
+    assert selection.sub_option == "Website Leads"
+    assert selection.template == "Advantage+ Shopping"
+    assert selection.profile.attribution_window == "7-day click / 1-day view"
+    assert CATALOG.select("Meta Ads", "Lead Generation").sub_option == "Instant Form Leads"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        selection.sub_option = "Other"
+    assert not hasattr(selection, "__dict__")
+    with pytest.raises(TypeError):
+        CATALOG.platforms["Meta Ads"] = None
+
+    for args, message in [
+        (("Fax Ads", "Traffic"), "Unsupported ad platform"),
+        (("Pinterest Ads", "Retargeting"), "Objective not supported by this platform"),
+        (("Pinterest Ads", "Traffic", "Reach"), "Sub-option not supported by this platform objective"),
+        (("Pinterest Ads", "Traffic", None, "Story Reach Blast"), "Template not supported by this platform"),
+    ]:
+        with pytest.raises(CatalogError, match=message):
+            CATALOG.select(*args)
+
+    fallback = CATALOG.resolve("Fax Ads", "Traffic")
+    assert (fallback.sub_option, fallback.template, fallback.profile.campaign_type) == ("Standard", "Standard Template", "Performance")
+
+
+def test_catalog_compilation_fails_fast_on_bad_config(monkeypatch):
+    broken = copy.deepcopy(marketing_catalog._PLATFORM_SOURCE)
+    broken["X Ads"]["sub_options"].pop("Traffic")
+    monkeypatch.setattr(marketing_catalog, "_PLATFORM_SOURCE", broken)
+    with pytest.raises(CatalogError, match="X Ads"):
+        compile_catalog()
+
+
+def test_plan_preview_rejects_unknown_sub_option(client):
+    _login(client, "owner@test.local", "pass1234")
+    client.post("/clients?tenant_id=1", data={"name": "Catalog Co"}, follow_redirects=False)
+    client_id = client.get("/search?tenant_id=1&q=Catalog").json()["clients"][0]["id"]
+    response = client.post(
+        "/marketing/plan?tenant_id=1",
+        data={"client_id": str(client_id), "platform": "X Ads", "objective": "Traffic", "sub_option": "Reach", "budget": "100", "days": "7"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Sub-option not supported by this platform objective"
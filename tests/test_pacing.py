@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from app.services.pacing import PLATFORM_BENCHMARKS, optimize_allocation, pacing_curve, portfolio_allocation, simulate_outcomes
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_pacing_curves_spend_the_exact_budget():
+    for shape in ("even", "front", "back"):
+        curve = pacing_curve(100001, 9, shape)
+        assert len(curve) == 9
+        assert int(curve.sum()) == 100001
+    front = pacing_curve(70000, 7, "front")
+    back = pacing_curve(70000, 7, "back")
+    assert front[0] > front[-1]
+    assert list(back) == list(front[::-1])
+    assert front[0] == 15000
+    assert set(pacing_curve(70000, 7)) == {10000}
+    with pytest.raises(ValueError):
+        pacing_curve(100, 3, "sideways")
+
+
+def test_monte_carlo_outcomes_are_seeded_and_ordered():
+    first = simulate_outcomes("Google Ads", 500000, scenarios=3000, seed=7)
+    assert first == simulate_outcomes("Google Ads", 500000, scenarios=3000, seed=7)
+    assert first["conversions_p10"] <= first["conversions_p50"] <= first["conversions_p90"]
+    assert first["cpa_cents_p10"] <= first["cpa_cents"] <= first["cpa_cents_p90"]
+
+
+def test_allocation_beats_current_split_and_runs_fast():
+    started = time.perf_counter()
+    result = optimize_allocation(1000000, list(PLATFORM_BENCHMARKS), scenarios=5000)
+    assert time.perf_counter() - started < 0.5
+    assert sum(row["budget_cents"] for row in result["allocation"]) == 1000000
+    assert result["scenarios"] == 5000
+
+    portfolio = portfolio_allocation([("Google Ads", 100000), ("Meta Ads", 400000), ("YouTube Ads", 300000)])
+    assert portfolio["budget_cents"] == 800000
+    assert sum(row["recommended_cents"] for row in portfolio["rows"]) == 800000
+    assert portfolio["recommended"]["expected_conversions"] >= portfolio["current"]["expected_conversions"]
+    assert portfolio_allocation([]) is None
+
+
+def test_allocation_endpoint_and_plan_outlook(client):
+    _login(client, "owner@test.local", "pass1234")
+    response = client.get("/marketing/allocation?tenant_id=1&budget=2500&platforms=Google Ads&platforms=Meta Ads&scenarios=1000")
+    assert response.status_code == 200
+    body = response.json()
+    assert [row["platform"] for row in body["allocation"]] == ["Google Ads", "Meta Ads"]
+    assert sum(row["budget_cents"] for row in body["allocation"]) == 250000
+
+    assert client.get("/marketing/allocation?tenant_id=1&budget=10&platforms=Fax Ads").status_code == 400
+
+    client.post(
+        "/clients?tenant_id=1",
+        data={"name": "Pacing Clinic", "contact_name": "Owner", "contact_email": "owner@example.test"},
+        follow_redirects=False,
+    )
+    search = client.get("/search?tenant_id=1&q=Pacing Clinic")
+    client_id = next(item["id"] for item in search.json()["clients"] if item["name"] == "Pacing Clinic")
+    preview = client.post(
+        "/marketing/plan?tenant_id=1",
+        data={"client_id": str(client_id), "platform": "Meta Ads", "objective": "Traffic", "budget": "70", "days": "7", "pacing": "front"},
+    )
+    assert preview.status_code == 200
+    assert "Pacing (front)" in preview.text
+    assert "$15.00 on day 1" in preview.text
+    assert "Expected CPA" in preview.text
+
+    saved = client.post(
+        "/marketing/campaigns/bulk?tenant_id=1",
+        json={"client_ids": [client_id], "platforms": ["Google Ads", "Meta Ads"], "objectives": ["Traffic"], "budget": 500},
+    )
+    assert saved.status_code == 201
+    page = client.get("/marketing?tenant_id=1")
+    assert "Budget Allocation" in page.text
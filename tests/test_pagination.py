@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.models import AuditLog, Client, Deal, DealStage, Note
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_keyset_api_walks_pages_without_gaps_or_duplicates(client):
+    _login(client, "owner@test.local", "pass1234")
+    base = datetime(2026, 1, 1)
+    db = app.state.testing_sessionmaker()
+    try:
+        # Pairs share a timestamp so the id tie-breaker is exercised.
+        for i in range(30):
+            db.add(AuditLog(tenant_id=1, entity_type="deal", entity_id=i, action="update" if i % 3 else "create", created_at=base + timedelta(minutes=i // 2)))
+        db.add(AuditLog(tenant_id=2, entity_type="deal", entity_id=99, action="update", created_at=base))
+        db.commit()
+    finally:
+        db.close()
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/audit?tenant_id=1&limit=7" + (f"&cursor={cursor}" if cursor else "")
+        payload = client.get(url).json()
+        seen.extend(item["entity_id"] for item in payload["items"])
+        cursor = payload["next_cursor"]
+        if not cursor:
+            break
+    assert sorted(seen) == list(range(30))
+    assert len(seen) == len(set(seen))
+
+    creates = client.get("/api/audit?tenant_id=1&action=create&limit=200").json()["items"]
+    assert len(creates) == 10
+    assert client.get("/api/audit?tenant_id=1&password=x").status_code == 400
+    assert client.get("/api/audit?tenant_id=1&cursor=garbage").status_code == 400
+    assert client.get("/api/users?tenant_id=1").status_code == 404
+
+
+def test_audit_and_notes_pages_load_lazily(client):
+    _login(client, "owner@test.local", "pass1234")
+    db = app.state.testing_sessionmaker()
+    try:
+        for i in range(60):
+            db.add(AuditLog(tenant_id=1, entity_type="task", entity_id=i, action="update", created_at=datetime(2026, 1, 1) + timedelta(minutes=i)))
+        for i in range(25):
+            db.add(Note(tenant_id=1, created_by_user_id=1, title=f"Note {i}", updated_at=datetime(2026, 1, 1) + timedelta(minutes=i)))
+        db.commit()
+    finally:
+        db.close()
+
+    page = client.get("/reports/audit?tenant_id=1")
+    assert page.text.count("task#") == 50
+    assert "data-load-more" in page.text
+    cursor = page.text.split('data-cursor="')[1].split('"')[0]
+    more = client.get(f"/reports/audit/rows?tenant_id=1&cursor={cursor}")
+    assert more.text.count("task#") == 10
+    assert "x-next-cursor" not in more.headers
+
+    notes = client.get("/notes?tenant_id=1")
+    assert notes.text.count('class="note-item"') == 20
+    cursor = notes.text.split('data-cursor="')[1].split('"')[0]
+    rest = client.get(f"/notes/items?tenant_id=1&cursor={cursor}")
+    assert rest.text.count('class="note-item"') == 5
+    assert "Note 0" in rest.text
+
+
+def test_clients_and_crm_pages_load_lazily(client):
+    _login(client, "owner@test.local", "pass1234")
+    db = app.state.testing_sessionmaker()
+    try:
+        stage = DealStage(tenant_id=1, name="Lead", position=1)
+        db.add(stage)
+        for i in range(30):
+            db.add(Client(tenant_id=1, name=f"Lazy {i:02d}", created_at=datetime(2026, 1, 1) + timedelta(minutes=i)))
+        db.flush()
+        acme = db.query(Client).filter(Client.tenant_id == 1).first()
+        for i in range(27):
+            db.add(Deal(tenant_id=1, client_id=acme.id, stage_id=stage.id, title=f"Deal {i:02d}", created_at=datetime(2026, 1, 1) + timedelta(minutes=i)))
+        db.commit()
+        stage_id = stage.id
+    finally:
+        db.close()
+
+    clients = client.get("/clients?tenant_id=1")
+    assert clients.text.count('class="client-row"') == 25
+    assert "Lazy 29" in clients.text and "Lazy 04" not in clients.text
+    cursor = clients.text.split('data-cursor="')[1].split('"')[0]
+    rest = client.get(f"/clients/rows?tenant_id=1&cursor={cursor}")
+    assert rest.text.count('class="client-row"') == 5
+    assert "Lazy 00" in rest.text
+    assert "x-next-cursor" not in rest.headers
+
+    crm = client.get("/crm?tenant_id=1")
+    assert crm.text.count('<div class="task-card">') == 25
+    cursor = crm.text.split(f'data-url="/crm/deals/lane/{stage_id}?tenant_id=1" data-cursor="')[1].split('"')[0]
+    lane = client.get(f"/crm/deals/lane/{stage_id}?tenant_id=1&cursor={cursor}")
+    assert lane.text.count('<div class="task-card">') == 2
+    assert "Deal 00" in lane.text
+    assert client.get(f"/crm/deals/lane/{stage_id}?tenant_id=1&cursor=garbage").status_code == 400
+    assert client.get(f"/crm/deals/lane/999?tenant_id=1&cursor={cursor}").status_code == 404
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from app.services.singleflight import SingleFlight
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_weekly_export_is_hash_keyed_and_conditional(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORT_ROOT", str(tmp_path))
+    _login(client, "owner@test.local", "pass1234")
+
+    first = client.get("/reports/weekly?tenant_id=1&export=1&fmt=csv")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    artifacts = sorted(p.name for p in (tmp_path / "tenant_1").iterdir())
+    assert len(artifacts) == 2
+    assert all(etag.strip('"') in name for name in artifacts)
+    mtimes = [p.stat().st_mtime_ns for p in (tmp_path / "tenant_1").iterdir()]
+
+    again = client.get("/reports/weekly?tenant_id=1&export=1&fmt=csv")
+    assert again.headers["etag"] == etag
+    assert [p.stat().st_mtime_ns for p in (tmp_path / "tenant_1").iterdir()] == mtimes
+
+    cached = client.get("/reports/weekly?tenant_id=1&export=1&fmt=csv", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_singleflight_coalesces_concurrent_builds():
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def build():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return "artifact"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", build)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", build))) for _ in range(4)]
+    for t in followers:
+        t.start()
+    for t in [leader, *followers]:
+        t.join()
+
+    assert results == ["artifact"] * 5
+    assert len(calls) == 1
+    assert flight.shared == 4
+
+
+def test_superseded_artifacts_survive_until_the_grace_period(tmp_path, monkeypatch):
+    from app.services.intelligence import prune_report_artifacts, write_weekly_artifacts
+
+    monkeypatch.setenv("REPORT_ROOT", str(tmp_path))
+    snapshot = {"report_date": "2026-02-14", "mrr_total_cents": 100, "pipeline_14d_cents": 0, "blocked_items": 0, "wins": 0, "top_risks": []}
+    old = write_weekly_artifacts(1, snapshot)
+    new = write_weekly_artifacts(1, {**snapshot, "wins": 3})
+    # A download of the old digest may still be in flight.
+    assert all(p.exists() for p in old + new)
+
+    assert prune_report_artifacts() == 0
+    assert prune_report_artifacts(now=time.time() + 10, grace_seconds=5) == 2
+    assert not any(p.exists() for p in old) and all(p.exists() for p in new)
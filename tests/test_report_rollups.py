@@ -0,0 +1,148 @@
+from datetime import date, datetime, timedelta
+
+from app.main import app
+from app.models import Client, ClientFinancial, Tenant, TenantDailyRollup, WorkflowRun
+from app.services.intelligence import emit_event, weekly_snapshot, write_weekly_artifacts
+from app.services.rollups import ROLLUP_BACKFILL_DAYS, period_snapshot, refresh_day, refresh_rollups, timeseries
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_reports_are_served_from_rollups_and_marked_dirty_by_writes(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORT_ROOT", str(tmp_path))
+    _login(client, "owner@test.local", "pass1234")
+    db = app.state.testing_sessionmaker()
+    try:
+        acme = Client(tenant_id=1, name="Acme")
+        db.add(acme)
+        db.flush()
+        db.add(ClientFinancial(tenant_id=1, client_id=acme.id, mrr_cents=120000))
+        db.add(WorkflowRun(tenant_id=1, workflow_id=1, status="succeeded", triggered_by_user_id=1, created_at=datetime.utcnow() - timedelta(days=3)))
+        db.add(WorkflowRun(tenant_id=1, workflow_id=1, status="succeeded", triggered_by_user_id=1, created_at=datetime.utcnow() - timedelta(days=40)))
+        db.commit()
+    finally:
+        db.close()
+
+    page = client.get("/reports/weekly?tenant_id=1")
+    assert page.status_code == 200
+    assert "$1200.00" in page.text
+
+    db = app.state.testing_sessionmaker()
+    try:
+        # Report requests only read; the nightly job is the only rollup writer.
+        assert db.query(TenantDailyRollup).count() == 0
+        live = period_snapshot(db, 1, date.today() - timedelta(days=7), date.today())
+        assert live["wins"] == 1
+
+        refresh_rollups(db)
+        rows = db.query(TenantDailyRollup).filter(TenantDailyRollup.tenant_id == 1).all()
+        assert {r.day for r in rows} == {date.today() - timedelta(days=1), date.today()}
+        assert not any(r.dirty for r in rows)
+        assert period_snapshot(db, 1, date.today() - timedelta(days=7), date.today()) == live
+
+        db.query(ClientFinancial).filter(ClientFinancial.tenant_id == 1).one().mrr_cents = 150000
+        emit_event(db, tenant_id=1, event_type="risk", entity_type="client", entity_id=1, severity="high", title="Churn risk", detail={})
+        db.commit()
+        today = db.query(TenantDailyRollup).filter(TenantDailyRollup.tenant_id == 1, TenantDailyRollup.day == date.today()).one()
+        assert today.dirty is True
+    finally:
+        db.close()
+
+    page = client.get("/reports/weekly?tenant_id=1")
+    assert "$1500.00" in page.text
+    assert "Churn risk" in page.text
+
+    quarter = client.get("/reports/weekly?tenant_id=1&period=quarter")
+    assert quarter.status_code == 200
+    assert client.get("/reports/weekly?tenant_id=1&period=decade").status_code == 400
+
+
+def test_rollups_do_not_backfill_mrr_from_current_financials(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORT_ROOT", str(tmp_path))
+    db = app.state.testing_sessionmaker()
+    try:
+        acme = Client(tenant_id=1, name="Acme")
+        db.add(acme)
+        db.flush()
+        db.add(ClientFinancial(tenant_id=1, client_id=acme.id, mrr_cents=120000))
+        db.commit()
+
+        old = refresh_day(db, 1, date.today() - timedelta(days=40))
+        current = refresh_day(db, 1, date.today())
+        db.commit()
+        assert old.mrr_total_cents is None
+        assert current.mrr_total_cents == 120000
+
+        # Once the day is in the past, recomputing it keeps the MRR captured while it was live.
+        db.query(ClientFinancial).filter(ClientFinancial.tenant_id == 1).one().mrr_cents = 90000
+        db.commit()
+        refresh_day(db, 1, current.day, current, today=date.today() + timedelta(days=30))
+        assert current.mrr_total_cents == 120000
+
+        # Reports for the old day show the MRR as unknown rather than $0.00.
+        past = date.today() - timedelta(days=40)
+        assert period_snapshot(db, 1, past - timedelta(days=6), past)["mrr_total_cents"] is None
+        html_path, csv_path = write_weekly_artifacts(1, weekly_snapshot(db, 1, past))
+        assert "MRR Total: n/a" in html_path.read_text()
+        assert "mrr_total_cents,n/a" in csv_path.read_text()
+    finally:
+        db.close()
+
+
+def test_timeseries_downsamples_rollups_with_derived_metrics(client):
+    _login(client, "owner@test.local", "pass1234")
+    db = app.state.testing_sessionmaker()
+    try:
+        day = date(2026, 1, 1)
+        while day <= date(2026, 3, 31):
+            db.add(TenantDailyRollup(tenant_id=1, day=day, mrr_total_cents=1000 * day.month, wins=1 if day.day == 1 else 0))
+            day += timedelta(days=1)
+        db.commit()
+    finally:
+        db.close()
+
+    db = app.state.testing_sessionmaker()
+    try:
+        series = timeseries(db, 1, grain="month", periods=3, end=date(2026, 3, 31), window=2)
+    finally:
+        db.close()
+    assert series["periods"] == ["2026-01-01", "2026-02-01", "2026-03-01"]
+    mrr = series["metrics"]["mrr_total_cents"]
+    assert mrr["values"] == [1000.0, 2000.0, 3000.0]
+    assert mrr["delta"] == [None, 1000.0, 1000.0]
+    assert mrr["pct_change"] == [None, 100.0, 50.0]
+    assert mrr["moving_avg"] == [None, 1500.0, 2500.0]
+    assert series["metrics"]["wins"]["values"] == [1.0, 1.0, 1.0]
+
+    weekly = client.get("/reports/timeseries?tenant_id=1&grain=week&periods=52").json()
+    assert len(weekly["periods"]) == 52
+    assert len(weekly["metrics"]["wins"]["values"]) == 52
+    assert client.get("/reports/timeseries?tenant_id=1&grain=day").status_code == 400
+    assert client.get("/reports/timeseries?tenant_id=1&periods=260").status_code == 422
+
+    db = app.state.testing_sessionmaker()
+    try:
+        assert db.query(TenantDailyRollup).filter(TenantDailyRollup.tenant_id == 1).count() == 90
+    finally:
+        db.close()
+
+
+def test_nightly_refresh_fills_gaps_within_the_backfill_horizon(client):
+    db = app.state.testing_sessionmaker()
+    try:
+        db.get(Tenant, 1).created_at = datetime.utcnow() - timedelta(days=2000)
+        db.commit()
+        refresh_rollups(db)
+        days = [d for (d,) in db.query(TenantDailyRollup.day).filter(TenantDailyRollup.tenant_id == 1).order_by(TenantDailyRollup.day)]
+        assert days[0] == date.today() - timedelta(days=ROLLUP_BACKFILL_DAYS)
+        assert days[-1] == date.today()
+        assert len(days) == ROLLUP_BACKFILL_DAYS + 1
+        # Newer tenants are only filled back to the day they were created.
+        assert db.query(TenantDailyRollup).filter(TenantDailyRollup.tenant_id == 2).count() == 2
+
+        assert refresh_rollups(db) == 0
+    finally:
+        db.close()
@@ -0,0 +1,66 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.models import AuditLog, Event, RetentionPolicy
+from app.services.retention import archive_and_purge, set_policy
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_archive_and_purge_writes_monthly_jsonl_and_deletes(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCHIVE_ROOT", str(tmp_path))
+    now = datetime(2026, 10, 19, 12, 0)
+    db = app.state.testing_sessionmaker()
+    try:
+        for days in (400, 200, 10):
+            for tenant_id in (1, 2):
+                db.add(Event(tenant_id=tenant_id, type="t", entity_type="x", entity_id=1, severity="info", title=f"{days}d", created_at=now - timedelta(days=days)))
+        set_policy(db, 1, "events", 365, True)
+        set_policy(db, 1, "audit_log", 30, False)
+        db.add(AuditLog(tenant_id=1, entity_type="x", entity_id=1, action="update", created_at=now - timedelta(days=60)))
+        db.commit()
+
+        purged = archive_and_purge(db, 1, now=now, batch_size=1)
+        assert purged["events"] == 1
+        assert purged["audit_log"] == 1
+
+        remaining = {title for (title,) in db.query(Event.title).filter(Event.tenant_id == 1).all()}
+        assert remaining == {"200d", "10d"}
+        assert db.query(Event).filter(Event.tenant_id == 2).count() == 3
+        assert db.query(AuditLog).filter(AuditLog.tenant_id == 1, AuditLog.action == "update").count() == 0
+    finally:
+        db.close()
+
+    archived = list((tmp_path / "tenant_1" / "events").glob("*.jsonl.gz"))
+    assert [p.name for p in archived] == [f"{(now - timedelta(days=400)):%Y-%m}.jsonl.gz"]
+    with gzip.open(archived[0], "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert rows[0]["title"] == "400d"
+    assert not (tmp_path / "tenant_1" / "audit_log").exists()
+
+
+def test_retention_policy_endpoint_requires_owner(client):
+    _login(client, "owner@test.local", "pass1234")
+    saved = client.post("/reports/retention?tenant_id=1", data={"table_name": "run_logs", "retain_days": "45", "archive": "0"}, follow_redirects=False)
+    assert saved.status_code == 303
+    assert client.post("/reports/retention?tenant_id=1", data={"table_name": "users", "retain_days": "45"}).status_code == 400
+
+    policies = {p["table_name"]: p for p in client.get("/reports/retention?tenant_id=1").json()["policies"]}
+    assert policies["run_logs"]["retain_days"] == 45
+    assert policies["run_logs"]["archive"] is False
+    assert policies["events"]["retain_days"] == 180
+    assert "History Retention" in client.get("/reports/audit?tenant_id=1").text
+
+    # Owner is only an admin on tenant 2.
+    assert client.post("/reports/retention?tenant_id=2", data={"table_name": "events", "retain_days": "5"}).status_code == 403
+
+    db = app.state.testing_sessionmaker()
+    try:
+        assert db.query(RetentionPolicy).filter(RetentionPolicy.tenant_id == 1).count() == 1
+    finally:
+        db.close()
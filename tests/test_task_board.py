@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.models import Task
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _seed_tasks():
+    base = datetime(2026, 1, 1)
+    db = app.state.testing_sessionmaker()
+    try:
+        for i in range(30):
+            db.add(Task(tenant_id=1, created_by_user_id=1, title=f"Todo {i}", status="todo", created_at=base + timedelta(minutes=i)))
+        for i in range(3):
+            db.add(Task(tenant_id=1, created_by_user_id=1, title=f"Old done {i}", status="done", completed_at=datetime.utcnow() - timedelta(days=40), created_at=base))
+        db.add(Task(tenant_id=1, created_by_user_id=1, title="Fresh done", status="done", completed_at=datetime.utcnow(), created_at=base))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_task_board_lanes_are_paged_with_server_counts(client):
+    _login(client, "owner@test.local", "pass1234")
+    _seed_tasks()
+
+    page = client.get("/tasks?tenant_id=1")
+    assert page.status_code == 200
+    assert 'data-lane-count="todo">30<' in page.text
+    assert "Todo 29" in page.text
+    assert "Todo 0<" not in page.text
+    assert "/tasks/lane/todo?tenant_id=1" in page.text
+
+    cursor = page.text.split('data-url="/tasks/lane/todo?tenant_id=1" data-cursor="')[1].split('"')[0]
+    more = client.get(f"/tasks/lane/todo?tenant_id=1&cursor={cursor}")
+    assert more.status_code == 200
+    assert "Todo 0<" in more.text
+    assert "X-Next-Cursor" not in more.headers
+    assert client.get("/tasks/lane/todo?tenant_id=1&cursor=garbage").status_code == 400
+    assert client.get("/tasks/lane/blocked?tenant_id=1").status_code == 404
+
+
+def test_archive_old_done_tasks_and_json_moves(client):
+    _login(client, "owner@test.local", "pass1234")
+    _seed_tasks()
+
+    response = client.post("/tasks/archive?tenant_id=1", data={"older_than_days": "14"}, follow_redirects=False)
+    assert response.status_code == 303
+    page = client.get("/tasks?tenant_id=1")
+    assert 'data-lane-count="done">1<' in page.text
+    assert "Old done" not in page.text
+    archived = client.get("/tasks/lane/archived?tenant_id=1")
+    assert archived.text.count("Old done") == 3
+
+    db = app.state.testing_sessionmaker()
+    try:
+        task_id = db.query(Task.id).filter(Task.title == "Old done 0").scalar()
+    finally:
+        db.close()
+    moved = client.post(f"/tasks/{task_id}/status?tenant_id=1", data={"status": "in_progress"}, headers={"Accept": "application/json"})
+    assert moved.status_code == 200
+    payload = moved.json()
+    assert payload["status"] == "in_progress"
+    assert payload["counts"]["in_progress"] == 1
+    assert payload["counts"]["archived"] == 2
+
+    redirect = client.post(f"/tasks/{task_id}/status?tenant_id=1", data={"status": "todo"}, follow_redirects=False)
+    assert redirect.status_code == 303
+
+    _login(client, "viewer@test.local", "pass1234")
+    assert client.post("/tasks/archive?tenant_id=1", data={"older_than_days": "0"}, follow_redirects=False).status_code == 403
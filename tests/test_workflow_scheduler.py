@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.main import app
+from app.models import WorkflowRun, WorkflowSchedule
+from app.services.scheduler import CronError, WorkflowScheduler, next_fire, parse_cron
+
+
+def _login(client, email, password):
+    response = client.post("/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+
+
+def _create_workflow(client, gating_policy="auto"):
+    wf = client.post("/workflows?tenant_id=1", data={"name": "Weekly report", "description": "x"}, follow_redirects=False)
+    workflow_id = int(wf.headers["location"].split("workflow_id=")[1])
+    client.post(
+        f"/workflows/{workflow_id}/steps?tenant_id=1",
+        data={"name": "Weekly report", "action_type": "report", "agent_key": "reporting_ops", "gating_policy": gating_policy, "config_json": "{}"},
+        follow_redirects=False,
+    )
+    return workflow_id
+
+
+def test_cron_next_fire_respects_timezone_and_weekday():
+    cron = parse_cron("0 8 * * mon")
+    after = datetime(2026, 10, 19, 12, 0)  # Monday, 12:00 UTC
+    assert next_fire(cron, after, "UTC") == datetime(2026, 10, 26, 8, 0)
+    assert next_fire(cron, datetime(2026, 10, 19, 6, 0), "America/New_York") == datetime(2026, 10, 19, 12, 0)
+    assert next_fire(parse_cron("*/15 * * * *"), datetime(2026, 1, 1, 0, 7), "UTC") == datetime(2026, 1, 1, 0, 15)
+    with pytest.raises(CronError):
+        parse_cron("61 * * * *")
+
+
+def test_scheduler_tick_enqueues_due_runs_and_prevents_overlap(client):
+    _login(client, "owner@test.local", "pass1234")
+    workflow_id = _create_workflow(client, gating_policy="approve")
+
+    created = client.post(
+        f"/workflows/{workflow_id}/schedules?tenant_id=1",
+        data={"cron_expr": "0 8 * * 1", "timezone": "UTC", "catchup_policy": "catch_up"},
+        follow_redirects=False,
+    )
+    assert created.status_code == 303
+    assert client.post(f"/workflows/{workflow_id}/schedules?tenant_id=1", data={"cron_expr": "bogus"}).status_code == 400
+
+    db = app.state.testing_sessionmaker()
+    try:
+        schedule = db.query(WorkflowSchedule).filter(WorkflowSchedule.workflow_id == workflow_id).one()
+        schedule.next_run_at = datetime.utcnow() - timedelta(days=21)
+        db.commit()
+        schedule_id = schedule.id
+    finally:
+        db.close()
+
+    sched = WorkflowScheduler()
+    # Approval-gated runs stay blocked, so catch-up stops after the first slot instead of stacking runs.
+    assert sched.tick() == 1
+    assert sched.tick() == 0
+
+    other = WorkflowScheduler()
+    assert other.tick() == 0
+    assert other.is_leader is False
+
+    db = app.state.testing_sessionmaker()
+    try:
+        runs = db.query(WorkflowRun).filter(WorkflowRun.workflow_id == workflow_id).all()
+        assert len(runs) == 1
+        assert runs[0].status == "blocked"
+        schedule = db.query(WorkflowSchedule).filter(WorkflowSchedule.id == schedule_id).one()
+        assert schedule.last_run_id == runs[0].id
+        assert schedule.next_run_at > datetime.utcnow()
+    finally:
+        db.close()
+
+
+def test_leader_picks_up_schedules_changed_elsewhere_on_the_next_tick(client):
+    _login(client, "owner@test.local", "pass1234")
+    workflow_id = _create_workflow(client)
+
+    leader = WorkflowScheduler()
+    assert leader.tick() == 0 and leader.is_leader
+
+    follower = WorkflowScheduler()
+    # A route served by a non-leader process leaves its own (unused) heap alone.
+    client.post(f"/workflows/{workflow_id}/schedules?tenant_id=1", data={"cron_expr": "*/5 * * * *", "timezone": "UTC"}, follow_redirects=False)
+    follower.notify_changed(WorkflowSchedule(id=999, enabled=True, next_run_at=datetime.utcnow(), jitter_seconds=0))
+    assert follower.pending() == 0
+
+    db = app.state.testing_sessionmaker()
+    try:
+        schedule = db.query(WorkflowSchedule).filter(WorkflowSchedule.workflow_id == workflow_id).one()
+        schedule.next_run_at = datetime.utcnow() - timedelta(minutes=1)
+        db.commit()
+    finally:
+        db.close()
+
+    # Well inside refresh_seconds, so only the updated_at poll can have seen the new schedule.
+    assert leader.tick() == 1
+    assert leader.pending() == 1